@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dashboard Aggregates
+Builds small precomputed summary files for the dashboard from the score data
+produced by the merge step, so common views do not need every .sexyDuck file.
+
+Each aggregate is written as <name>.<content hash>.json under
+docs/asset/data/_aggregates/ and listed in _aggregates/index.json, so the
+hashed files can be cached indefinitely by the browser. The files listed by
+the previous index are kept for one more run, so a page that loaded the old
+index can still fetch them.
+
+The landing page and the dashboard overview read score_summary and
+grade_distribution instead of fetching every .sexyDuck file.
+"""
+
+import hashlib
+import time
+from datetime import datetime
+from pathlib import Path
+
+# docs/ref is put on sys.path by merge_data_received.py, which imports this module
+import json_io
+from scoring import write_json_atomic
+
+AGGREGATES_DIRNAME = "_aggregates"
+AGGREGATES_INDEX = "index.json"
+
+# Number of worst models listed per metric
+TOP_N_WORST = 10
+
+# Budgets reported in the merge summary (exceeding them only warns)
+AGGREGATE_SIZE_BUDGET_BYTES = 256 * 1024
+AGGREGATE_TIME_BUDGET_SECONDS = 2.0
+
+GRADES = ['A', 'B', 'C', 'D', 'F']
+
+# Per-model totals summed into score_summary (metrics cache SUMMARY_FIELDS plus file size)
+TOTAL_FIELDS = ['total_elements', 'total_views', 'total_sheets', 'warning_count', 'file_size_bytes']
+
+
+def content_hash(payload_bytes):
+    """Return a short content hash used in aggregate filenames."""
+    return hashlib.sha256(payload_bytes).hexdigest()[:12]
+
+
+def _empty_grade_counts():
+    return {grade: 0 for grade in GRADES}
+
+
+def build_score_summary(scored_models, model_totals=None):
+    """
+    Per hub/project/date score summaries.
+
+    Args:
+        scored_models: List of (hub, project, date, model, score_data) tuples
+        model_totals: Optional dict (hub, project, date, model) -> {TOTAL_FIELDS: value}
+
+    Returns:
+        list: One entry per hub/project/date with count, average/min/max score, grade counts
+              and summed totals
+    """
+    model_totals = model_totals or {}
+    groups = {}
+    group_totals = {}
+    for hub, project, date, model, score_data in scored_models:
+        groups.setdefault((hub, project, date), []).append(score_data)
+        totals = group_totals.setdefault((hub, project, date), {field: 0 for field in TOTAL_FIELDS})
+        for field, value in model_totals.get((hub, project, date, model), {}).items():
+            totals[field] += value or 0
+
+    summary = []
+    for (hub, project, date), scores in sorted(groups.items()):
+        totals = [s['total_score'] for s in scores]
+        grades = _empty_grade_counts()
+        for s in scores:
+            grades[s['grade']] = grades.get(s['grade'], 0) + 1
+        summary.append({
+            'hub': hub,
+            'project': project,
+            'date': date,
+            'models': len(scores),
+            'avg_score': round(sum(totals) / len(totals), 2),
+            'min_score': min(totals),
+            'max_score': max(totals),
+            'grades': grades,
+            'totals': group_totals[(hub, project, date)]
+        })
+    return summary
+
+
+def build_grade_distribution(scored_models):
+    """
+    Grade distribution overall, per hub and per project (latest snapshot of each model).
+
+    Args:
+        scored_models: List of (hub, project, date, model, score_data) tuples
+
+    Returns:
+        dict: Grade counts keyed by scope
+    """
+    latest = latest_snapshots(scored_models)
+
+    overall = _empty_grade_counts()
+    hubs = {}
+    projects = {}
+    for hub, project, date, model, score_data in latest:
+        grade = score_data['grade']
+        overall[grade] = overall.get(grade, 0) + 1
+        hub_counts = hubs.setdefault(hub, _empty_grade_counts())
+        hub_counts[grade] = hub_counts.get(grade, 0) + 1
+        project_counts = projects.setdefault(hub, {}).setdefault(project, _empty_grade_counts())
+        project_counts[grade] = project_counts.get(grade, 0) + 1
+
+    return {
+        'total_models': len(latest),
+        'overall': overall,
+        'hubs': hubs,
+        'projects': projects
+    }
+
+
+def build_worst_metrics(scored_models, top_n=TOP_N_WORST):
+    """
+    Metrics ranked by points lost, each with its top-N worst models (latest snapshot of each model).
+
+    Args:
+        scored_models: List of (hub, project, date, model, score_data) tuples
+        top_n: Number of worst models to keep per metric
+
+    Returns:
+        list: One entry per metric, sorted by total points lost (worst first)
+    """
+    latest = latest_snapshots(scored_models)
+
+    by_metric = {}
+    for hub, project, date, model, score_data in latest:
+        for metric in score_data.get('metrics', []):
+            entry = by_metric.setdefault(metric['metric'], {
+                'metric': metric['metric'],
+                'weight': metric['weight'],
+                'points_lost': 0.0,
+                'models': []
+            })
+            entry['points_lost'] += metric['weight'] - metric['contribution']
+            entry['models'].append({
+                'hub': hub,
+                'project': project,
+                'date': date,
+                'model': model,
+                'actual': metric['actual'],
+                'contribution': metric['contribution'],
+                'grade': metric['grade']
+            })
+
+    worst = []
+    for entry in by_metric.values():
+        models = entry.pop('models')
+        models.sort(key=lambda m: (m['contribution'], m['model']))
+        entry['points_lost'] = round(entry['points_lost'], 2)
+        entry['avg_points_lost'] = round(entry['points_lost'] / len(models), 2) if models else 0
+        entry['worst_models'] = models[:top_n]
+        worst.append(entry)
+
+    worst.sort(key=lambda e: (-e['points_lost'], e['metric']))
+    return worst
+
+
+def latest_snapshots(scored_models):
+    """Keep only the most recent date for each (hub, project, model)."""
+    latest = {}
+    for row in scored_models:
+        hub, project, date, model, _ = row
+        key = (hub, project, model)
+        if key not in latest or date > latest[key][2]:
+            latest[key] = row
+    return [latest[key] for key in sorted(latest)]
+
+
+def published_aggregates(aggregates_dir):
+    """
+    Return the hashed filenames listed by the aggregates index currently on disk.
+
+    Args:
+        aggregates_dir: docs/asset/data/_aggregates directory
+
+    Returns:
+        set: Filenames of the previous generation (empty if there is no readable index)
+    """
+    try:
+        index = json_io.load(Path(aggregates_dir) / AGGREGATES_INDEX)
+    except (OSError, ValueError):
+        return set()
+    return {Path(info['path']).name for info in index.get('files', {}).values() if info.get('path')}
+
+
+def write_aggregates(scored_models, destination_dir, model_totals=None):
+    """
+    Build all aggregate views and write them as content-hashed files.
+    Hashed files from the previous index are kept for one run; older ones are removed.
+
+    Args:
+        scored_models: List of (hub, project, date, model, score_data) tuples
+        destination_dir: docs/asset/data directory
+        model_totals: Optional dict (hub, project, date, model) -> {TOTAL_FIELDS: value}
+
+    Returns:
+        dict: Report with per-file sizes, total bytes, build seconds and budget flags
+    """
+    start = time.perf_counter()
+    aggregates_dir = Path(destination_dir) / AGGREGATES_DIRNAME
+    aggregates_dir.mkdir(parents=True, exist_ok=True)
+    previous = published_aggregates(aggregates_dir)
+
+    views = {
+        'score_summary': build_score_summary(scored_models, model_totals),
+        'grade_distribution': build_grade_distribution(scored_models),
+        'worst_metrics': build_worst_metrics(scored_models)
+    }
+
+    index = {
+        'version': '1.0',
+        'generated_at': datetime.now().isoformat(),
+        'total_models': len(scored_models),
+        'files': {}
+    }
+    written = set()
+    total_bytes = 0
+
+    for name, data in views.items():
+        payload_bytes = json_io.dumpb(data)
+        filename = f"{name}.{content_hash(payload_bytes)}.json"
+        file_path = aggregates_dir / filename
+        if not file_path.exists():
+            write_json_atomic(file_path, data)
+        written.add(filename)
+        total_bytes += len(payload_bytes)
+        index['files'][name] = {
+            'path': f"{AGGREGATES_DIRNAME}/{filename}",
+            'size': len(payload_bytes)
+        }
+
+    # The index is replaced atomically after its files exist
+    write_json_atomic(aggregates_dir / AGGREGATES_INDEX, index, pretty=True)
+
+    # Drop hashed files listed by neither the new nor the previous index
+    for old_file in aggregates_dir.glob("*.json"):
+        if old_file.name != AGGREGATES_INDEX and old_file.name not in written and old_file.name not in previous:
+            old_file.unlink()
+
+    elapsed = time.perf_counter() - start
+    return {
+        'files': {name: info['size'] for name, info in index['files'].items()},
+        'total_bytes': total_bytes,
+        'seconds': elapsed,
+        'size_budget_bytes': AGGREGATE_SIZE_BUDGET_BYTES,
+        'time_budget_seconds': AGGREGATE_TIME_BUDGET_SECONDS,
+        'over_size_budget': total_bytes > AGGREGATE_SIZE_BUDGET_BYTES,
+        'over_time_budget': elapsed > AGGREGATE_TIME_BUDGET_SECONDS
+    }
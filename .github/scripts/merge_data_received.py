@@ -8,8 +8,11 @@ validates and copies JSON files to docs/asset/data, then cleans up.
 
 import os
 import json
+import errno
+import hashlib
 import shutil
 import sys
+import time
 from pathlib import Path
 
 # Set UTF-8 encoding for console output
@@ -20,7 +23,20 @@ if sys.platform == 'win32':
 
 # Import scoring module
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "docs" / "ref"))
-from scoring import score_file
+from scoring import (calculate_score, score_metrics, cohort_percentiles, validate_sexy_duck_data, profile_for_hub,
+                     sexy_duck_rejection, load_score_index, save_scores, write_json_atomic, SCORE_INDEX_FILENAME)
+from metrics_cache import MetricsCache, METRICS_CACHE_FILENAME, SUMMARY_FIELDS
+import json_io
+from history_store import HistoryStore, HISTORY_PATH, rebuild_from_tree
+from regressions import detect_regressions, update_regressions_file, latest_snapshot_keys, REGRESSIONS_FILENAME
+from dashboard_aggregates import write_aggregates
+
+
+MANIFEST_V4_FILENAME = 'manifest.v4.json'
+MANIFEST_SHARD_DIRNAME = '_manifest'
+MERGE_JOURNAL_FILENAME = 'merge_journal.jsonl'
+# Kept out of _data_received (committed by the workflow) in a gitignored folder of the checkout
+MERGE_JOURNAL_PATH = Path(__file__).resolve().parent.parent.parent / '_merge_state' / MERGE_JOURNAL_FILENAME
 
 
 def print_step(step_num, total_steps, message):
@@ -36,116 +52,92 @@ def print_substep(message, indent=1):
     print(f"{prefix}{message}")
 
 
-def is_valid_json(file_path):
+def is_reserved_dir(path):
+    """Return True for folders in the data directory that are not hubs (e.g. _manifest, _aggregates)."""
+    return path.name in ['.git', 'ref'] or path.name.startswith('_')
+
+
+def check_sexy_duck_file(file_path):
     """
-    Check if a file contains valid JSON data and has no errors.
+    Read a sexyDuck file and check that it is valid JSON without errors.
+    Does not print anything, so it can be used by the dry-run planner.
     
     Args:
         file_path: Path to the file to validate
         
     Returns:
-        bool: True if valid JSON without errors, False otherwise
+        tuple: (data, reason) - parsed data and None if valid, otherwise None and the skip reason
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb') as f:
             content = f.read()
-            if not content.strip():
-                print_substep(f"✗ File is empty: {file_path.name}", 2)
-                return False
-            data = json.loads(content)
-        
-        # Check status field
-        status = data.get('status', '').lower()
-        if status == 'failed':
-            print_substep(f"✗ Skipping - Status is 'failed': {file_path.name}", 2)
-            return False
-        
-        # Check for error_occurred flag
-        result_data = data.get('result_data', {})
-        debug_info = result_data.get('debug_info', {})
-        if debug_info.get('error_occurred', False):
-            print_substep(f"✗ Skipping - Error occurred during processing: {file_path.name}", 2)
-            return False
-        
-        # Check for mock_mode (indicates real data collection failed)
-        if result_data.get('mock_mode', False):
-            print_substep(f"✗ Skipping - Mock mode (real data failed): {file_path.name}", 2)
-            return False
-        
-        print_substep(f"✓ Valid JSON without errors: {file_path.name}", 2)
-        return True
-    except json.JSONDecodeError as e:
-        print_substep(f"✗ Invalid JSON in {file_path.name}: {str(e)[:50]}...", 2)
-        return False
+        if not content.strip():
+            return None, "File is empty"
+        data = json_io.loads(content)
+    except json_io.JSONDecodeError as e:
+        return None, f"Invalid JSON: {str(e)[:50]}..."
     except Exception as e:
-        print_substep(f"✗ Error reading {file_path.name}: {e}", 2)
-        return False
+        return None, f"Error reading file: {e}"
+    
+    # Failed status, error_occurred or mock_mode (same check as the sender)
+    reason = sexy_duck_rejection(data)
+    if reason:
+        return None, reason
+    
+    return data, None
 
 
-def extract_metadata_from_file(file_path):
+def extract_metadata(data, file_path):
     """
-    Extract metadata from sexyDuck file content (safer than parsing filename).
-    Reads job_metadata section from the JSON file.
-    Normalizes date to the Monday of the week for weekly snapshots.
+    Extract metadata from already-parsed sexyDuck content (safer than parsing filename).
+    Reads job_metadata section and normalizes date to the Monday of the week for weekly snapshots.
     
     Args:
-        file_path: Path to the sexyDuck file
+        data: Parsed sexyDuck JSON
+        file_path: Path to the sexyDuck file (used for messages and fallback model name)
         
     Returns:
         dict: Extracted metadata including hub, project, date (Monday of week), and model name
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        job_metadata = data.get('job_metadata', {})
-        
-        # Extract from job_metadata
-        hub_name = job_metadata.get('hub_name', 'Unknown')
-        project_name = job_metadata.get('project_name', 'Unknown')
-        model_name = job_metadata.get('model_name', 'Unknown')
-        timestamp = job_metadata.get('timestamp', '')
-        
-        # Extract date from timestamp and normalize to Monday of the week
-        if timestamp:
-            try:
-                from datetime import datetime, timedelta
-                
-                # Parse the timestamp (format: "2025-10-09T19:12:07.854000")
-                date_str = timestamp.split('T')[0]  # Get YYYY-MM-DD part
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                
-                # Calculate Monday of the week (weekday: Monday=0, Sunday=6)
-                days_since_monday = date_obj.weekday()
-                monday = date_obj - timedelta(days=days_since_monday)
-                
-                # Format as YYYY-MM-DD
-                date = monday.strftime('%Y-%m-%d')
-            except Exception as e:
-                print_substep(f"Warning: Could not parse date from timestamp {timestamp}: {e}", 3)
-                date = 'Unknown'
-        else:
+    job_metadata = data.get('job_metadata', {})
+    
+    # Extract from job_metadata
+    hub_name = job_metadata.get('hub_name', 'Unknown')
+    project_name = job_metadata.get('project_name', 'Unknown')
+    model_name = job_metadata.get('model_name', 'Unknown')
+    timestamp = job_metadata.get('timestamp', '')
+    
+    # Extract date from timestamp and normalize to Monday of the week
+    if timestamp:
+        try:
+            from datetime import datetime, timedelta
+            
+            # Parse the timestamp (format: "2025-10-09T19:12:07.854000")
+            date_str = timestamp.split('T')[0]  # Get YYYY-MM-DD part
+            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+            
+            # Calculate Monday of the week (weekday: Monday=0, Sunday=6)
+            days_since_monday = date_obj.weekday()
+            monday = date_obj - timedelta(days=days_since_monday)
+            
+            # Format as YYYY-MM-DD
+            date = monday.strftime('%Y-%m-%d')
+        except Exception as e:
+            print_substep(f"Warning: Could not parse date from timestamp {timestamp}: {e}", 3)
             date = 'Unknown'
-        
-        # Clean up model name (remove .rvt extension if present)
-        if model_name.endswith('.rvt'):
-            model_name = model_name[:-4]
-        
-        return {
-            'date': date,
-            'hub': hub_name,
-            'project': project_name,
-            'model_name': model_name
-        }
-    except Exception as e:
-        print_substep(f"Warning: Could not read metadata from {file_path.name}: {e}", 3)
-        # Fallback to Unknown values
-        return {
-            'date': 'Unknown',
-            'hub': 'Unknown',
-            'project': 'Unknown',
-            'model_name': file_path.stem
-        }
+    else:
+        date = 'Unknown'
+    
+    # Clean up model name (remove .rvt extension if present)
+    if model_name.endswith('.rvt'):
+        model_name = model_name[:-4]
+    
+    return {
+        'date': date,
+        'hub': hub_name,
+        'project': project_name,
+        'model_name': model_name
+    }
 
 
 def extract_project_name_from_filename(filename):
@@ -198,153 +190,467 @@ def extract_project_name_from_filename(filename):
         return "Unknown_Project"
 
 
-def process_revit_slave_folder(folder_path, destination_dir, folder_num, total_folders):
+def plan_file(file_path, folder_path, destination_dir, planned_destinations, indent):
+    """
+    Decide what the merge will do with one source file, without touching disk.
+    
+    Args:
+        file_path: Path to the source .sexyDuck file
+        folder_path: revit_slave_xxxx folder the file belongs to
+        destination_dir: Destination directory for valid files
+        planned_destinations: Set of destination paths already targeted earlier in the plan
+        indent: Log indentation level
+        
+    Returns:
+        dict: Action with 'action' set to 'copy', 'overwrite' or 'skip'
+    """
+    action = {
+        'source': str(file_path.relative_to(folder_path.parent)).replace('\\', '/'),
+        'size': file_path.stat().st_size
+    }
+    
+    data, reason = check_sexy_duck_file(file_path)
+    if data is None:
+        print_substep(f"✗ Skipping - {reason}: {file_path.name}", indent)
+        action.update({'action': 'skip', 'reason': reason})
+        return action
+    
+    # Extract metadata from file content (safer than filename parsing)
+    metadata = extract_metadata(data, file_path)
+    dest_file = destination_dir / metadata['hub'] / metadata['project'] / metadata['date'] / f"{metadata['model_name']}.sexyDuck"
+    exists = dest_file.exists() or dest_file in planned_destinations
+    planned_destinations.add(dest_file)
+    
+    action.update({
+        'action': 'overwrite' if exists else 'copy',
+        'destination': str(dest_file.relative_to(destination_dir)).replace('\\', '/'),
+        'hub': metadata['hub'],
+        'project': metadata['project'],
+        'date': metadata['date'],
+        'model_name': metadata['model_name']
+    })
+    
+    # Score the incoming data now so score changes can be reported without re-reading it
+    try:
+        validate_sexy_duck_data(data, str(file_path))
+        score_data = calculate_score(data, profile_for_hub(metadata['hub']))
+        action['new_score'] = score_data['total_score']
+        action['new_grade'] = score_data['grade']
+    except Exception as e:
+        action['score_error'] = str(e)
+    
+    verb = "overwrite" if exists else "copy"
+    print_substep(f"✓ Will {verb}: {file_path.name} → {action['destination']}", indent)
+    return action
+
+
+def plan_revit_slave_folder(folder_path, destination_dir, planned_destinations, folder_num, total_folders):
     """
-    Process a single revit_slave_xxxx folder with hybrid structure support.
+    Plan the processing of a single revit_slave_xxxx folder with hybrid structure support.
     
     Args:
         folder_path: Path to the revit_slave_xxxx folder
         destination_dir: Destination directory for valid files
-        folder_num: Current folder number being processed
-        total_folders: Total number of folders to process
+        planned_destinations: Set of destination paths already targeted earlier in the plan
+        folder_num: Current folder number being planned
+        total_folders: Total number of folders to plan
         
     Returns:
-        tuple: (files_processed, files_skipped)
+        dict: Folder plan with its ordered list of actions
     """
     print(f"\n{'-'*80}")
-    print(f"PROCESSING FOLDER {folder_num}/{total_folders}: {folder_path.name}")
+    print(f"PLANNING FOLDER {folder_num}/{total_folders}: {folder_path.name}")
     print('-'*80)
     
+    folder_plan = {'folder': folder_path.name, 'actions': []}
+    
     # Step 1: Check for task_output folder
     print_substep("Step 1: Looking for task_output folder...", 0)
     task_output_dir = folder_path / "task_output"
     
     if not task_output_dir.exists():
         print_substep(f"✗ No task_output folder found", 1)
-        return 0, 0
+        return folder_plan
     
     print_substep(f"✓ Found task_output folder: {task_output_dir}", 1)
     
     # Step 2: Scan for project folders and flat files
     print_substep("Step 2: Scanning for project folders and flat files...", 0)
     
-    # Find all items in task_output
-    all_items = list(task_output_dir.iterdir())
+    all_items = sorted(task_output_dir.iterdir())
     project_folders = [item for item in all_items if item.is_dir()]
     flat_files = [item for item in all_items if item.is_file() and item.suffix == '.sexyDuck']
     
     print_substep(f"✓ Found {len(project_folders)} project folder(s) and {len(flat_files)} flat file(s)", 1)
     
-    # List project folders
-    if project_folders:
-        print_substep("Project folders found:", 1)
-        for i, folder in enumerate(project_folders, 1):
-            print_substep(f"  {i}. {folder.name}", 2)
+    if not project_folders and not flat_files:
+        print_substep("✗ No project folders or flat files found in task_output", 1)
+        return folder_plan
+    
+    # Step 3: Project folders (New Structure) - Three-Level Hierarchy
+    for i, project_folder in enumerate(project_folders, 1):
+        print_substep(f"Project folder {i}/{len(project_folders)}: {project_folder.name}", 1)
+        for file_path in sorted(project_folder.glob("*.sexyDuck")):
+            folder_plan['actions'].append(
+                plan_file(file_path, folder_path, destination_dir, planned_destinations, 2)
+            )
     
-    # List flat files
+    # Step 4: Flat files (Legacy Structure) - Three-Level Hierarchy
     if flat_files:
-        print_substep("Flat files found:", 1)
-        for i, file in enumerate(flat_files, 1):
-            print_substep(f"  {i}. {file.name}", 2)
+        print_substep("Flat files (Legacy Structure):", 1)
+        for file_path in flat_files:
+            folder_plan['actions'].append(
+                plan_file(file_path, folder_path, destination_dir, planned_destinations, 2)
+            )
     
-    if not project_folders and not flat_files:
-        print_substep("✗ No project folders or flat files found in task_output", 1)
-        return 0, 0
+    return folder_plan
+
+
+def plan_score_changes(folder_plans, destination_dir):
+    """
+    Compute score changes the merge will produce, reading files but writing nothing.
     
-    # Step 3: Process project folders (New Structure) - Three-Level Hierarchy
-    files_processed = 0
-    files_skipped = 0
+    Args:
+        folder_plans: Folder plans built by plan_revit_slave_folder
+        destination_dir: Directory containing Hub/Project/Date hierarchy
+        
+    Returns:
+        list: One entry per file whose total score or grade will change
+    """
+    # The last planned copy wins for each destination, as in execution order
+    incoming = {}
+    for folder_plan in folder_plans:
+        for action in folder_plan['actions']:
+            if action['action'] != 'skip':
+                incoming[action['destination']] = action
     
-    if project_folders:
-        print_substep("Step 3: Processing project folders (New Structure) - Hub/Project/Date hierarchy...", 0)
-        for i, project_folder in enumerate(project_folders, 1):
-            print_substep(f"Processing project folder {i}/{len(project_folders)}: {project_folder.name}", 1)
-            
-            # Process files in project folder
-            project_files = list(project_folder.glob("*.sexyDuck"))
-            print_substep(f"Found {len(project_files)} .sexyDuck file(s) in project folder", 2)
+    changes = []
+    score_indexes = {}
+    # Read-only: planning never writes to the tree
+    metrics_cache = MetricsCache(destination_dir / METRICS_CACHE_FILENAME, root_dir=destination_dir, read_only=True)
+    destinations = {
+        str(p.relative_to(destination_dir)).replace('\\', '/')
+        for p in destination_dir.rglob("*.sexyDuck")
+    } if destination_dir.exists() else set()
+    
+    for rel_path in sorted(destinations | set(incoming)):
+        file_path = destination_dir / rel_path
+        old_score = old_grade = None
+        if file_path.exists():
+            try:
+                if file_path.parent not in score_indexes:
+                    score_indexes[file_path.parent] = load_score_index(file_path.parent)
+                # Score index first, then a score embedded by older merges
+                old = score_indexes[file_path.parent].get(file_path.stem)
+                if old is None:
+                    old = json_io.load(file_path).get('score')
+                old = old or {}
+                old_score, old_grade = old.get('total_score'), old.get('grade')
+            except Exception as e:
+                changes.append({'path': rel_path, 'error': f"Could not read current file: {e}"})
+                continue
+        
+        if rel_path in incoming:
+            action = incoming[rel_path]
+            if 'score_error' in action:
+                changes.append({'path': rel_path, 'error': action['score_error']})
+                continue
+            new_score, new_grade = action['new_score'], action['new_grade']
+        else:
+            try:
+                score_data = score_metrics(metrics_cache.metrics(file_path), profile_for_hub(rel_path.split('/')[0]))
+            except Exception as e:
+                changes.append({'path': rel_path, 'error': str(e)})
+                continue
+            new_score, new_grade = score_data['total_score'], score_data['grade']
+        
+        if new_score != old_score or new_grade != old_grade:
+            changes.append({
+                'path': rel_path,
+                'old_score': old_score,
+                'new_score': new_score,
+                'old_grade': old_grade,
+                'new_grade': new_grade
+            })
+    
+    return changes
+
+
+def plan_manifest_delta(folder_plans, destination_dir):
+    """
+    Compare the current manifest.json with the file set the merge will produce.
+    
+    Args:
+        folder_plans: Folder plans built by plan_revit_slave_folder
+        destination_dir: Directory containing Hub/Project/Date hierarchy
+        
+    Returns:
+        dict: Relative paths that will be added, updated or removed in the manifest
+    """
+    current = set()
+    manifest_path = destination_dir / 'manifest.json'
+    if manifest_path.exists():
+        try:
+            manifest = json_io.load(manifest_path)
+            for hub in manifest.get('hubs', []):
+                for project in hub.get('projects', []):
+                    for date in project.get('dates', []):
+                        for model in date.get('models', []):
+                            current.add(model['relative_path'])
+        except Exception as e:
+            print_substep(f"Warning: Could not read current manifest: {e}", 1)
+    
+    final = set()
+    if destination_dir.exists():
+        for hub_dir in destination_dir.iterdir():
+            if hub_dir.is_dir() and not is_reserved_dir(hub_dir):
+                for file_path in hub_dir.glob("*/*/*.sexyDuck"):
+                    final.add(str(file_path.relative_to(destination_dir)).replace('\\', '/'))
+    incoming = {
+        action['destination']
+        for folder_plan in folder_plans
+        for action in folder_plan['actions']
+        if action['action'] != 'skip'
+    }
+    final |= incoming
+    
+    return {
+        'added': sorted(final - current),
+        'updated': sorted(incoming & current),
+        'removed': sorted(current - final)
+    }
+
+
+def build_merge_plan(revit_slave_folders, data_received_dir, destination_dir, include_score_changes=True):
+    """
+    Compute the full change set of a merge without writing anything to disk.
+    
+    Args:
+        revit_slave_folders: revit_slave_xxxx folders in processing order
+        data_received_dir: Source _data_received directory
+        destination_dir: Destination docs/asset/data directory
+        include_score_changes: Rescore the whole tree in memory to report score changes
+                               (skipped for normal runs, which score everything in step 5)
+        
+    Returns:
+        dict: JSON-serializable plan that can be passed to execute_merge_plan
+    """
+    import datetime
+    
+    planned_destinations = set()
+    folder_plans = [
+        plan_revit_slave_folder(folder, destination_dir, planned_destinations, i, len(revit_slave_folders))
+        for i, folder in enumerate(revit_slave_folders, 1)
+    ]
+    
+    print_substep("Computing score changes and manifest delta...", 0)
+    score_changes = plan_score_changes(folder_plans, destination_dir) if include_score_changes else None
+    manifest_delta = plan_manifest_delta(folder_plans, destination_dir)
+    
+    actions = [action for folder_plan in folder_plans for action in folder_plan['actions']]
+    return {
+        'version': '1.0',
+        'generated_at': datetime.datetime.now().isoformat(),
+        'source_dir': str(data_received_dir),
+        'destination_dir': str(destination_dir),
+        'folders': folder_plans,
+        'score_changes': score_changes,
+        'manifest_delta': manifest_delta,
+        'deletions': [folder.name for folder in revit_slave_folders],
+        'summary': {
+            'copies': sum(1 for a in actions if a['action'] == 'copy'),
+            'overwrites': sum(1 for a in actions if a['action'] == 'overwrite'),
+            'skips': sum(1 for a in actions if a['action'] == 'skip'),
+            'bytes_to_copy': sum(a['size'] for a in actions if a['action'] != 'skip'),
+            'score_changes': len(score_changes) if score_changes is not None else None,
+            'manifest_added': len(manifest_delta['added']),
+            'manifest_removed': len(manifest_delta['removed']),
+            'deletions': len(revit_slave_folders)
+        }
+    }
+
+
+class MergeJournal:
+    """
+    Append-only journal of a merge run, so a run interrupted between moving files
+    and cleaning up source folders can be resumed with the same plan.
+    """
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.plan = None
+        self.move = False
+        self.completed = set()
+        self.events = set()
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Load an unfinished journal, or return None if there is nothing to resume.
+        
+        Args:
+            path: Journal file path
             
-            for j, file_path in enumerate(project_files, 1):
-                print_substep(f"Processing file {j}/{len(project_files)}: {file_path.name}", 2)
-                
-                if is_valid_json(file_path):
-                    # Extract metadata from file content (safer than filename parsing)
-                    metadata = extract_metadata_from_file(file_path)
-                    hub = metadata['hub']
-                    project = metadata['project']
-                    date = metadata['date']
-                    model_name = metadata['model_name']
-                    
-                    print_substep(f"Hub: {hub}, Project: {project}, Date: {date}, Model: {model_name}", 3)
-                    
-                    # Create three-level directory structure: Hub/Project/Date
-                    dest_hierarchy = destination_dir / hub / project / date
-                    dest_hierarchy.mkdir(parents=True, exist_ok=True)
-                    
-                    # Save with simplified filename (just model name)
-                    dest_file = dest_hierarchy / f"{model_name}.sexyDuck"
-                    
-                    try:
-                        if dest_file.exists():
-                            print_substep(f"⚠ File exists, will overwrite: {dest_file.name}", 3)
-                        
-                        shutil.copy2(file_path, dest_file)
-                        print_substep(f"✓ Successfully copied to: {dest_file.relative_to(destination_dir)}", 3)
-                        files_processed += 1
-                    except Exception as e:
-                        print_substep(f"✗ Error copying file: {e}", 3)
-                        files_skipped += 1
+        Returns:
+            MergeJournal or None
+        """
+        journal = cls(path)
+        if not journal.path.exists():
+            return None
+        with open(journal.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from a crash is ignored
+                    continue
+                if entry['event'] == 'begin':
+                    journal.plan = entry['plan']
+                    journal.move = entry.get('move', False)
+                elif entry['event'] == 'transferred':
+                    journal.completed.add(entry['source'])
                 else:
-                    print_substep(f"✗ Skipping invalid file", 3)
-                    files_skipped += 1
+                    journal.events.add(entry['event'])
+        return journal if journal.plan is not None else None
     
-    # Step 4: Process flat files (Legacy Structure) - Three-Level Hierarchy
-    if flat_files:
-        print_substep("Step 4: Processing flat files (Legacy Structure) - Hub/Project/Date hierarchy...", 0)
-        for i, file_path in enumerate(flat_files, 1):
-            print_substep(f"Processing flat file {i}/{len(flat_files)}: {file_path.name}", 1)
+    def _append(self, entry):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def begin(self, plan, move):
+        """Start a new journal for a plan."""
+        self.plan = plan
+        self.move = move
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'event': 'begin', 'move': move, 'plan': plan}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def record_transfer(self, source):
+        """Record that a planned file has reached its destination."""
+        self.completed.add(source)
+        self._append({'event': 'transferred', 'source': source})
+    
+    def mark(self, event):
+        """Record a phase marker such as 'transfers_done'."""
+        self.events.add(event)
+        self._append({'event': event})
+    
+    def finish(self):
+        """Remove the journal after a complete run."""
+        if self.path.exists():
+            self.path.unlink()
+
+
+def transfer_file(source_file, dest_file, move=False):
+    """
+    Put a source file at its destination.
+    
+    In move mode the file is renamed into place, which writes no data when source and
+    destination share a filesystem. Otherwise (or across filesystems) it is copied to a
+    temporary name next to the destination and renamed, so the destination is never partial.
+    
+    Args:
+        source_file: Source path
+        dest_file: Destination path
+        move: Rename instead of copying when possible
+        
+    Returns:
+        str: 'moved' or 'copied'
+    """
+    dest_file.parent.mkdir(parents=True, exist_ok=True)
+    if move:
+        try:
+            os.replace(source_file, dest_file)
+            return 'moved'
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+    
+    temp_file = dest_file.with_name(dest_file.name + '.tmp')
+    shutil.copy2(source_file, temp_file)
+    os.replace(temp_file, dest_file)
+    return 'copied'
+
+
+def process_revit_slave_folder(folder_plan, source_dir, destination_dir, folder_num, total_folders,
+                               move=False, journal=None):
+    """
+    Execute the planned actions of a single revit_slave_xxxx folder.
+    
+    Args:
+        folder_plan: Folder plan built by plan_revit_slave_folder
+        source_dir: Source _data_received directory the plan's paths are relative to
+        destination_dir: Destination directory for valid files
+        folder_num: Current folder number being processed
+        total_folders: Total number of folders to process
+        move: Rename files into place instead of copying (copy fallback across filesystems)
+        journal: Optional MergeJournal recording completed transfers
+        
+    Returns:
+        tuple: (files_processed, files_skipped)
+    """
+    print(f"\n{'-'*80}")
+    print(f"PROCESSING FOLDER {folder_num}/{total_folders}: {folder_plan['folder']}")
+    print('-'*80)
+    
+    files_processed = 0
+    files_skipped = 0
+    actions = folder_plan['actions']
+    
+    for i, action in enumerate(actions, 1):
+        source_file = source_dir / action['source']
+        print_substep(f"Processing file {i}/{len(actions)}: {source_file.name}", 1)
+        
+        if action['action'] == 'skip':
+            print_substep(f"✗ Skipping invalid file ({action['reason']})", 2)
+            files_skipped += 1
+            continue
+        
+        if journal is not None and action['source'] in journal.completed:
+            print_substep(f"✓ Already transferred in interrupted run: {action['destination']}", 2)
+            files_processed += 1
+            continue
+        
+        print_substep(f"Hub: {action['hub']}, Project: {action['project']}, "
+                      f"Date: {action['date']}, Model: {action['model_name']}", 2)
+        dest_file = destination_dir / action['destination']
+        
+        # A crash between the rename and its journal entry leaves only the destination
+        if move and not source_file.exists() and dest_file.exists():
+            if journal is not None:
+                journal.record_transfer(action['source'])
+            print_substep(f"✓ Already moved in interrupted run: {action['destination']}", 2)
+            files_processed += 1
+            continue
+        
+        try:
+            if action['action'] == 'overwrite':
+                print_substep(f"⚠ File exists, will overwrite: {dest_file.name}", 2)
             
-            if is_valid_json(file_path):
-                # Extract metadata from file content (safer than filename parsing)
-                metadata = extract_metadata_from_file(file_path)
-                hub = metadata['hub']
-                project = metadata['project']
-                date = metadata['date']
-                model_name = metadata['model_name']
-                
-                print_substep(f"Hub: {hub}, Project: {project}, Date: {date}, Model: {model_name}", 2)
-                
-                # Create three-level directory structure: Hub/Project/Date
-                dest_hierarchy = destination_dir / hub / project / date
-                dest_hierarchy.mkdir(parents=True, exist_ok=True)
-                
-                # Save with simplified filename (just model name)
-                dest_file = dest_hierarchy / f"{model_name}.sexyDuck"
-                
-                try:
-                    if dest_file.exists():
-                        print_substep(f"⚠ File exists, will overwrite: {dest_file.name}", 2)
-                    
-                    shutil.copy2(file_path, dest_file)
-                    print_substep(f"✓ Successfully copied to: {dest_file.relative_to(destination_dir)}", 2)
-                    files_processed += 1
-                except Exception as e:
-                    print_substep(f"✗ Error copying file: {e}", 2)
-                    files_skipped += 1
-            else:
-                print_substep(f"✗ Skipping invalid file", 2)
-                files_skipped += 1
+            result = transfer_file(source_file, dest_file, move)
+            if journal is not None:
+                journal.record_transfer(action['source'])
+            print_substep(f"✓ Successfully {result} to: {action['destination']}", 2)
+            files_processed += 1
+        except Exception as e:
+            print_substep(f"✗ Error copying file: {e}", 2)
+            files_skipped += 1
     
     print_substep(f"Summary: {files_processed} copied, {files_skipped} skipped", 1)
     return files_processed, files_skipped
 
 
-def generate_manifest(destination_dir):
+def generate_manifest(destination_dir, keep_shards=frozenset()):
     """
     Generate three-level hierarchical manifest.json file (Hub → Project → Date).
     
     Args:
         destination_dir: Directory containing Hub/Project/Date hierarchy
+        keep_shards: v4.0 shard names to keep even if unreferenced (see published_manifest_shards)
         
     Returns:
         int: Number of files added to manifest
@@ -357,7 +663,7 @@ def generate_manifest(destination_dir):
     
     # Scan for hub folders
     for hub_dir in destination_dir.iterdir():
-        if not hub_dir.is_dir() or hub_dir.name in ['.git', 'ref']:
+        if not hub_dir.is_dir() or is_reserved_dir(hub_dir):
             continue
         
         hub_name = hub_dir.name
@@ -412,11 +718,15 @@ def generate_manifest(destination_dir):
             
             for date in sorted(hubs[hub_name][project_name].keys()):
                 models = hubs[hub_name][project_name][date]
-                project_dates.append({
+                date_entry = {
                     'date': date,
                     'total_models': len(models),
                     'models': sorted(models, key=lambda x: x['filename'])
-                })
+                }
+                # Scores live in a per-date index next to the models
+                if (destination_dir / hub_name / project_name / date / SCORE_INDEX_FILENAME).exists():
+                    date_entry['score_index'] = f"{hub_name}/{project_name}/{date}/{SCORE_INDEX_FILENAME}"
+                project_dates.append(date_entry)
                 project_total_files += len(models)
             
             hub_projects.append({
@@ -447,74 +757,387 @@ def generate_manifest(destination_dir):
     # Write manifest file
     manifest_path = destination_dir / 'manifest.json'
     try:
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        json_io.dump(manifest, manifest_path, pretty=True)
         
         print_substep(f"✓ Manifest v3.0 created:", 1)
         print_substep(f"  - {manifest['total_hubs']} hub(s)", 2)
         print_substep(f"  - {manifest['total_projects']} project(s)", 2)
         print_substep(f"  - {manifest['total_files']} file(s)", 2)
         print_substep(f"✓ Manifest saved to: {manifest_path}", 1)
-        return total_files
     except Exception as e:
         print_substep(f"✗ Error writing manifest: {e}", 1)
         return 0
+    
+    # Sharded v4.0 manifest is written alongside v3.0 during the transition
+    try:
+        generate_manifest_v4(manifest, destination_dir, keep_shards)
+    except Exception as e:
+        print_substep(f"✗ Error writing manifest v4.0: {e}", 1)
+    
+    return total_files
+
+
+def published_manifest_shards(destination_dir):
+    """
+    Shard names referenced by the manifest.v4.json currently on disk (the published generation).
+    
+    Args:
+        destination_dir: Directory containing Hub/Project/Date hierarchy
+        
+    Returns:
+        set: Shard file names (empty if there is no readable index)
+    """
+    try:
+        index = json_io.load(destination_dir / MANIFEST_V4_FILENAME)
+    except (OSError, ValueError):
+        return set()
+    return {Path(project['shard']).name
+            for hub in index.get('hubs', []) for project in hub.get('projects', [])}
+
+
+def generate_manifest_v4(manifest, destination_dir, keep_shards=frozenset()):
+    """
+    Generate sharded manifest v4.0 from a v3.0 manifest.
+    
+    Writes a small root index (manifest.v4.json) with hubs, projects and totals, plus
+    one shard per project under _manifest/ listing its dates and models. Shards are named
+    by content hash so the dashboard can cache them indefinitely and fetch them on demand.
+    
+    Unreferenced shards are removed, except keep_shards: the previous generation stays
+    for one run so a browser holding a cached older root index can still fetch its shards.
+    
+    Args:
+        manifest: v3.0 manifest dictionary built by generate_manifest
+        destination_dir: Directory containing Hub/Project/Date hierarchy
+        keep_shards: Shard names of the previous generation to keep
+        
+    Returns:
+        int: Number of project shards referenced by the root index
+    """
+    shard_dir = destination_dir / MANIFEST_SHARD_DIRNAME
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    
+    index_hubs = []
+    shard_names = set()
+    
+    for hub in manifest['hubs']:
+        index_projects = []
+        for project in hub['projects']:
+            # last_modified is left out: checkouts reset mtimes, which would rename every
+            # shard on every run instead of only the shards whose content changed
+            shard_dates = [
+                {**date_entry, 'models': [
+                    {key: value for key, value in model.items() if key != 'last_modified'}
+                    for model in date_entry['models']
+                ]}
+                for date_entry in project['dates']
+            ]
+            shard = {
+                'version': '4.0',
+                'hub_name': hub['hub_name'],
+                'project_name': project['project_name'],
+                'dates': shard_dates
+            }
+            shard_bytes = json_io.dumpb(shard)
+            shard_name = f"{hashlib.sha256(shard_bytes).hexdigest()[:16]}.json"
+            shard_path = shard_dir / shard_name
+            if not shard_path.exists():
+                write_json_atomic(shard_path, shard)
+            shard_names.add(shard_name)
+            
+            index_projects.append({
+                'project_name': project['project_name'],
+                'total_dates': project['total_dates'],
+                'total_models': project['total_models'],
+                'latest_date': project['dates'][-1]['date'] if project['dates'] else None,
+                'shard': f"{MANIFEST_SHARD_DIRNAME}/{shard_name}",
+                'shard_size': len(shard_bytes)
+            })
+        
+        index_hubs.append({
+            'hub_name': hub['hub_name'],
+            'total_projects': hub['total_projects'],
+            'total_models': hub['total_models'],
+            'projects': index_projects
+        })
+    
+    # Remove shards referenced by neither this index nor the previous generation
+    for old_shard in shard_dir.glob("*.json"):
+        if old_shard.name not in shard_names and old_shard.name not in keep_shards:
+            old_shard.unlink()
+    
+    index = {
+        'version': '4.0',
+        'generated_at': manifest['generated_at'],
+        'total_hubs': manifest['total_hubs'],
+        'total_projects': manifest['total_projects'],
+        'total_files': manifest['total_files'],
+        'hubs': index_hubs
+    }
+    index_path = destination_dir / MANIFEST_V4_FILENAME
+    write_json_atomic(index_path, index)
+    
+    print_substep(f"✓ Manifest v4.0 created: {len(shard_names)} project shard(s), "
+                  f"root index {index_path.stat().st_size} bytes", 1)
+    return len(shard_names)
+
+
+def add_cohort_percentiles(history_rows, metric_rows):
+    """
+    Attach fleet-relative percentile ranks to scored Hub/Project/Date models.
+    
+    Each score_data gains a 'percentiles' entry with the model's rank among all
+    models of the same week ('week') and of the same hub and week ('hub').
+    
+    Args:
+        history_rows: (hub, project, date, model, score_data) tuples
+        metric_rows: Extracted metrics of each history row, in the same order
+    """
+    totals = [row[4]['total_score'] for row in history_rows]
+    by_week = cohort_percentiles(metric_rows, totals, [row[2] for row in history_rows])
+    by_hub = cohort_percentiles(metric_rows, totals, [(row[0], row[2]) for row in history_rows])
+    for row, week, hub in zip(history_rows, by_week, by_hub):
+        row[4]['percentiles'] = {'week': week, 'hub': hub}
 
 
-def score_all_files(destination_dir):
+def report_regressions(folder_plans, destination_dir, history_store):
+    """
+    Pair the snapshots transferred in this merge with their previous snapshot and
+    update the regressions file. Without a regressions file, the latest snapshot
+    of every model is evaluated once.
+    
+    Args:
+        folder_plans: Folder plans of this merge
+        destination_dir: Directory containing Hub/Project/Date hierarchy
+        history_store: Open HistoryStore (already updated by score_all_files)
+        
+    Returns:
+        dict: Result of detect_regressions
+    """
+    regressions_path = destination_dir / REGRESSIONS_FILENAME
+    if regressions_path.exists():
+        keys = set()
+        for folder_plan in folder_plans:
+            for action in folder_plan['actions']:
+                parts = action['destination'].split('/')
+                if action['action'] != 'skip' and len(parts) == 4 and parts[3].endswith('.sexyDuck'):
+                    keys.add((parts[0], parts[1], parts[2], parts[3][:-len('.sexyDuck')]))
+        keys = sorted(keys)
+    else:
+        keys = latest_snapshot_keys(history_store)
+    
+    result = detect_regressions(history_store, keys)
+    written = update_regressions_file(regressions_path, result)
+    print_substep(f"✓ Regressions: {len(result['evaluated'])} snapshot(s) checked, {result['paired']} paired, "
+                  f"{len(result['regressions'])} flagged, {written:,} bytes written", 1)
+    for entry in result['regressions']:
+        print_substep(f"⚠ {entry['hub']}/{entry['project']}/{entry['model']}: {entry['previous_score']} -> "
+                      f"{entry['score']} ({entry['score_delta']:+.2f}, {entry['previous_grade']} -> {entry['grade']})", 2)
+    return result
+
+
+def score_all_files(destination_dir, history_store=None, workers=1):
     """
     Score all sexyDuck files in the destination directory (recursively through Hub/Project/Date hierarchy).
+    Scores are written to one score index per date folder; data files are not modified.
+    Metric values come from the extracted-metrics cache, so unchanged files are not parsed.
+    Hub/Project/Date models also get percentile ranks within their week and hub cohorts.
+    
+    With more than one worker, files missing from the cache are hashed and parsed in a
+    process pool first; scoring and index writes stay in this process, so the output
+    is identical to a serial run.
     
     Args:
         destination_dir: Directory containing Hub/Project/Date hierarchy
+        history_store: Optional HistoryStore that receives one row per scored model
+        workers: Worker processes for parsing (1 = serial, per-file progress lines)
         
     Returns:
-        tuple: (files_scored, files_failed)
+        tuple: (files_scored, files_failed, scored_models, model_totals) where scored_models is a
+               list of (hub, project, date, model, score_data) tuples for Hub/Project/Date files and
+               model_totals maps (hub, project, date, model) to its summary counts and file size
     """
     print_substep("Scoring all sexyDuck files (recursively through Hub/Project/Date hierarchy)...", 0)
+    start_time = time.perf_counter()
     
     # Find all .sexyDuck files recursively using glob pattern
-    sexy_duck_files = list(destination_dir.rglob("*.sexyDuck"))
+    sexy_duck_files = sorted(destination_dir.rglob("*.sexyDuck"))
     
     if not sexy_duck_files:
         print_substep("⚠ No sexyDuck files found to score", 1)
-        return 0, 0
+        return 0, 0, [], {}
     
     print_substep(f"Found {len(sexy_duck_files)} file(s) to score", 1)
     
     files_scored = 0
     files_failed = 0
+    history_rows = []
+    history_metrics = []
+    model_totals = {}
+    date_scores = {}
+    metrics_cache = MetricsCache(destination_dir / METRICS_CACHE_FILENAME, root_dir=destination_dir)
     
-    for i, file_path in enumerate(sorted(sexy_duck_files), 1):
-        # Display relative path for better context
-        try:
-            rel_path = file_path.relative_to(destination_dir)
-            print_substep(f"Scoring file {i}/{len(sexy_duck_files)}: {rel_path}", 1)
-        except:
-            print_substep(f"Scoring file {i}/{len(sexy_duck_files)}: {file_path.name}", 1)
+    load_errors = {}
+    if workers > 1:
+        load_errors = metrics_cache.prefetch(sexy_duck_files, workers)
+        print_substep(f"✓ Parsed uncached files with {workers} worker process(es)", 1)
+    
+    for i, file_path in enumerate(sexy_duck_files, 1):
+        if workers <= 1:
+            # Display relative path for better context
+            try:
+                rel_path = file_path.relative_to(destination_dir)
+                print_substep(f"Scoring file {i}/{len(sexy_duck_files)}: {rel_path}", 1)
+            except:
+                print_substep(f"Scoring file {i}/{len(sexy_duck_files)}: {file_path.name}", 1)
+        
+        # Hubs may have their own scoring profile (docs/ref/scoring_profiles)
+        parts = file_path.relative_to(destination_dir).parts
+        profile = profile_for_hub(parts[0]) if len(parts) == 4 else None
         
         try:
-            score_file(str(file_path))
-            print_substep(f"✓ Successfully scored", 2)
+            if str(file_path) in load_errors:
+                raise ValueError(load_errors[str(file_path)])
+            entry = metrics_cache.get(file_path)
+            metrics = entry['metrics']
+            score_data = score_metrics(metrics, profile)
+            date_scores.setdefault(file_path.parent, {})[file_path.stem] = score_data
+            if workers <= 1:
+                print_substep(f"✓ Successfully scored", 2)
             files_scored += 1
+            
+            # Only Hub/Project/Date/Model.sexyDuck files belong in the history
+            if len(parts) == 4:
+                history_rows.append((parts[0], parts[1], parts[2], file_path.stem, score_data))
+                history_metrics.append(metrics)
+                model_totals[(parts[0], parts[1], parts[2], file_path.stem)] = {
+                    field: entry[field] for field in SUMMARY_FIELDS + ['file_size_bytes']
+                }
         except Exception as e:
-            print_substep(f"✗ Error scoring file: {e}", 2)
+            if workers <= 1:
+                print_substep(f"✗ Error scoring file: {e}", 2)
+            else:
+                print_substep(f"✗ Error scoring {file_path.relative_to(destination_dir)}: {e}", 1)
             files_failed += 1
     
-    print_substep(f"Summary: {files_scored} scored, {files_failed} failed", 1)
-    return files_scored, files_failed
+    try:
+        metrics_cache.prune()
+        cache_bytes = metrics_cache.save()
+        cache_stats = metrics_cache.stats()
+        print_substep(f"✓ Metrics cache: {cache_stats['hits']} hit(s), {cache_stats['misses']} parsed, "
+                      f"{cache_stats['files']} file(s) cached, {cache_bytes:,} bytes written", 1)
+    except Exception as e:
+        print_substep(f"✗ Error saving metrics cache: {e}", 1)
+    
+    if history_rows:
+        try:
+            add_cohort_percentiles(history_rows, history_metrics)
+            print_substep(f"✓ Percentile ranks computed for {len(history_rows)} model(s) (week and hub cohorts)", 1)
+        except Exception as e:
+            print_substep(f"✗ Error computing percentile ranks: {e}", 1)
+    
+    # One atomic write per date folder, skipped when its scores are unchanged
+    indexes_written = 0
+    bytes_written = 0
+    for date_dir, scores in sorted(date_scores.items()):
+        try:
+            written = save_scores(date_dir, scores)
+        except Exception as e:
+            print_substep(f"✗ Error writing score index in {date_dir}: {e}", 1)
+            files_scored -= len(scores)
+            files_failed += len(scores)
+            history_rows = [row for row in history_rows if destination_dir / row[0] / row[1] / row[2] != date_dir]
+            continue
+        if written:
+            indexes_written += 1
+            bytes_written += written
+    print_substep(f"✓ Score indexes: {indexes_written}/{len(date_scores)} updated, {bytes_written:,} bytes written", 1)
+    
+    if history_store is not None and history_rows:
+        try:
+            rows_written = history_store.record_many(history_rows)
+            print_substep(f"✓ Recorded {rows_written} row(s) in history store", 1)
+        except Exception as e:
+            print_substep(f"✗ Error updating history store: {e}", 1)
+    
+    seconds = time.perf_counter() - start_time
+    rate = f", {len(sexy_duck_files) / seconds:.1f} files/s" if seconds > 0 else ""
+    print_substep(f"Summary: {files_scored} scored, {files_failed} failed in {seconds:.2f} s{rate}", 1)
+    return files_scored, files_failed, history_rows, model_totals
 
 
 def main():
     """
     Main function to process all revit_slave_xxxx folders.
+    
+    Options:
+        --dry-run: Compute the merge plan without touching disk and print it as JSON
+        --plan-out PATH: Write the plan JSON to a file instead of stdout
+        --plan PATH: Execute a previously saved plan instead of planning again
+        --move: Rename files into place instead of copying them
+        --workers N: Processes for parsing files during scoring (default: CPU count, 1 = serial)
+    
+    An unfinished merge journal (MERGE_JOURNAL_PATH) is always resumed first.
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="HealthMetric Data Merge")
+    parser.add_argument("--dry-run", action="store_true", help="Plan the merge and emit the change set as JSON without touching disk")
+    parser.add_argument("--plan-out", help="Write the plan JSON to this file instead of stdout")
+    parser.add_argument("--plan", help="Execute a previously saved plan JSON")
+    parser.add_argument("--move", action="store_true", help="Rename files into place instead of copying (copy fallback across filesystems)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for parsing files during scoring (default: CPU count, 1 = serial)")
+    args = parser.parse_args()
+    
+    if args.dry_run:
+        # Keep stdout clean for the JSON plan; progress goes to stderr
+        import contextlib
+        with contextlib.redirect_stdout(sys.stderr):
+            plan = create_plan(include_score_changes=True)
+        plan_json = json.dumps(plan, indent=2, ensure_ascii=False)
+        if args.plan_out:
+            with open(args.plan_out, 'w', encoding='utf-8') as f:
+                f.write(plan_json)
+            print(f"Plan written to: {args.plan_out}", file=sys.stderr)
+        else:
+            print(plan_json)
+        return
+    
+    journal = MergeJournal.load(MERGE_JOURNAL_PATH)
+    if journal is not None:
+        print(f"Resuming interrupted merge from journal: {journal.path}")
+        print(f"  {len(journal.completed)} file(s) already transferred")
+        execute_merge_plan(journal.plan, move=journal.move, journal=journal, workers=args.workers)
+        return
+    
+    if args.plan:
+        with open(args.plan, 'r', encoding='utf-8') as f:
+            plan = json.load(f)
+    else:
+        plan = create_plan(include_score_changes=False)
+    
+    journal = MergeJournal(MERGE_JOURNAL_PATH)
+    journal.begin(plan, args.move)
+    execute_merge_plan(plan, move=args.move, journal=journal, workers=args.workers)
+
+
+def create_plan(include_score_changes=True):
+    """
+    Run steps 1-2 (paths and folder scan) and plan step 3 without writing to disk.
+    
+    Args:
+        include_score_changes: Whether the plan reports score changes for the whole tree
+        
+    Returns:
+        dict: Merge plan built by build_merge_plan
     """
     print("\n" + "="*80)
     print("HEALTHMETRIC DATA MERGE SCRIPT")
     print("="*80)
     
     # STEP 1: Initialize paths
-    print_step(1, 8, "Initialize Paths and Directories")
+    print_step(1, 9, "Initialize Paths and Directories")
     script_dir = Path(__file__).resolve().parent
     project_root = script_dir.parent.parent
     data_received_dir = project_root / "_data_received"
@@ -530,16 +1153,13 @@ def main():
         sys.exit(1)
     print_substep("✓ Source directory exists", 0)
     
-    # Ensure destination directory exists
-    if not destination_dir.exists():
-        print_substep("Creating destination directory...", 0)
-        destination_dir.mkdir(parents=True, exist_ok=True)
-        print_substep("✓ Destination directory created", 1)
-    else:
+    if destination_dir.exists():
         print_substep("✓ Destination directory exists", 0)
+    else:
+        print_substep("Destination directory will be created", 0)
     
     # STEP 2: Find all revit_slave folders
-    print_step(2, 8, "Scan for revit_slave_* Folders")
+    print_step(2, 9, "Scan for revit_slave_* Folders")
     
     # Find all revit_slave folders and sort by timestamp (oldest first)
     def extract_timestamp(folder_path):
@@ -569,47 +1189,114 @@ def main():
         print_substep(f"✓ Found {len(revit_slave_folders)} folder(s) to process:", 0)
         for i, folder in enumerate(revit_slave_folders, 1):
             print_substep(f"Folder {i}: {folder.name}", 1)
-        
+    
+    # STEP 3 (planning): Decide copies, overwrites and skips for each folder
+    print_step(3, 9, "Plan Each Folder (Hybrid: Project Folders + Flat Files)")
+    plan = build_merge_plan(revit_slave_folders, data_received_dir, destination_dir, include_score_changes)
+    summary = plan['summary']
+    print_substep(f"✓ Plan: {summary['copies']} copy, {summary['overwrites']} overwrite, "
+                  f"{summary['skips']} skip, {summary['deletions']} folder deletion(s)", 0)
+    if summary['score_changes'] is not None:
+        print_substep(f"✓ Score changes: {summary['score_changes']}", 0)
+    return plan
+
+
+def execute_merge_plan(plan, move=False, journal=None, workers=1):
+    """
+    Execute a merge plan: transfer files, generate manifests, score, aggregate and clean up.
+    
+    Args:
+        plan: Plan built by build_merge_plan (or loaded from its JSON output)
+        move: Rename files into place instead of copying them
+        journal: Optional MergeJournal; completed transfers are skipped and it is removed at the end
+        workers: Worker processes for parsing files during scoring (1 = serial)
+    """
+    data_received_dir = Path(plan['source_dir'])
+    destination_dir = Path(plan['destination_dir'])
+    folder_plans = plan['folders']
+    
+    # Ensure destination directory exists
+    if not destination_dir.exists():
+        print_substep("Creating destination directory...", 0)
+        destination_dir.mkdir(parents=True, exist_ok=True)
+        print_substep("✓ Destination directory created", 1)
+    
+    if folder_plans:
         # STEP 3: Process each folder
-        print_step(3, 8, "Process Each Folder (Hybrid: Project Folders + Flat Files)")
+        print_step(3, 9, "Process Each Folder (Hybrid: Project Folders + Flat Files)")
         total_files_processed = 0
         total_files_skipped = 0
         
-        for i, folder in enumerate(revit_slave_folders, 1):
+        for i, folder_plan in enumerate(folder_plans, 1):
             files_processed, files_skipped = process_revit_slave_folder(
-                folder, destination_dir, i, len(revit_slave_folders)
+                folder_plan, data_received_dir, destination_dir, i, len(folder_plans),
+                move=move, journal=journal
             )
             total_files_processed += files_processed
             total_files_skipped += files_skipped
     else:
         # No new folders to process, but we'll still regenerate manifest
-        print_step(3, 8, "No New Folders to Process")
+        print_step(3, 9, "No New Folders to Process")
         total_files_processed = 0
         total_files_skipped = 0
     
+    if journal is not None:
+        journal.mark('transfers_done')
+    
     # STEP 4: Generate initial manifest file
-    print_step(4, 8, "Generate Initial Hierarchical Manifest File for Website")
-    manifest_file_count = generate_manifest(destination_dir)
+    print_step(4, 9, "Generate Initial Hierarchical Manifest File for Website")
+    # Both manifest passes keep the shards of the generation published before this run
+    published_shards = published_manifest_shards(destination_dir)
+    manifest_file_count = generate_manifest(destination_dir, published_shards)
     
     # STEP 5: Score all files
-    print_step(5, 8, "Calculate Health Scores for All Models")
-    files_scored, files_score_failed = score_all_files(destination_dir)
+    print_step(5, 9, "Calculate Health Scores for All Models")
+    if not HISTORY_PATH.exists():
+        # history.sqlite is gitignored, so a fresh checkout (CI) rebuilds it from the scored tree
+        rebuilt = rebuild_from_tree(destination_dir, HISTORY_PATH)
+        print_substep(f"Rebuilt history store from the data tree: {rebuilt} row(s)", 0)
+    with HistoryStore(HISTORY_PATH) as history_store:
+        files_scored, files_score_failed, scored_models, model_totals = score_all_files(
+            destination_dir, history_store, workers=workers)
+        history_rows_total = history_store.count()
+        try:
+            report_regressions(folder_plans, destination_dir, history_store)
+        except Exception as e:
+            print_substep(f"✗ Error detecting regressions: {e}", 1)
     
     # STEP 6: Regenerate manifest after scoring
-    print_step(6, 8, "Regenerate Hierarchical Manifest with Updated Scores")
-    manifest_file_count_updated = generate_manifest(destination_dir)
+    print_step(6, 9, "Regenerate Hierarchical Manifest with Updated Scores")
+    manifest_file_count_updated = generate_manifest(destination_dir, published_shards)
     
-    # STEP 7: Delete processed folders (if any)
-    print_step(7, 8, "Clean Up - Delete Processed Folders")
+    # STEP 7: Build precomputed dashboard aggregates from the scored data
+    print_step(7, 9, "Build Precomputed Dashboard Aggregates")
+    aggregate_report = None
+    if scored_models:
+        try:
+            aggregate_report = write_aggregates(scored_models, destination_dir, model_totals)
+            for name, size in aggregate_report['files'].items():
+                print_substep(f"✓ {name}: {size:,} bytes", 0)
+        except Exception as e:
+            print_substep(f"✗ Error building aggregates: {e}", 0)
+    else:
+        print_substep("No scored models to aggregate", 0)
+    
+    # STEP 8: Delete processed folders (if any)
+    print_step(8, 9, "Clean Up - Delete Processed Folders")
     folders_deleted = 0
     folders_failed = 0
     
-    if revit_slave_folders:
-        for i, folder in enumerate(revit_slave_folders, 1):
-            print_substep(f"Deleting folder {i}/{len(revit_slave_folders)}: {folder.name}", 0)
+    deletions = plan['deletions']
+    if deletions:
+        for i, folder_name in enumerate(deletions, 1):
+            print_substep(f"Deleting folder {i}/{len(deletions)}: {folder_name}", 0)
+            if not (data_received_dir / folder_name).exists():
+                print_substep(f"✓ Already deleted: {folder_name}", 1)
+                folders_deleted += 1
+                continue
             try:
-                shutil.rmtree(folder)
-                print_substep(f"✓ Successfully deleted: {folder.name}", 1)
+                shutil.rmtree(data_received_dir / folder_name)
+                print_substep(f"✓ Successfully deleted: {folder_name}", 1)
                 folders_deleted += 1
             except Exception as e:
                 print_substep(f"✗ Error deleting folder: {e}", 1)
@@ -617,14 +1304,25 @@ def main():
     else:
         print_substep("No folders to delete", 0)
     
-    # STEP 8: Final Summary
-    print_step(8, 8, "Final Summary")
-    print_substep(f"Folders found: {len(revit_slave_folders)}", 0)
+    if journal is not None:
+        journal.finish()
+    
+    # STEP 9: Final Summary
+    print_step(9, 9, "Final Summary")
+    print_substep(f"Folders found: {len(folder_plans)}", 0)
     print_substep(f"Files copied successfully: {total_files_processed}", 0)
     print_substep(f"Files skipped (invalid): {total_files_skipped}", 0)
     print_substep(f"Initial manifest file entries: {manifest_file_count}", 0)
     print_substep(f"Files scored successfully: {files_scored}", 0)
     print_substep(f"Updated manifest file entries: {manifest_file_count_updated}", 0)
+    print_substep(f"History store rows: {history_rows_total}", 0)
+    if aggregate_report:
+        size_flag = " ⚠ over budget" if aggregate_report['over_size_budget'] else ""
+        time_flag = " ⚠ over budget" if aggregate_report['over_time_budget'] else ""
+        print_substep(f"Aggregate files size: {aggregate_report['total_bytes']:,} / "
+                      f"{aggregate_report['size_budget_bytes']:,} bytes{size_flag}", 0)
+        print_substep(f"Aggregate build time: {aggregate_report['seconds']:.3f} / "
+                      f"{aggregate_report['time_budget_seconds']:.1f} s{time_flag}", 0)
     if files_score_failed > 0:
         print_substep(f"Files failed to score: {files_score_failed}", 0)
     print_substep(f"Folders deleted: {folders_deleted}", 0)
@@ -44,6 +44,54 @@ class ScoreDashboard {
         this.updateSummary(scoreData);
     }
     
+    /**
+     * Show an average score and grade counts without per-metric widgets
+     * (the All Data view, built from the grade_distribution aggregate)
+     * @param {Object} gradeSummary - total_score, grade, grades ({A: count, ...}) and total_models
+     */
+    loadGradeSummary(gradeSummary) {
+        this.metrics = [];
+        this.widgets.forEach(widget => widget.destroy());
+        this.widgets.clear();
+        
+        const grid = document.getElementById('widgets-grid');
+        if (grid) {
+            grid.innerHTML = '';
+        }
+        
+        const summaryContainer = document.getElementById('dashboard-summary');
+        if (!summaryContainer) return;
+        
+        const totalScore = gradeSummary.total_score || 0;
+        const grade = gradeSummary.grade || 'F';
+        const grades = gradeSummary.grades || {};
+        const gradeItems = ['A', 'B', 'C', 'D', 'F'].map(letter => `
+                        <div class="status-item" style="border-color: ${this.getGradeColor(letter)}">
+                            <span class="status-count">${grades[letter] || 0}</span>
+                            <span class="status-label">Grade ${letter}</span>
+                        </div>`).join('');
+        
+        summaryContainer.innerHTML = `
+            <div class="summary-card">
+                <div class="summary-header">
+                    <h3>Average Health Score (${gradeSummary.total_models || 0} models)</h3>
+                </div>
+                
+                <div class="summary-content">
+                    <div class="overall-score">
+                        <div class="score-circle" style="background: ${this.getGradeColor(grade)}">
+                            <span class="score-value">${totalScore.toFixed(1)}</span>
+                            <span class="score-grade">${grade}</span>
+                        </div>
+                    </div>
+                    
+                    <div class="status-breakdown">${gradeItems}
+                    </div>
+                </div>
+            </div>
+        `;
+    }
+    
     renderWidgets() {
         const grid = document.getElementById('widgets-grid');
         if (!grid) return;
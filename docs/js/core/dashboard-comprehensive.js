@@ -30,8 +30,17 @@ DashboardApp.prototype.updateProjectTree = function() {
     const sourceData = Array.isArray(this.data) ? this.data : [];
     console.log('🌳 Updating project tree with', sourceData.length, 'items (full data)');
     
-    // Group data by hub, then by project, then by model
+    // Group data by hub, then by project, then by model. Hubs and projects come from the
+    // manifest index, so projects whose models are not loaded yet are listed too
     const treeData = {};
+    if (this.manifestIndex) {
+        this.manifestIndex.hubs.forEach(hub => {
+            treeData[hub.hub_name] = {};
+            hub.projects.forEach(project => {
+                treeData[hub.hub_name][project.project_name] = [];
+            });
+        });
+    }
     
     sourceData.forEach(item => {
         const hubName = item.hubName || 'Unknown Hub';
@@ -64,7 +73,7 @@ DashboardApp.prototype.updateProjectTree = function() {
         Object.entries(projects).forEach(([projectName, models]) => {
             treeHTML += `
                 <div class="tree-node">
-                    <div class="tree-item project-item expandable" data-project="${projectName}">
+                    <div class="tree-item project-item expandable" data-hub="${hubName}" data-project="${projectName}">
                         <button class="tree-toggle expanded"></button>
                         <span class="tree-icon"><img src="asset/icon/data.png" alt="Project" class="icon icon-16 icon-invert"></span>
                         <span class="tree-label">${projectName}</span>
@@ -108,23 +117,24 @@ DashboardApp.prototype.updateProjectOverview = function() {
     const projectOverviewEl = document.getElementById('projectOverview');
     if (!projectOverviewEl) return;
     
-    // Get unique project information
-    const uniqueProjects = [...new Set(this.filteredData.map(item => item.projectName))];
-    const uniqueHubs = [...new Set(this.filteredData.map(item => item.hubName))];
-    const totalModels = this.filteredData.length;
-    const totalElements = this.filteredData.reduce((sum, item) => sum + (item.totalElements || 0), 0);
-    const totalViews = this.filteredData.reduce((sum, item) => sum + (item.totalViews || 0), 0);
-    const totalWarnings = this.filteredData.reduce((sum, item) => sum + (item.warningCount || 0), 0);
+    // The All Data view comes from the score_summary aggregate, filtered views from loaded models
+    const summary = this.isAggregateView() ? this.summarizeAggregates() : null;
+    const hubCount = summary ? summary.hubs : new Set(this.filteredData.map(item => item.hubName)).size;
+    const projectCount = summary ? summary.projects : new Set(this.filteredData.map(item => item.projectName)).size;
+    const totalModels = summary ? summary.files : this.filteredData.length;
+    const totalElements = summary ? summary.totalElements : this.filteredData.reduce((sum, item) => sum + (item.totalElements || 0), 0);
+    const totalViews = summary ? summary.totalViews : this.filteredData.reduce((sum, item) => sum + (item.totalViews || 0), 0);
+    const totalWarnings = summary ? summary.totalWarnings : this.filteredData.reduce((sum, item) => sum + (item.warningCount || 0), 0);
     
     projectOverviewEl.innerHTML = `
         <div class="project-stats">
             <div class="project-stat">
                 <span class="stat-label">Hubs</span>
-                <span class="count-badge">${uniqueHubs.length}</span>
+                <span class="count-badge">${hubCount}</span>
             </div>
             <div class="project-stat">
                 <span class="stat-label">Projects</span>
-                <span class="count-badge">${uniqueProjects.length}</span>
+                <span class="count-badge">${projectCount}</span>
             </div>
             <div class="project-stat">
                 <span class="stat-label">Models</span>
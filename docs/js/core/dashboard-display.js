@@ -3,7 +3,13 @@
 
 // Stats and Table Methods
 DashboardApp.prototype.updateStats = function() {
-    const stats = {
+    const summary = this.isAggregateView() ? this.summarizeAggregates() : null;
+    const stats = summary ? {
+        totalHubs: summary.hubs,
+        totalProjects: summary.projects,
+        totalModels: summary.models,
+        totalFiles: summary.files
+    } : {
         totalHubs: new Set(this.data.map(item => item.hubName)).size,
         totalProjects: new Set(this.data.map(item => item.projectName)).size,
         totalModels: new Set(this.data.map(item => item.modelName)).size,
@@ -30,6 +36,12 @@ DashboardApp.prototype.renderTable = function() {
     
     tbody.innerHTML = '';
     
+    if (this.isAggregateView() && this.filteredData.length === 0) {
+        // Model rows are loaded per hub or project, not for the All Data view
+        tbody.innerHTML = '<tr><td colspan="9">Select a hub, project or model in the tree to load its models</td></tr>';
+        return;
+    }
+    
     this.filteredData.forEach(item => {
         const row = document.createElement('tr');
         row.innerHTML = `
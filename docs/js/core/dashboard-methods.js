@@ -44,11 +44,11 @@ DashboardApp.prototype.setupTreeInteractions = function() {
             const hubName = item.dataset.hub;
             const projectName = item.dataset.project;
             
-            if (hubName && item.classList.contains('hub-item')) {
-                this.filterByHub(hubName);
+            if (projectName && item.classList.contains('project-item')) {
+                this.filterByProject(projectName, hubName);
                 this.highlightTreeItem(item);
-            } else if (projectName && item.classList.contains('project-item')) {
-                this.filterByProject(projectName);
+            } else if (hubName && item.classList.contains('hub-item')) {
+                this.filterByHub(hubName);
                 this.highlightTreeItem(item);
             }
         });
@@ -284,8 +284,15 @@ DashboardApp.prototype.focusPreviousTreeItem = function(currentItem) {
 };
 
 // Filter Methods
-DashboardApp.prototype.filterByHub = function(hubName) {
+DashboardApp.prototype.filterByHub = async function(hubName) {
+    // The hub view loads the projects of this hub that are not loaded yet
+    const hub = this.manifestIndex && this.manifestIndex.hubs.find(entry => entry.hub_name === hubName);
+    if (hub) {
+        await Promise.all(hub.projects.map(project => this.ensureProjectLoaded(hubName, project.project_name)));
+    }
     this.filteredData = this.data.filter(item => item.hubName === hubName);
+    this.currentScope = { type: 'hub', hubName };
+    
     this.updateStats();
     this.renderTable();
     this.updateComparisonChart();
@@ -293,19 +300,24 @@ DashboardApp.prototype.filterByHub = function(hubName) {
     this.loadScoreData(); // Update score data when filtering
     this.updateFilterStatus(`Hub: ${hubName}`);
     
-    // Update current scope and show toast notification
-    this.currentScope = { type: 'hub', hubName };
+    // Show toast notification for the new scope
     this.toastNotification.showScopeNotification(this.currentScope);
     
     console.log(`Filtered by hub: ${hubName}`);
 };
 
-DashboardApp.prototype.filterByProject = function(projectName) {
-    this.filteredData = this.data.filter(item => item.projectName === projectName);
+DashboardApp.prototype.filterByProject = async function(projectName, hubName) {
+    // The project view fetches only this project's manifest shard and files, once
+    if (hubName) {
+        await this.ensureProjectLoaded(hubName, projectName);
+    }
+    this.filteredData = this.data.filter(item =>
+        item.projectName === projectName && (!hubName || item.hubName === hubName));
     
-    // Get hub name from the first item in filtered data
+    // Get hub name from the first item in filtered data when the caller did not pass it
     const firstItem = this.filteredData[0];
-    const hubName = firstItem ? firstItem.hubName : '';
+    hubName = hubName || (firstItem ? firstItem.hubName : '');
+    this.currentScope = { type: 'project', hubName, projectName };
     
     this.updateStats();
     this.renderTable();
@@ -314,8 +326,7 @@ DashboardApp.prototype.filterByProject = function(projectName) {
     this.loadScoreData(); // Update score data when filtering
     this.updateFilterStatus(`Project: ${projectName}`);
     
-    // Update current scope and show toast notification
-    this.currentScope = { type: 'project', hubName, projectName };
+    // Show toast notification for the new scope
     this.toastNotification.showScopeNotification(this.currentScope);
     
     console.log(`Filtered by project: ${projectName}`);
@@ -328,6 +339,7 @@ DashboardApp.prototype.filterByModel = function(modelName) {
     const firstItem = this.filteredData[0];
     const hubName = firstItem ? firstItem.hubName : '';
     const projectName = firstItem ? firstItem.projectName : '';
+    this.currentScope = { type: 'model', hubName, projectName, modelName };
     
     this.updateStats();
     this.renderTable();
@@ -336,8 +348,7 @@ DashboardApp.prototype.filterByModel = function(modelName) {
     this.loadScoreData(); // Update score data when filtering
     this.updateFilterStatus(`Model: ${modelName}`);
     
-    // Update current scope and show toast notification
-    this.currentScope = { type: 'model', hubName, projectName, modelName };
+    // Show toast notification for the new scope
     this.toastNotification.showScopeNotification(this.currentScope);
     
     console.log(`Filtered by model: ${modelName}`);
@@ -345,6 +356,8 @@ DashboardApp.prototype.filterByModel = function(modelName) {
 
 DashboardApp.prototype.showAllData = function() {
     this.filteredData = [...this.data];
+    this.currentScope = { type: 'all' };
+    
     this.updateStats();
     this.renderTable();
     this.updateComparisonChart();
@@ -352,8 +365,7 @@ DashboardApp.prototype.showAllData = function() {
     this.loadScoreData(); // Update score data when showing all data
     this.updateFilterStatus('All Data');
     
-    // Update current scope and show toast notification
-    this.currentScope = { type: 'all' };
+    // Show toast notification for the new scope
     this.toastNotification.showScopeNotification(this.currentScope);
     
     console.log('Showing all data');
@@ -7,6 +7,11 @@ function DashboardApp() {
     this.scoreDashboard = null;
     this.toastNotification = new ToastNotification();
     this.currentScope = { type: 'all' }; // Track current scope for toast notifications
+    this.dataLoader = new DataLoader();
+    this.manifestIndex = null;
+    this.aggregates = null; // { scoreSummary, gradeDistribution } for the All Data view
+    this.projectData = new Map(); // "hub/project" -> Promise of transformed models
+    this.loadedProjects = new Set(); // "hub/project" keys whose models are in this.data
     this.init();
 }
 
@@ -37,82 +42,18 @@ DashboardApp.prototype.loadSexyDuckData = async function() {
     try {
         console.log('🔄 Loading SexyDuck data files...');
         
-        // Load manifest to get file list
-        const manifestResponse = await fetch('asset/data/manifest.json');
-        if (!manifestResponse.ok) {
-            throw new Error(`Failed to load manifest: ${manifestResponse.status}`);
+        // Sharded v4.0 manifest: a small root index, then one shard per project
+        this.manifestIndex = await this.dataLoader.loadManifestIndex();
+        if (!this.manifestIndex) {
+            throw new Error('Failed to load manifest.v4.json');
         }
-        const manifest = await manifestResponse.json();
-        console.log(`📋 Manifest v${manifest.version}: ${manifest.total_files} files`);
+        console.log(`📋 Manifest v${this.manifestIndex.version}: ${this.manifestIndex.total_files} files`);
         
         this.data = [];
-        let loadedCount = 0;
-        let skippedCount = 0;
-        
-        // Flatten the hierarchy to get all files
-        const allFiles = [];
-        if (manifest.version === '3.0' && manifest.hubs) {
-            // v3.0: Hub → Project → Date → Models
-            for (const hub of manifest.hubs) {
-                for (const project of hub.projects) {
-                    for (const date of project.dates) {
-                        for (const model of date.models) {
-                            allFiles.push({
-                                ...model,
-                                hub: hub.hub_name,
-                                project: project.project_name,
-                                date: date.date
-                            });
-                        }
-                    }
-                }
-            }
-        } else if (manifest.files) {
-            // v2.0 or earlier: Flat file list
-            allFiles.push(...manifest.files);
-        }
-        
-        console.log(`📂 Flattened ${allFiles.length} files from manifest`);
-        
-        // Load each SexyDuck file
-        for (const fileInfo of allFiles) {
-            try {
-                console.log(`🔄 Loading file: ${fileInfo.filename}`);
-                // Encode the path to handle spaces and special characters
-                const encodedPath = encodeURI(fileInfo.relative_path);
-                const response = await fetch(`asset/data/${encodedPath}`);
-                if (!response.ok) {
-                    // Skip missing or inaccessible files silently
-                    console.log(`⚠️ Failed to load: ${fileInfo.filename} (${response.status})`);
-                    skippedCount++;
-                    continue;
-                }
-                const sexDuckData = await response.json();
-                
-                // Extract and transform the data
-                const transformedData = this.transformSexyDuckData(sexDuckData, fileInfo);
-                
-                // Debug: Check if score data exists
-                if (transformedData.modelName === '2330_TN_TY-Studio54_Theater') {
-                    console.log('🔍 Debug Studio54 Theater:', {
-                        hasScore: !!sexDuckData.score,
-                        scoreData: sexDuckData.score,
-                        modelName: transformedData.modelName,
-                        filename: fileInfo.filename,
-                        manifestModel: fileInfo.model,
-                        sexDuckModelName: sexDuckData.job_metadata?.model_name
-                    });
-                }
-                
-                // Debug: Show all model names being loaded
-                console.log(`📁 Loaded model: ${transformedData.modelName} (from ${fileInfo.filename})`);
-                
-                this.data.push(transformedData);
-                loadedCount++;
-                
-            } catch (error) {
-                console.error(`❌ Error loading ${fileInfo.filename}:`, error);
-                skippedCount++;
+        this.loadedProjects.clear();
+        for (const hub of this.manifestIndex.hubs) {
+            for (const project of hub.projects) {
+                await this.ensureProjectLoaded(hub.hub_name, project.project_name);
             }
         }
         
@@ -123,7 +64,7 @@ DashboardApp.prototype.loadSexyDuckData = async function() {
         }
         
         this.filteredData = [...this.data];
-        console.log(`✅ Loaded ${loadedCount} files successfully${skippedCount > 0 ? ` (${skippedCount} skipped)` : ''}`);
+        console.log(`✅ Loaded ${this.data.length} files successfully`);
         
     } catch (error) {
         console.error('❌ Error loading SexyDuck data:', error);
@@ -133,6 +74,45 @@ DashboardApp.prototype.loadSexyDuckData = async function() {
     }
 };
 
+/**
+ * Load and transform the models of one project, fetching only its manifest shard and files.
+ * Each project is loaded at most once.
+ * @param {string} hubName - Hub name
+ * @param {string} projectName - Project name
+ * @returns {Promise<Array>} Transformed models of the project (empty if unavailable)
+ */
+DashboardApp.prototype.loadProjectData = function(hubName, projectName) {
+    const key = `${hubName}/${projectName}`;
+    if (!this.projectData.has(key)) {
+        const request = this.dataLoader.loadProjectFiles(hubName, projectName)
+            .then(files => (files || []).map(({ fileInfo, data }) => this.transformSexyDuckData(data, fileInfo)))
+            .catch(error => {
+                console.error(`❌ Error loading project ${key}:`, error);
+                this.projectData.delete(key);
+                return [];
+            });
+        this.projectData.set(key, request);
+    }
+    return this.projectData.get(key);
+};
+
+/**
+ * Add a project's models to this.data unless they are already there
+ * @param {string} hubName - Hub name
+ * @param {string} projectName - Project name
+ */
+DashboardApp.prototype.ensureProjectLoaded = async function(hubName, projectName) {
+    const key = `${hubName}/${projectName}`;
+    if (this.loadedProjects.has(key)) {
+        return;
+    }
+    const projectData = await this.loadProjectData(hubName, projectName);
+    if (!this.loadedProjects.has(key)) {
+        this.loadedProjects.add(key);
+        this.data.push(...projectData);
+    }
+};
+
 DashboardApp.prototype.transformSexyDuckData = function(sexDuckData, fileInfo) {
     const resultData = sexDuckData.result_data || {};
     const jobMetadata = sexDuckData.job_metadata || {};
@@ -222,30 +202,71 @@ DashboardApp.prototype.loadData = async function() {
     try {
         console.log('🔄 Loading dashboard data...');
         
-        // Check if data was preloaded from hero page
-        const preloadedData = sessionStorage.getItem('dashboardData');
-        if (preloadedData) {
-            console.log('✅ Using preloaded data from hero page');
-            this.data = JSON.parse(preloadedData).map(item => ({
-                ...item,
-                timestamp: new Date(item.timestamp)
-            }));
-            // Ensure filteredData is initialized when using preloaded data
-            this.filteredData = [...this.data];
+        // The All Data view reads the precomputed aggregates; models are loaded per hub or project on demand
+        const [manifestIndex, scoreSummary, gradeDistribution] = await Promise.all([
+            this.dataLoader.loadManifestIndex(),
+            this.dataLoader.loadAggregate('score_summary'),
+            this.dataLoader.loadAggregate('grade_distribution')
+        ]);
+        
+        if (!manifestIndex || !scoreSummary || !gradeDistribution) {
+            console.log('🔄 No dashboard aggregates found, loading from SexyDuck files...');
+            await this.loadSexyDuckData();
             return;
         }
         
-        console.log('🔄 No preloaded data found, loading from SexyDuck files...');
-        
-        // Load actual SexyDuck data files
-        await this.loadSexyDuckData();
-        return;
+        this.manifestIndex = manifestIndex;
+        this.aggregates = { scoreSummary, gradeDistribution };
+        this.data = [];
+        this.filteredData = [];
+        this.loadedProjects.clear();
+        this.currentScope = { type: 'all' };
+        console.log(`✅ Loaded aggregates for ${scoreSummary.length} hub/project/date groups; models load on demand`);
     } catch (error) {
         console.error('Error loading data:', error);
         this.showError(`Failed to load data: ${error.message}`);
     }
 };
 
+/**
+ * True while the All Data view is shown from the precomputed aggregates instead of loaded models
+ * @returns {boolean}
+ */
+DashboardApp.prototype.isAggregateView = function() {
+    return this.aggregates !== null && this.currentScope.type === 'all';
+};
+
+/**
+ * Counts and totals of the All Data view from the score_summary and grade_distribution aggregates
+ * @returns {Object} hubs, projects, models (latest snapshot of each), files, totals, average score and grades
+ */
+DashboardApp.prototype.summarizeAggregates = function() {
+    const { scoreSummary, gradeDistribution } = this.aggregates;
+    const summary = {
+        hubs: new Set(scoreSummary.map(entry => entry.hub)).size,
+        projects: new Set(scoreSummary.map(entry => `${entry.hub}/${entry.project}`)).size,
+        models: gradeDistribution.total_models || 0,
+        files: 0,
+        totalElements: 0,
+        totalViews: 0,
+        totalWarnings: 0,
+        averageScore: 0,
+        grades: gradeDistribution.overall || {}
+    };
+    
+    let scoreSum = 0;
+    scoreSummary.forEach(entry => {
+        const totals = entry.totals || {};
+        summary.files += entry.models;
+        summary.totalElements += totals.total_elements || 0;
+        summary.totalViews += totals.total_views || 0;
+        summary.totalWarnings += totals.warning_count || 0;
+        scoreSum += entry.avg_score * entry.models;
+    });
+    summary.averageScore = summary.files > 0 ? Math.round(scoreSum / summary.files * 100) / 100 : 0;
+    return summary;
+};
+
 DashboardApp.prototype.setupEventListeners = function() {
     // Search functionality
     const searchInput = document.getElementById('searchInput');
@@ -991,6 +1012,18 @@ DashboardApp.prototype.loadScoreData = function() {
     console.log('🔍 scoreDashboard exists:', !!this.scoreDashboard);
     console.log('🔍 filteredData length:', this.filteredData ? this.filteredData.length : 'undefined');
     
+    if (this.scoreDashboard && this.isAggregateView()) {
+        const summary = this.summarizeAggregates();
+        this.scoreDashboard.loadGradeSummary({
+            total_score: summary.averageScore,
+            grade: this.calculateGrade(summary.averageScore),
+            grades: summary.grades,
+            total_models: summary.models
+        });
+        console.log('✅ Grade distribution loaded from aggregates');
+        return;
+    }
+    
     if (!this.scoreDashboard || this.filteredData.length === 0) {
         console.log('⚠️ No score dashboard or filtered data available');
         return;
@@ -11,6 +11,9 @@ class DataLoader {
         this.dataPath = 'asset/data/';
         this.supportedFormats = ['.json', '.sexyDuck'];
         this.pluginManager = new PluginManager();
+        this.shardCache = new Map();
+        this.manifestIndex = null;
+        this.aggregatesIndex = null;
     }
     
     /**
@@ -56,7 +59,8 @@ class DataLoader {
                                 ...model,
                                 hub: hub.hub_name,
                                 project: project.project_name,
-                                date: date.date
+                                date: date.date,
+                                scoreIndex: date.score_index
                             });
                         }
                     }
@@ -630,6 +634,181 @@ class DataLoader {
         return null;
     }
     
+    /**
+     * Load the sharded v4.0 manifest root index (hubs and projects with totals), once
+     * @returns {Promise<Object|null>} Root index or null
+     */
+    async loadManifestIndex() {
+        if (!this.manifestIndex) {
+            this.manifestIndex = fetch(`${this.dataPath}manifest.v4.json`)
+                .then(response => response.ok ? response.json() : null)
+                .catch(() => {
+                    console.log('No v4 manifest index found');
+                    return null;
+                });
+        }
+        return this.manifestIndex;
+    }
+    
+    /**
+     * File entries of one project from the v4.0 manifest, fetching only that project's shard.
+     * Entries have the same shape as the v3.0 flattening (hub, project, date, scoreIndex).
+     * @param {string} hubName - Hub name
+     * @param {string} projectName - Project name
+     * @returns {Promise<Array|null>} File entries, or null if the project is not in the index
+     */
+    async getProjectFiles(hubName, projectName) {
+        const index = await this.loadManifestIndex();
+        const hub = index && index.hubs.find(entry => entry.hub_name === hubName);
+        const project = hub && hub.projects.find(entry => entry.project_name === projectName);
+        if (!project) {
+            console.log(`Project not in v4 manifest index: ${hubName} / ${projectName}`);
+            return null;
+        }
+        
+        const shard = await this.loadProjectShard(project);
+        const projectFiles = [];
+        for (const date of shard.dates) {
+            for (const model of date.models) {
+                projectFiles.push({
+                    ...model,
+                    hub: shard.hub_name,
+                    project: shard.project_name,
+                    date: date.date,
+                    scoreIndex: date.score_index
+                });
+            }
+        }
+        return projectFiles;
+    }
+    
+    /**
+     * Load the files of one project on demand from the v4.0 manifest: only its shard, its
+     * files and their score indexes are fetched. Files that cannot be loaded are skipped.
+     * @param {string} hubName - Hub name
+     * @param {string} projectName - Project name
+     * @returns {Promise<Array|null>} { fileInfo, data } per file (score merged into data),
+     *          or null if the project is not in the index
+     */
+    async loadProjectFiles(hubName, projectName) {
+        const projectFiles = await this.getProjectFiles(hubName, projectName);
+        if (!projectFiles) {
+            return null;
+        }
+        console.log(`📂 Loading ${projectFiles.length} files of ${hubName} / ${projectName} from its shard`);
+        
+        const loaded = await Promise.all(projectFiles.map(async fileInfo => {
+            try {
+                const { data } = await this.loadDataFile(encodeURI(fileInfo.relative_path));
+                // Scores are stored in a per-date score index, not in the data file
+                if (fileInfo.scoreIndex) {
+                    const scores = await this.loadScoreIndex(fileInfo.scoreIndex);
+                    if (scores[fileInfo.model_name]) {
+                        data.score = scores[fileInfo.model_name];
+                    }
+                }
+                return { fileInfo, data };
+            } catch (error) {
+                console.log(`⚠️ Failed to load: ${fileInfo.filename} (${error.message})`);
+                return null;
+            }
+        }));
+        return loaded.filter(file => file !== null);
+    }
+    
+    /**
+     * Load one project on demand from the v4.0 manifest (see loadProjectFiles)
+     * @param {string} hubName - Hub name
+     * @param {string} projectName - Project name
+     * @returns {Promise<Object|null>} Aggregated data of the project, or null if it is not in the index
+     */
+    async loadProject(hubName, projectName) {
+        const projectFiles = await this.loadProjectFiles(hubName, projectName);
+        if (!projectFiles) {
+            return null;
+        }
+        return this.processDataFiles(projectFiles.map(({ fileInfo, data }) => ({
+            filename: fileInfo.relative_path,
+            data,
+            timestamp: new Date()
+        })));
+    }
+    
+    /**
+     * Load a per-date score index once and cache it ({ model name: score data })
+     * @param {string} scoreIndexPath - Path relative to the data folder
+     * @returns {Promise<Object>} Scores keyed by model name (empty if unavailable)
+     */
+    loadScoreIndex(scoreIndexPath) {
+        if (!this.scoreIndexCache) {
+            this.scoreIndexCache = new Map();
+        }
+        if (!this.scoreIndexCache.has(scoreIndexPath)) {
+            const request = fetch(`${this.dataPath}${encodeURI(scoreIndexPath)}`)
+                .then(response => response.ok ? response.json() : {})
+                .then(index => index.scores || {})
+                .catch(() => ({}));
+            this.scoreIndexCache.set(scoreIndexPath, request);
+        }
+        return this.scoreIndexCache.get(scoreIndexPath);
+    }
+    
+    /**
+     * Load a project shard on demand (shards are content-hashed, so cache by path)
+     * @param {Object} project - Project entry from the v4.0 root index
+     * @returns {Promise<Object>} Shard with hub_name, project_name and dates
+     */
+    async loadProjectShard(project) {
+        if (!this.shardCache.has(project.shard)) {
+            const request = fetch(`${this.dataPath}${encodeURI(project.shard)}`).then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                }
+                return response.json();
+            });
+            this.shardCache.set(project.shard, request);
+        }
+        return this.shardCache.get(project.shard);
+    }
+    
+    /**
+     * Load the precomputed aggregates index (_aggregates/index.json), once per loader
+     * @returns {Promise<Object|null>} Index mapping aggregate names to hashed files, or null if missing
+     */
+    async loadAggregatesIndex() {
+        if (!this.aggregatesIndex) {
+            this.aggregatesIndex = fetch(`${this.dataPath}_aggregates/index.json`)
+                .then(response => response.ok ? response.json() : null)
+                .catch(() => {
+                    console.log('No aggregates index found');
+                    return null;
+                });
+        }
+        return this.aggregatesIndex;
+    }
+    
+    /**
+     * Load one precomputed aggregate built by the merge step (e.g. score_summary, grade_distribution).
+     * The files are content-hashed, so the browser may cache them indefinitely.
+     * @param {string} name - Aggregate name
+     * @returns {Promise<Object|Array|null>} Aggregate data, or null if unavailable
+     */
+    async loadAggregate(name) {
+        const index = await this.loadAggregatesIndex();
+        const entry = index && index.files && index.files[name];
+        if (!entry) {
+            console.log(`Aggregate not available: ${name}`);
+            return null;
+        }
+        try {
+            const response = await fetch(`${this.dataPath}${encodeURI(entry.path)}`);
+            return response.ok ? await response.json() : null;
+        } catch (error) {
+            console.log(`Failed to load aggregate ${name}:`, error);
+            return null;
+        }
+    }
+    
     /**
      * Get current aggregated data
      * @returns {Object} Current aggregated data
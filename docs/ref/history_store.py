@@ -0,0 +1,347 @@
+"""
+HealthMetric History Store
+Keeps one row per (hub, project, date, model) with score totals and the raw
+extracted metric values, so trend and percentile questions can be answered
+without opening every weekly .sexyDuck snapshot.
+
+The database is a local/CI working file, not published data: it lives in
+_history/ at the repository root (gitignored), outside docs/ which GitHub
+Pages serves and the daily merge commits. A fresh checkout rebuilds it from
+the scores already in the tree (rebuild_from_tree).
+
+Simple usage:
+    from history_store import HistoryStore, HISTORY_PATH
+    with HistoryStore(HISTORY_PATH) as store:
+        store.trend('High Warnings', hub='Ennead Architects LLP')
+        store.percentile('total_score', 50, date='2025-10-06')
+"""
+
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from scoring import SCORING_METRICS, read_score
+
+
+# =============================================================================
+# SCHEMA - One column per scoring metric, keyed by the data tree hierarchy
+# =============================================================================
+HISTORY_FILENAME = 'history.sqlite'
+HISTORY_PATH = Path(__file__).resolve().parent.parent.parent / '_history' / HISTORY_FILENAME
+
+KEY_COLUMNS = ['hub', 'project', 'date', 'model']
+SCORE_COLUMNS = ['total_score', 'grade']
+
+
+def metric_column(metric_name: str) -> str:
+    """
+    Convert a scoring metric name to its history column name.
+
+    Example: 'Views not on Sheets' -> 'views_not_on_sheets'
+    """
+    return re.sub(r'[^0-9a-z]+', '_', metric_name.lower()).strip('_')
+
+
+METRIC_COLUMNS = {name: metric_column(name) for name in SCORING_METRICS}
+
+
+# =============================================================================
+# HISTORY STORE
+# =============================================================================
+
+class HistoryStore:
+    """SQLite-backed columnar history of model scores and metrics"""
+
+    def __init__(self, db_path):
+        """
+        Open (or create) the history database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self._ensure_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Commit pending rows and close the database."""
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def _ensure_schema(self) -> None:
+        """Create the snapshots table and indexes, adding new metric columns if needed."""
+        metric_defs = ', '.join(f'{col} REAL' for col in METRIC_COLUMNS.values())
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS snapshots ('
+            'hub TEXT NOT NULL, project TEXT NOT NULL, date TEXT NOT NULL, model TEXT NOT NULL, '
+            f'total_score REAL, grade TEXT, {metric_defs}, '
+            'PRIMARY KEY (hub, project, date, model))'
+        )
+
+        # Scoring metrics may be added after the database was created
+        existing = {row[1] for row in self.conn.execute('PRAGMA table_info(snapshots)')}
+        for col in METRIC_COLUMNS.values():
+            if col not in existing:
+                self.conn.execute(f'ALTER TABLE snapshots ADD COLUMN {col} REAL')
+
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_snapshots_date ON snapshots (date)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_snapshots_model ON snapshots (hub, project, model, date)')
+        self.conn.commit()
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def record(self, hub: str, project: str, date: str, model: str,
+               score_data: Dict[str, Any]) -> None:
+        """
+        Insert or update the row for one scored model snapshot.
+
+        Args:
+            hub: Hub name
+            project: Project name
+            date: Snapshot date folder (YYYY-MM-DD)
+            model: Model name
+            score_data: Result of scoring.calculate_score (uses 'actual' values)
+        """
+        self.record_many([(hub, project, date, model, score_data)])
+
+    def record_many(self, rows: Iterable[Tuple[str, str, str, str, Dict[str, Any]]]) -> int:
+        """
+        Insert or update many snapshot rows in a single transaction.
+
+        Args:
+            rows: Iterable of (hub, project, date, model, score_data) tuples
+
+        Returns:
+            int: Number of rows written
+        """
+        columns = KEY_COLUMNS + SCORE_COLUMNS + list(METRIC_COLUMNS.values())
+        placeholders = ', '.join('?' for _ in columns)
+        updates = ', '.join(f'{col} = excluded.{col}' for col in columns[len(KEY_COLUMNS):])
+        sql = (
+            f'INSERT INTO snapshots ({", ".join(columns)}) VALUES ({placeholders}) '
+            f'ON CONFLICT (hub, project, date, model) DO UPDATE SET {updates}'
+        )
+
+        values = []
+        for hub, project, date, model, score_data in rows:
+            actuals = {m['metric']: m.get('actual') for m in score_data.get('metrics', [])}
+            values.append(
+                [hub, project, date, model, score_data.get('total_score'), score_data.get('grade')]
+                + [actuals.get(name) for name in METRIC_COLUMNS]
+            )
+
+        with self.conn:
+            self.conn.executemany(sql, values)
+        return len(values)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def _resolve_column(self, field: str) -> str:
+        """Map a metric name or score column to a safe column name."""
+        if field in SCORE_COLUMNS:
+            return field
+        if field in METRIC_COLUMNS:
+            return METRIC_COLUMNS[field]
+        if field in METRIC_COLUMNS.values():
+            return field
+        raise ValueError(f"Unknown history field: {field}")
+
+    @staticmethod
+    def _where(filters: Dict[str, Optional[str]], since: Optional[str] = None,
+               until: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause from hierarchy filters and a date range."""
+        clauses = []
+        params: List[Any] = []
+        for col, value in filters.items():
+            if value is not None:
+                clauses.append(f'{col} = ?')
+                params.append(value)
+        if since is not None:
+            clauses.append('date >= ?')
+            params.append(since)
+        if until is not None:
+            clauses.append('date <= ?')
+            params.append(until)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def trend(self, field: str, hub: Optional[str] = None, project: Optional[str] = None,
+              model: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return the values of one metric (or 'total_score') over time.
+
+        Args:
+            field: Metric name (e.g. 'High Warnings') or 'total_score'/'grade'
+            hub, project, model: Optional hierarchy filters
+            since, until: Optional inclusive date range (YYYY-MM-DD)
+
+        Returns:
+            List of dicts with hub, project, model, date and value, ordered by date
+        """
+        col = self._resolve_column(field)
+        where, params = self._where({'hub': hub, 'project': project, 'model': model}, since, until)
+        sql = (
+            f'SELECT hub, project, model, date, {col} FROM snapshots{where} '
+            'ORDER BY date, hub, project, model'
+        )
+        return [
+            {'hub': h, 'project': p, 'model': m, 'date': d, 'value': v}
+            for h, p, m, d, v in self.conn.execute(sql, params)
+        ]
+
+    def values(self, field: str, hub: Optional[str] = None, project: Optional[str] = None,
+               date: Optional[str] = None) -> List[float]:
+        """
+        Return the sorted, non-null values of a field for a cohort.
+
+        Args:
+            field: Metric name or 'total_score'
+            hub, project, date: Optional cohort filters
+        """
+        col = self._resolve_column(field)
+        where, params = self._where({'hub': hub, 'project': project, 'date': date})
+        where += (' AND ' if where else ' WHERE ') + f'{col} IS NOT NULL'
+        sql = f'SELECT {col} FROM snapshots{where} ORDER BY {col}'
+        return [row[0] for row in self.conn.execute(sql, params)]
+
+    def percentile(self, field: str, q: float, hub: Optional[str] = None,
+                   project: Optional[str] = None, date: Optional[str] = None) -> Optional[float]:
+        """
+        Linear-interpolated percentile of a field across a cohort.
+
+        Args:
+            field: Metric name or 'total_score'
+            q: Percentile between 0 and 100
+            hub, project, date: Optional cohort filters
+
+        Returns:
+            Percentile value, or None if the cohort is empty
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {q}")
+
+        values = self.values(field, hub=hub, project=project, date=date)
+        if not values:
+            return None
+
+        position = (len(values) - 1) * q / 100
+        lower = int(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    def _select_snapshots(self, where: str, params: List[Any], order: str,
+                          limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Run a snapshot query and unpack rows into dicts with a 'metrics' mapping."""
+        names = list(METRIC_COLUMNS)
+        columns = KEY_COLUMNS + SCORE_COLUMNS + [METRIC_COLUMNS[name] for name in names]
+        sql = f'SELECT {", ".join(columns)} FROM snapshots{where} ORDER BY {order}'
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+
+        rows = []
+        offset = len(KEY_COLUMNS) + len(SCORE_COLUMNS)
+        for record in self.conn.execute(sql, params):
+            row = dict(zip(KEY_COLUMNS + SCORE_COLUMNS, record[:offset]))
+            row['metrics'] = dict(zip(names, record[offset:]))
+            rows.append(row)
+        return rows
+
+    def snapshots(self, hub: Optional[str] = None, project: Optional[str] = None,
+                  date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return full snapshot rows with their stored metric values.
+
+        Args:
+            hub, project, date: Optional cohort filters
+
+        Returns:
+            List of dicts with hub, project, date, model, total_score, grade and
+            'metrics' (metric name -> stored actual value, None if not recorded)
+        """
+        where, params = self._where({'hub': hub, 'project': project, 'date': date})
+        return self._select_snapshots(where, params, 'hub, project, model, date')
+
+    def snapshot(self, hub: str, project: str, date: str, model: str) -> Optional[Dict[str, Any]]:
+        """Return one snapshot row (see snapshots), or None if it is not recorded."""
+        where, params = self._where({'hub': hub, 'project': project, 'date': date, 'model': model})
+        rows = self._select_snapshots(where, params, 'date', limit=1)
+        return rows[0] if rows else None
+
+    def previous_snapshot(self, hub: str, project: str, model: str, date: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the most recent snapshot of a model before a date.
+        Served by the (hub, project, model, date) index, so it never scans the table.
+
+        Args:
+            hub, project, model: Model identity
+            date: Snapshot date (YYYY-MM-DD); only earlier dates are considered
+
+        Returns:
+            Snapshot row (see snapshots), or None for a model's first snapshot
+        """
+        where, params = self._where({'hub': hub, 'project': project, 'model': model})
+        where += ' AND date < ?'
+        rows = self._select_snapshots(where, params + [date], 'date DESC', limit=1)
+        return rows[0] if rows else None
+
+    def dates(self) -> List[str]:
+        """Return all snapshot dates in the store, oldest first."""
+        return [row[0] for row in self.conn.execute('SELECT DISTINCT date FROM snapshots ORDER BY date')]
+
+    def count(self) -> int:
+        """Return the number of snapshot rows."""
+        return self.conn.execute('SELECT COUNT(*) FROM snapshots').fetchone()[0]
+
+
+# =============================================================================
+# BACKFILL - Rebuild the store from already-scored files
+# =============================================================================
+
+def rebuild_from_tree(data_dir, db_path=None) -> int:
+    """
+    Populate the history store from scored .sexyDuck files in a Hub/Project/Date tree.
+    Files without a stored score (score index or embedded 'score' key) are skipped.
+
+    Args:
+        data_dir: Root of the Hub/Project/Date hierarchy (docs/asset/data)
+        db_path: Optional database path (defaults to HISTORY_PATH)
+
+    Returns:
+        int: Number of rows written
+    """
+    data_dir = Path(data_dir)
+    db_path = Path(db_path) if db_path else HISTORY_PATH
+
+    rows = []
+    for file_path in sorted(data_dir.rglob('*.sexyDuck')):
+        parts = file_path.relative_to(data_dir).parts
+        if len(parts) != 4:
+            continue
+        score_data = read_score(file_path)
+        if score_data:
+            rows.append((parts[0], parts[1], parts[2], file_path.stem, score_data))
+
+    with HistoryStore(db_path) as store:
+        return store.record_many(rows)
+
+
+if __name__ == '__main__':
+    import sys
+
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parent.parent / 'asset' / 'data'
+    written = rebuild_from_tree(target)
+    print(f"History store rebuilt: {written} row(s) written to {HISTORY_PATH}")
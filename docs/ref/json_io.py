@@ -0,0 +1,152 @@
+"""
+HealthMetric JSON Serialization
+One place for reading and writing JSON. Uses a faster backend when one is
+installed (orjson, then msgspec) and the standard library json module otherwise.
+
+Every call site picks a mode:
+    pretty   2-space indented, for files people read or diff (score indexes, manifests)
+    compact  no whitespace, for caches and transport payloads
+
+Output is UTF-8 with non-ASCII characters kept as-is in every backend.
+Differences from stdlib json are handled here instead of at the call sites:
+    - Input a fast backend rejects (e.g. NaN/Infinity literals) is parsed again
+      with stdlib json, so it is accepted exactly as before
+    - Values a fast backend cannot encode (non-string keys, integers beyond 64 bits)
+      are encoded with stdlib json
+    - Decode errors are always json.JSONDecodeError
+Known differences with a fast backend: integers beyond 64 bits decode as floats,
+NaN/Infinity values encode as null, and float exponents are written as 1e300
+instead of 1e+300. None of these occur in HealthMetric data.
+
+Simple usage:
+    import json_io
+    data = json_io.load('docs/asset/data/Hub/Project/2025-10-06/Model.sexyDuck')
+    payload_bytes = json_io.dumpb(data)                  # compact
+    text = json_io.dumps(data, pretty=True, sort_keys=True)
+
+Set HEALTHMETRIC_JSON_BACKEND=json to force the standard library.
+"""
+
+import json
+import os
+from typing import Any, Union
+
+JSONDecodeError = json.JSONDecodeError
+
+
+# =============================================================================
+# BACKEND SELECTION
+# =============================================================================
+
+orjson = None
+msgspec = None
+_requested = os.environ.get('HEALTHMETRIC_JSON_BACKEND', '').strip().lower()
+
+if _requested in ('', 'orjson'):
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+if orjson is None and _requested in ('', 'msgspec'):
+    try:
+        import msgspec
+    except ImportError:
+        msgspec = None
+
+BACKEND = 'orjson' if orjson is not None else 'msgspec' if msgspec is not None else 'json'
+
+if msgspec is not None:
+    _msgspec_encoder = msgspec.json.Encoder()
+    _msgspec_sorted_encoder = msgspec.json.Encoder(order='sorted')
+    _msgspec_decoder = msgspec.json.Decoder()
+
+
+# =============================================================================
+# DECODING
+# =============================================================================
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Parse JSON from bytes (UTF-8) or text.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    elif msgspec is not None:
+        try:
+            return _msgspec_decoder.decode(data.encode('utf-8') if isinstance(data, str) else data)
+        except msgspec.DecodeError:
+            pass
+
+    # Standard library path, also the second opinion for input a fast backend rejects
+    if not isinstance(data, str):
+        data = bytes(data).decode('utf-8')
+    return json.loads(data)
+
+
+def load(file_path) -> Any:
+    """Read and parse a JSON file."""
+    with open(file_path, 'rb') as f:
+        return loads(f.read())
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def _stdlib_dumps(obj: Any, pretty: bool, sort_keys: bool) -> str:
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, sort_keys=sort_keys)
+
+
+def dumpb(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serializable data
+        pretty: 2-space indentation (True) or compact (False)
+        sort_keys: Sort object keys
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if pretty else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    elif msgspec is not None:
+        try:
+            encoded = (_msgspec_sorted_encoder if sort_keys else _msgspec_encoder).encode(obj)
+            return msgspec.json.format(encoded, indent=2) if pretty else encoded
+        except (TypeError, OverflowError, msgspec.EncodeError):
+            pass
+    return _stdlib_dumps(obj, pretty, sort_keys).encode('utf-8')
+
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> str:
+    """Serialize to a JSON string (see dumpb)."""
+    if orjson is None and msgspec is None:
+        return _stdlib_dumps(obj, pretty, sort_keys)
+    return dumpb(obj, pretty, sort_keys).decode('utf-8')
+
+
+def dump(obj: Any, file_path, pretty: bool = False, sort_keys: bool = False) -> int:
+    """
+    Write JSON to a file (not atomic; see scoring.write_json_atomic).
+
+    Returns:
+        Number of bytes written
+    """
+    payload = dumpb(obj, pretty, sort_keys)
+    with open(file_path, 'wb') as f:
+        f.write(payload)
+    return len(payload)
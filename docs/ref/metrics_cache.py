@@ -0,0 +1,347 @@
+"""
+HealthMetric Extracted-Metrics Cache
+Remembers the scoring inputs (the values returned by extract_metrics), the
+identity fields and the summary counts of every .sexyDuck file, keyed by a hash of the file content,
+so unchanged files are never parsed again for scoring.
+
+A file is looked up by its path and validated by its content hash, never by
+its mtime: a fresh checkout (CI) resets every mtime, and the cache would
+otherwise be reparsed and rewritten on every run. Files are only parsed when
+their hash is new, and the cache file is only written when its entries change.
+Within one session a file whose size and mtime were already checked is not
+hashed again.
+
+Simple usage:
+    from metrics_cache import MetricsCache
+    with MetricsCache('docs/asset/data/metrics_cache.json') as cache:
+        entry = cache.get('docs/asset/data/Hub/Project/2025-10-06/Model.sexyDuck')
+        entry['metrics']['High Warnings'], entry['hub'], entry['total_elements']
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import json_io
+from scoring import extract_metrics, validate_sexy_duck_data, write_json_atomic
+
+
+# =============================================================================
+# CACHE FORMAT - Column lists plus one array per content hash
+# =============================================================================
+METRICS_CACHE_FILENAME = 'metrics_cache.json'
+
+# Bump when extract_metrics or the file format changes so stale values are discarded
+CACHE_VERSION = 3
+
+IDENTITY_FIELDS = ['hub', 'project', 'model', 'timestamp', 'file_size_bytes']
+
+# Totals shown on the landing page and in the dashboard aggregates (0 for mock exports)
+SUMMARY_FIELDS = ['total_elements', 'total_views', 'total_sheets', 'warning_count']
+
+ROW_FIELDS = IDENTITY_FIELDS + SUMMARY_FIELDS
+
+
+# Below this many files to parse, a process pool costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+
+def content_hash(payload_bytes: bytes) -> str:
+    """Return the content hash used as cache key."""
+    return hashlib.sha256(payload_bytes).hexdigest()[:32]
+
+
+def parse_entry(payload_bytes: bytes, source: str) -> Tuple[list, Dict[str, float]]:
+    """
+    Parse and validate a .sexyDuck payload and extract its scoring inputs.
+
+    Args:
+        payload_bytes: Raw file content
+        source: File name used in validation errors
+
+    Returns:
+        tuple: (identity and summary values in ROW_FIELDS order, extracted metrics)
+
+    Raises:
+        ValueError: If the payload is not valid scoring input
+    """
+    data = json_io.loads(payload_bytes)
+    validate_sexy_duck_data(data, source)
+    job_metadata = data.get('job_metadata', {})
+    identity = [
+        job_metadata.get('hub_name'),
+        job_metadata.get('project_name'),
+        job_metadata.get('model_name'),
+        job_metadata.get('timestamp'),
+        job_metadata.get('model_file_size_bytes')
+    ]
+    result_data = data.get('result_data') or {}
+    if result_data.get('mock_mode') is True or 'placeholder_metrics' in result_data:
+        summary = [0] * len(SUMMARY_FIELDS)
+    else:
+        views_sheets = result_data.get('views_sheets') or {}
+        summary = [
+            result_data.get('total_elements') or 0,
+            views_sheets.get('total_views') or 0,
+            views_sheets.get('total_sheets') or 0,
+            result_data.get('warning_count') or 0
+        ]
+    return identity + summary, extract_metrics(data)
+
+
+# =============================================================================
+# PARALLEL LOADING - Worker side of MetricsCache.prefetch
+# =============================================================================
+
+_known_digests = frozenset()
+
+
+def _init_worker(known_digests) -> None:
+    global _known_digests
+    _known_digests = known_digests
+
+
+def _load_entry(file_path: str) -> Tuple[str, Any]:
+    """
+    Hash a file and parse it if its hash is not cached yet (runs in a worker process).
+
+    Returns:
+        tuple: ('ok', (digest, stamp, identity, metrics)) - identity/metrics are None
+               for an already cached hash - or ('error', message)
+    """
+    try:
+        stat = os.stat(file_path)
+        with open(file_path, 'rb') as f:
+            payload_bytes = f.read()
+        digest = content_hash(payload_bytes)
+        if digest in _known_digests:
+            return 'ok', (digest, [stat.st_size, stat.st_mtime_ns], None, None)
+        identity, metrics = parse_entry(payload_bytes, file_path)
+        return 'ok', (digest, [stat.st_size, stat.st_mtime_ns], identity, metrics)
+    except Exception as e:
+        return 'error', str(e)
+
+
+# =============================================================================
+# METRICS CACHE
+# =============================================================================
+
+class MetricsCache:
+    """Content-hash keyed cache of extracted scoring metrics"""
+
+    def __init__(self, cache_path, root_dir=None, read_only: bool = False):
+        """
+        Open (or start) a metrics cache.
+
+        Args:
+            cache_path: Path to the cache JSON file
+            root_dir: Directory that file paths are stored relative to (default: cache folder)
+            read_only: Never write the cache file (e.g. for dry runs)
+        """
+        self.cache_path = Path(cache_path)
+        self.root_dir = Path(root_dir) if root_dir else self.cache_path.parent
+        self.read_only = read_only
+        self.metric_names: List[str] = []
+        self.entries: Dict[str, list] = {}
+        self.files: Dict[str, list] = {}
+        # [size, mtime_ns] of files hashed this session - never written to the cache file
+        self._verified: Dict[str, list] = {}
+        self.hits = 0
+        self.misses = 0
+        self._prefetched = set()
+        self._dirty = False
+        self._load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.save()
+
+    def _load(self) -> None:
+        """Read the cache file; an unreadable or outdated cache simply starts empty."""
+        if not self.cache_path.exists():
+            return
+        try:
+            data = json_io.load(self.cache_path)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != CACHE_VERSION or data.get('fields') != ROW_FIELDS:
+            return
+        self.metric_names = data.get('metrics', [])
+        self.entries = data.get('entries', {})
+        self.files = data.get('files', {})
+
+    def save(self) -> int:
+        """
+        Write the cache compactly if anything changed.
+
+        Returns:
+            int: Bytes written (0 if unchanged or read-only)
+        """
+        if self.read_only or not self._dirty:
+            return 0
+        written = write_json_atomic(self.cache_path, {
+            'version': CACHE_VERSION,
+            'fields': ROW_FIELDS,
+            'metrics': self.metric_names,
+            'entries': self.entries,
+            'files': self.files
+        })
+        self._dirty = False
+        return written
+
+    def _relative(self, file_path: Path) -> str:
+        try:
+            return str(file_path.resolve().relative_to(self.root_dir.resolve())).replace('\\', '/')
+        except ValueError:
+            return str(file_path.resolve()).replace('\\', '/')
+
+    def _unpack(self, row: list) -> Dict[str, Any]:
+        entry = dict(zip(ROW_FIELDS, row[:len(ROW_FIELDS)]))
+        entry['metrics'] = dict(zip(self.metric_names, row[len(ROW_FIELDS):]))
+        return entry
+
+    def get(self, file_path) -> Dict[str, Any]:
+        """
+        Return identity fields and extracted metrics for a .sexyDuck file.
+
+        Args:
+            file_path: Path to the .sexyDuck file
+
+        Returns:
+            dict: hub, project, model, timestamp, file_size_bytes, the SUMMARY_FIELDS totals,
+                  content_hash and 'metrics' (same values as extract_metrics)
+
+        Raises:
+            ValueError: If the file is not valid scoring input (never cached)
+        """
+        file_path = Path(file_path)
+        key = self._relative(file_path)
+        stat = file_path.stat()
+        stamp = [stat.st_size, stat.st_mtime_ns]
+
+        # Already hashed this session and unchanged since: no need to read the file again
+        known = self.files.get(key)
+        if known and self._verified.get(key) == stamp and known[0] in self.entries:
+            # Files loaded by prefetch were already counted there
+            if key in self._prefetched:
+                self._prefetched.discard(key)
+            else:
+                self.hits += 1
+            entry = self._unpack(self.entries[known[0]])
+            entry['content_hash'] = known[0]
+            return entry
+
+        payload_bytes = file_path.read_bytes()
+        digest = content_hash(payload_bytes)
+        if digest in self.entries:
+            self._store(key, digest, stamp)
+        else:
+            identity, metrics = parse_entry(payload_bytes, str(file_path))
+            self._store(key, digest, stamp, identity, metrics)
+        entry = self._unpack(self.entries[digest])
+        entry['content_hash'] = digest
+        return entry
+
+    def _store(self, key: str, digest: str, stamp: list, identity: Optional[list] = None,
+               metrics: Optional[Dict[str, float]] = None) -> None:
+        """
+        Record a file's content hash, adding a new entry when identity and metrics are given.
+        The cache is only marked dirty when a stored entry actually changes.
+        """
+        if metrics is None and digest in self.entries:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if not self.metric_names:
+                self.metric_names = list(metrics)
+            elif list(metrics) != self.metric_names:
+                # Metric set changed since the cache was written - start over
+                self.metric_names = list(metrics)
+                self.entries = {}
+                self.files = {}
+            self.entries[digest] = identity + [metrics[name] for name in self.metric_names]
+            self._dirty = True
+
+        self._verified[key] = stamp
+        known = [digest, stamp[0]]
+        if self.files.get(key) != known:
+            self.files[key] = known
+            self._dirty = True
+
+    def prefetch(self, file_paths: Iterable, workers: int) -> Dict[str, str]:
+        """
+        Hash files not yet checked this session in a process pool, parsing only new hashes,
+        so later get() calls are hits. Does nothing for one worker or only a few files.
+
+        Args:
+            file_paths: .sexyDuck files about to be read
+            workers: Number of worker processes
+
+        Returns:
+            dict: File path -> error message for files that could not be loaded
+        """
+        pending = []
+        for file_path in file_paths:
+            file_path = Path(file_path)
+            key = self._relative(file_path)
+            known = self.files.get(key)
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            if not (known and self._verified.get(key) == [stat.st_size, stat.st_mtime_ns] and known[0] in self.entries):
+                pending.append(file_path)
+
+        if workers <= 1 or len(pending) < PARALLEL_MIN_FILES:
+            return {}
+
+        errors = {}
+        # Several chunks per worker keep the pool busy when file sizes vary
+        chunksize = max(1, len(pending) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(frozenset(self.entries),)) as pool:
+            for file_path, (status, result) in zip(pending, pool.map(_load_entry, map(str, pending), chunksize=chunksize)):
+                if status == 'error':
+                    errors[str(file_path)] = result
+                    continue
+                digest, stamp, identity, metrics = result
+                if metrics is None and digest not in self.entries:
+                    # Only possible if the cache was reset while loading
+                    errors[str(file_path)] = "Cache entry disappeared while loading"
+                    continue
+                key = self._relative(file_path)
+                self._store(key, digest, stamp, identity, metrics)
+                self._prefetched.add(key)
+        return errors
+
+    def metrics(self, file_path) -> Dict[str, float]:
+        """Return only the extracted metric values for a file (see get)."""
+        return self.get(file_path)['metrics']
+
+    def prune(self) -> int:
+        """
+        Drop entries for files that no longer exist and hashes no file points to.
+
+        Returns:
+            int: Number of file entries removed
+        """
+        missing = [key for key in self.files if not (self.root_dir / key).exists()]
+        for key in missing:
+            del self.files[key]
+            self._verified.pop(key, None)
+        referenced = {known[0] for known in self.files.values()}
+        unreferenced = [digest for digest in self.entries if digest not in referenced]
+        for digest in unreferenced:
+            del self.entries[digest]
+        if missing or unreferenced:
+            self._dirty = True
+        return len(missing)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this session and the number of cached files."""
+        return {'hits': self.hits, 'misses': self.misses, 'files': len(self.files), 'entries': len(self.entries)}
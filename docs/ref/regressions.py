@@ -0,0 +1,197 @@
+"""
+HealthMetric Regression Detection
+Pairs each newly scored model snapshot with the previous snapshot of the same
+model (same hub and project, earlier date) and flags week-over-week score drops.
+
+Previous snapshots are found with one index lookup per new snapshot in the
+history store, so a run costs O(new snapshots) no matter how long the history
+is. Flagged models are kept in a small regressions file for the dashboard; a
+model's entry is replaced whenever a newer snapshot of it is evaluated.
+
+Simple usage:
+    from regressions import detect_regressions, update_regressions_file
+    with HistoryStore(HISTORY_PATH) as store:
+        found = detect_regressions(store, [('Hub', 'Project', '2025-10-13', 'Model')])
+    update_regressions_file('docs/asset/data/regressions.json', found)
+
+Command line (re-evaluate the latest snapshot of every model):
+    python docs/ref/regressions.py [history.sqlite]
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import json_io
+from scoring import write_json_atomic
+from history_store import HistoryStore, HISTORY_PATH
+
+
+# =============================================================================
+# THRESHOLDS
+# =============================================================================
+REGRESSIONS_FILENAME = 'regressions.json'
+REGRESSIONS_VERSION = 1
+
+# A drop of at least this many points (or any worse grade) flags the model
+SCORE_DROP_THRESHOLD = 10.0
+
+GRADES = ['A', 'B', 'C', 'D', 'F']
+
+
+# =============================================================================
+# PAIRING AND DELTAS
+# =============================================================================
+
+def snapshot_deltas(current: Dict[str, Any], previous: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Week-over-week change between two snapshots of one model.
+
+    Args:
+        current: Snapshot row (HistoryStore.snapshot)
+        previous: Earlier snapshot row of the same model
+
+    Returns:
+        dict: score_delta and 'metrics' {name: [previous, current, delta]} for every
+              metric recorded in both snapshots whose value changed
+    """
+    metrics = {}
+    for name, value in current['metrics'].items():
+        old = previous['metrics'].get(name)
+        if value is None or old is None or value == old:
+            continue
+        metrics[name] = [old, value, round(value - old, 4)]
+    return {
+        'score_delta': round((current['total_score'] or 0) - (previous['total_score'] or 0), 2),
+        'metrics': metrics
+    }
+
+
+def _grade_rank(grade: Optional[str]) -> int:
+    return GRADES.index(grade) if grade in GRADES else len(GRADES)
+
+
+def detect_regressions(store: HistoryStore, keys: Iterable[Tuple[str, str, str, str]],
+                       score_drop: float = SCORE_DROP_THRESHOLD) -> Dict[str, Any]:
+    """
+    Compare new snapshots with their previous snapshot and collect regressions.
+
+    Args:
+        store: Open HistoryStore
+        keys: (hub, project, date, model) of the snapshots scored in this run
+        score_drop: Minimum score drop (points) that counts as a regression
+
+    Returns:
+        dict: 'evaluated' (list of (hub, project, model) checked), 'paired' count,
+              'first_snapshots' count and 'regressions' (list of regression entries)
+    """
+    evaluated = []
+    regressions = []
+    paired = 0
+    first_snapshots = 0
+
+    for hub, project, date, model in keys:
+        current = store.snapshot(hub, project, date, model)
+        if current is None:
+            continue
+        evaluated.append((hub, project, model))
+        previous = store.previous_snapshot(hub, project, model, date)
+        if previous is None:
+            first_snapshots += 1
+            continue
+        paired += 1
+
+        deltas = snapshot_deltas(current, previous)
+        grade_dropped = _grade_rank(current['grade']) > _grade_rank(previous['grade'])
+        if deltas['score_delta'] > -score_drop and not grade_dropped:
+            continue
+
+        # All scoring metrics are lower-is-better: keep only the ones that got worse
+        worse = {name: change for name, change in deltas['metrics'].items() if change[2] > 0}
+        regressions.append({
+            'hub': hub,
+            'project': project,
+            'model': model,
+            'date': date,
+            'previous_date': previous['date'],
+            'score': current['total_score'],
+            'previous_score': previous['total_score'],
+            'score_delta': deltas['score_delta'],
+            'grade': current['grade'],
+            'previous_grade': previous['grade'],
+            'metrics': dict(sorted(worse.items(), key=lambda item: -item[1][2]))
+        })
+
+    return {
+        'evaluated': evaluated,
+        'paired': paired,
+        'first_snapshots': first_snapshots,
+        'regressions': regressions
+    }
+
+
+# =============================================================================
+# REGRESSIONS FILE
+# =============================================================================
+
+def load_regressions(file_path) -> List[Dict[str, Any]]:
+    """Return the regression entries of a regressions file (empty if missing or unreadable)."""
+    try:
+        data = json_io.load(file_path)
+    except (OSError, ValueError):
+        return []
+    if data.get('version') != REGRESSIONS_VERSION:
+        return []
+    return data.get('regressions', [])
+
+
+def update_regressions_file(file_path, result: Dict[str, Any],
+                            score_drop: float = SCORE_DROP_THRESHOLD) -> int:
+    """
+    Merge a detect_regressions result into the regressions file.
+    Entries of every evaluated model are replaced, so a model that recovered drops out.
+
+    Args:
+        file_path: Path to regressions.json
+        result: Return value of detect_regressions
+        score_drop: Threshold recorded in the file
+
+    Returns:
+        int: Bytes written (0 if the file content is unchanged)
+    """
+    file_path = Path(file_path)
+    existing = load_regressions(file_path)
+    evaluated = set(result['evaluated'])
+    kept = [entry for entry in existing if (entry['hub'], entry['project'], entry['model']) not in evaluated]
+
+    regressions = sorted(kept + result['regressions'], key=lambda entry: (entry['score_delta'], entry['hub'],
+                                                                          entry['project'], entry['model']))
+    if file_path.exists() and regressions == existing:
+        return 0
+
+    return write_json_atomic(file_path, {
+        'version': REGRESSIONS_VERSION,
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'score_drop_threshold': score_drop,
+        'count': len(regressions),
+        'regressions': regressions
+    })
+
+
+def latest_snapshot_keys(store: HistoryStore) -> List[Tuple[str, str, str, str]]:
+    """Return (hub, project, date, model) of the latest snapshot of every model in the store."""
+    sql = 'SELECT hub, project, MAX(date), model FROM snapshots GROUP BY hub, project, model'
+    return [tuple(row) for row in store.conn.execute(sql)]
+
+
+if __name__ == '__main__':
+    import sys
+
+    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else HISTORY_PATH
+    with HistoryStore(db_path) as store:
+        found = detect_regressions(store, latest_snapshot_keys(store))
+    data_dir = Path(__file__).resolve().parent.parent / 'asset' / 'data'
+    written = update_regressions_file(data_dir / REGRESSIONS_FILENAME, found)
+    print(f"Snapshots evaluated: {len(found['evaluated'])} ({found['paired']} paired, "
+          f"{found['first_snapshots']} first snapshot(s))")
+    print(f"Regressions: {len(found['regressions'])} ({written:,} bytes written)")
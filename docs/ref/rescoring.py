@@ -0,0 +1,270 @@
+"""
+HealthMetric What-If Rescoring
+Evaluates an alternative scoring configuration against every historical model
+snapshot in the history store, without reading or rewriting any .sexyDuck file.
+
+Metric values come from history.sqlite (already extracted during the merge), and
+both the current and the alternative configuration are applied with the batch
+score_many API, so grade changes and score deltas per project come back in seconds.
+
+Simple usage:
+    from rescoring import rescore_history
+    report = rescore_history(HISTORY_PATH, base_size=750)
+    print(report['grade_changes'], report['projects'])
+
+Command line:
+    python docs/ref/rescoring.py what_if.json [history.sqlite]
+    (what_if.json may contain "base_size", "metrics", "grade_thresholds" and a
+     complete "profile"; a .toml file is loaded as a complete ScoringProfile)
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from scoring import DEFAULT_PROFILE, ScoringProfile, score_many, profile_for_hub
+from history_store import HistoryStore, HISTORY_PATH, METRIC_COLUMNS
+
+
+# =============================================================================
+# CONFIG MERGING
+# =============================================================================
+
+def build_profile(metric_overrides: Optional[Dict[str, Dict[str, float]]] = None,
+                  base_size: Optional[float] = None,
+                  grade_thresholds: Optional[Dict[str, float]] = None,
+                  base_profile: Optional[ScoringProfile] = None) -> ScoringProfile:
+    """
+    Apply what-if overrides on top of a scoring profile.
+
+    Args:
+        metric_overrides: Metric name -> partial config, e.g. {'High Warnings': {'weight': 16}}.
+                          A value of None removes the metric.
+        base_size: Alternative BASE_SIZE (default: unchanged)
+        grade_thresholds: Alternative grade thresholds (default: unchanged)
+        base_profile: Profile to start from (default: DEFAULT_PROFILE)
+
+    Returns:
+        New validated ScoringProfile
+
+    Raises:
+        ValueError: If the result is invalid or uses metrics the history does not record
+    """
+    profile = (base_profile or DEFAULT_PROFILE).with_overrides(
+        metric_overrides, base_size=base_size, grade_thresholds=grade_thresholds, name='what-if'
+    )
+
+    # Only metrics recorded in the history can be rescored - never fill in missing data
+    unknown = [name for name in profile.metric_names if name not in METRIC_COLUMNS]
+    if unknown:
+        raise ValueError(f"Metrics not recorded in history store: {', '.join(unknown)}")
+    return profile
+
+
+# =============================================================================
+# RESCORING
+# =============================================================================
+
+def _metric_row(snapshot: Dict[str, Any], required: List[str]) -> Optional[Dict[str, float]]:
+    """
+    Convert stored metric values to an extract_metrics-style row.
+    Returns None if any required metric was not recorded - never fill in missing data.
+    """
+    metrics = snapshot['metrics']
+    if any(metrics.get(name) is None for name in required):
+        return None
+    return {name: value for name, value in metrics.items() if value is not None}
+
+
+def _score_by_profile(rows: List[Dict[str, float]], profiles: List[ScoringProfile]) -> Dict[str, list]:
+    """Batch-score rows grouped by their profile, preserving row order."""
+    groups: Dict[int, List[int]] = {}
+    by_id: Dict[int, ScoringProfile] = {}
+    for i, profile in enumerate(profiles):
+        by_id[id(profile)] = profile
+        groups.setdefault(id(profile), []).append(i)
+
+    totals: List[float] = [0.0] * len(rows)
+    grades: List[str] = [''] * len(rows)
+    for key, indexes in groups.items():
+        batch = score_many([rows[i] for i in indexes], profile=by_id[key])
+        for position, i in enumerate(indexes):
+            totals[i] = batch['total_score'][position]
+            grades[i] = batch['grade'][position]
+    return {'total_score': totals, 'grade': grades}
+
+
+def rescore_history(store, metric_overrides: Optional[Dict[str, Dict[str, float]]] = None,
+                    base_size: Optional[float] = None,
+                    grade_thresholds: Optional[Dict[str, float]] = None,
+                    hub: Optional[str] = None, project: Optional[str] = None,
+                    include_models: bool = False,
+                    profile: Optional[ScoringProfile] = None) -> Dict[str, Any]:
+    """
+    Score every historical snapshot with the current and an alternative config.
+    Current scores use each hub's own profile. Overrides are applied on top of
+    that hub profile, unless a complete alternative profile is given for all hubs.
+
+    Args:
+        store: HistoryStore instance or path to history.sqlite
+        metric_overrides: Per-metric changes applied on top of the current profile
+        base_size: Alternative BASE_SIZE (default: unchanged)
+        grade_thresholds: Alternative GRADE_THRESHOLDS (default: unchanged)
+        hub, project: Optional cohort filters
+        include_models: Also return one entry per snapshot with old/new score and grade
+        profile: Complete alternative profile for all hubs (overrides are applied on top of it)
+
+    Returns:
+        dict: Report with snapshot count, grade change count, grade transitions,
+              per-project delta statistics and (optionally) per-model results.
+              Snapshots missing a metric either config scores are not rescored;
+              they are counted in 'skipped' and listed in 'incomplete'
+    """
+    if isinstance(store, HistoryStore):
+        snapshots = store.snapshots(hub=hub, project=project)
+    else:
+        with HistoryStore(store) as opened:
+            snapshots = opened.snapshots(hub=hub, project=project)
+
+    current_profiles = [profile_for_hub(snapshot['hub']) for snapshot in snapshots]
+
+    # Build each distinct what-if profile once (validates even when there are no snapshots)
+    proposed_by_base: Dict[int, ScoringProfile] = {}
+    for base in ([profile] if profile is not None else set(current_profiles) or {DEFAULT_PROFILE}):
+        proposed_by_base[id(base)] = build_profile(metric_overrides, base_size, grade_thresholds, base_profile=base)
+    proposed_profiles = [
+        proposed_by_base[id(profile if profile is not None else base)] for base in current_profiles
+    ]
+
+    # Snapshots without every metric the current and the what-if config score are
+    # flagged instead of being scored as if the missing values were 0
+    rows: List[Dict[str, float]] = []
+    kept: List[int] = []
+    incomplete: List[Dict[str, Any]] = []
+    for i, snapshot in enumerate(snapshots):
+        required = list(dict.fromkeys(current_profiles[i].metric_names + proposed_profiles[i].metric_names))
+        row = _metric_row(snapshot, required)
+        if row is None:
+            incomplete.append({
+                'hub': snapshot['hub'],
+                'project': snapshot['project'],
+                'date': snapshot['date'],
+                'model': snapshot['model'],
+                'missing': [name for name in required if snapshot['metrics'].get(name) is None]
+            })
+            continue
+        rows.append(row)
+        kept.append(i)
+    snapshots = [snapshots[i] for i in kept]
+    current_profiles = [current_profiles[i] for i in kept]
+    proposed_profiles = [proposed_profiles[i] for i in kept]
+
+    current = _score_by_profile(rows, current_profiles)
+    proposed = _score_by_profile(rows, proposed_profiles)
+
+    transitions: Dict[str, int] = {}
+    projects: Dict[str, Dict[str, Any]] = {}
+    models: List[Dict[str, Any]] = []
+    grade_changes = 0
+
+    for i, snapshot in enumerate(snapshots):
+        old_score, new_score = current['total_score'][i], proposed['total_score'][i]
+        old_grade, new_grade = current['grade'][i], proposed['grade'][i]
+        delta = round(new_score - old_score, 2)
+
+        stats = projects.setdefault(f"{snapshot['hub']}/{snapshot['project']}", {
+            'hub': snapshot['hub'],
+            'project': snapshot['project'],
+            'snapshots': 0,
+            'deltas': [],
+            'grade_changes': 0,
+            'upgrades': 0,
+            'downgrades': 0
+        })
+        stats['snapshots'] += 1
+        stats['deltas'].append(delta)
+
+        if old_grade != new_grade:
+            grade_changes += 1
+            stats['grade_changes'] += 1
+            # Grades are letters, so 'A' < 'B' means a better grade
+            if new_grade < old_grade:
+                stats['upgrades'] += 1
+            else:
+                stats['downgrades'] += 1
+            transition = f"{old_grade}->{new_grade}"
+            transitions[transition] = transitions.get(transition, 0) + 1
+
+        if include_models:
+            models.append({
+                'hub': snapshot['hub'],
+                'project': snapshot['project'],
+                'date': snapshot['date'],
+                'model': snapshot['model'],
+                'old_score': old_score,
+                'new_score': new_score,
+                'delta': delta,
+                'old_grade': old_grade,
+                'new_grade': new_grade
+            })
+
+    project_list = []
+    for key in sorted(projects):
+        stats = projects[key]
+        deltas = stats.pop('deltas')
+        stats['avg_delta'] = round(sum(deltas) / len(deltas), 2)
+        stats['min_delta'] = min(deltas)
+        stats['max_delta'] = max(deltas)
+        project_list.append(stats)
+
+    report = {
+        'snapshots': len(snapshots),
+        'skipped': len(incomplete),
+        'incomplete': incomplete,
+        'grade_changes': grade_changes,
+        'transitions': dict(sorted(transitions.items())),
+        'projects': project_list,
+        'config': {
+            'metric_overrides': metric_overrides or {},
+            'base_size': base_size,
+            'grade_thresholds': grade_thresholds,
+            'profile': profile.to_dict() if profile is not None else None
+        }
+    }
+    if include_models:
+        report['models'] = models
+    return report
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python rescoring.py what_if.json [history.sqlite]")
+        sys.exit(1)
+
+    what_if_path = Path(sys.argv[1])
+    if what_if_path.suffix.lower() == '.toml':
+        what_if = {'profile': ScoringProfile.from_file(what_if_path)}
+    else:
+        with open(what_if_path, 'r', encoding='utf-8') as f:
+            what_if = json.load(f)
+        if isinstance(what_if.get('profile'), dict):
+            what_if['profile'] = ScoringProfile.from_dict(what_if['profile'], name=what_if_path.stem)
+    db_path = Path(sys.argv[2]) if len(sys.argv) > 2 else HISTORY_PATH
+
+    result = rescore_history(
+        db_path,
+        metric_overrides=what_if.get('metrics'),
+        base_size=what_if.get('base_size'),
+        grade_thresholds=what_if.get('grade_thresholds'),
+        profile=what_if.get('profile')
+    )
+    print(f"Snapshots rescored: {result['snapshots']}")
+    if result['skipped']:
+        print(f"Skipped (metrics not recorded): {result['skipped']}")
+    print(f"Grade changes:      {result['grade_changes']} {result['transitions']}")
+    for stats in result['projects']:
+        print(f"  {stats['hub']}/{stats['project']}: avg {stats['avg_delta']:+.2f} "
+              f"(min {stats['min_delta']:+.2f}, max {stats['max_delta']:+.2f}), "
+              f"{stats['upgrades']} up / {stats['downgrades']} down")
@@ -1,14 +1,48 @@
 """
 HealthMetric Scoring System
-Calculates model health scores and writes them back to SexyDuck data files
+Calculates model health scores and stores them in per-date score indexes
 
 Simple usage:
-    from scoring import score_file
+    from scoring import score_file, read_score
     score_file('path/to/model.sexyDuck')
+    read_score('path/to/model.sexyDuck')
+
+Scores are stored in a per-date score index (_scores.json next to the models);
+the .sexyDuck data files themselves are never rewritten.
+
+Batch usage (NumPy when installed, pure Python otherwise):
+    from scoring import extract_metrics, score_many
+    results = score_many([extract_metrics(data) for data in sexy_duck_datas])
+
+Custom profiles (JSON or TOML, validated on load):
+    from scoring import ScoringProfile, score_file
+    profile = ScoringProfile.from_file('scoring_profiles/Ballinger.toml')
+    score_file('path/to/model.sexyDuck', profile)
 """
 
 import json
-from typing import Dict, Any
+import os
+import tempfile
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence
+
+import json_io
+# Re-exported: the merge and metrics_cache import the checks from scoring
+from validation import sexy_duck_rejection, validate_sexy_duck_data
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
 
 
 # =============================================================================
@@ -36,8 +70,6 @@ SCORING_METRICS = {
     'Unpinned Levels':       {'weight': 4,  'min': 0,    'max': 4},      # Unpinned levels
 }
 
-assert sum(metric['weight'] for metric in SCORING_METRICS.values()) == 100
-
 GRADE_THRESHOLDS = {
     'A': 90,
     'B': 80,
@@ -47,6 +79,247 @@ GRADE_THRESHOLDS = {
 }
 
 
+# =============================================================================
+# SCORING PROFILE - Validated, precomputed form of the configuration above
+# =============================================================================
+
+# Optional per-hub profiles (*.json / *.toml) loaded by profile_for_hub
+SCORING_PROFILES_DIR = Path(__file__).resolve().parent / 'scoring_profiles'
+
+
+class ScoringProfile:
+    """
+    Frozen scoring configuration with precomputed lookup tables.
+    
+    Metric weights and min/max bounds are stored as parallel tuples (and NumPy
+    arrays when available) and grade cutoffs are sorted once for bisect lookup.
+    Values keep their original types so scored output is unchanged.
+    """
+    
+    __slots__ = ('name', 'base_size', 'metric_names', 'weights', 'mins', 'maxs',
+                 'scale_flags', 'grade_cutoffs', 'grade_letters', 'arrays')
+    
+    def __init__(self, metrics: Dict[str, Dict[str, float]], base_size: float = BASE_SIZE,
+                 grade_thresholds: Optional[Dict[str, float]] = None, name: str = 'default'):
+        """
+        Validate and compile a scoring configuration.
+        
+        Args:
+            metrics: Metric name -> {'weight', 'min', 'max'} (same format as SCORING_METRICS)
+            base_size: Reference file size in MB for size scaling
+            grade_thresholds: Grade -> minimum score (default: GRADE_THRESHOLDS)
+            name: Profile name used in messages
+            
+        Raises:
+            ValueError: If the configuration is incomplete or inconsistent
+        """
+        grade_thresholds = GRADE_THRESHOLDS if grade_thresholds is None else grade_thresholds
+        
+        if not _is_number(base_size) or base_size <= 0:
+            raise ValueError(f"Profile '{name}': base_size must be a positive number, got {base_size!r}")
+        if not metrics:
+            raise ValueError(f"Profile '{name}': no metrics defined")
+        
+        for metric_name, config in metrics.items():
+            missing = [key for key in ('weight', 'min', 'max') if key not in config]
+            if missing:
+                raise ValueError(f"Profile '{name}': metric '{metric_name}' is missing {', '.join(missing)}")
+            if not all(_is_number(config[key]) for key in ('weight', 'min', 'max')):
+                raise ValueError(f"Profile '{name}': metric '{metric_name}' values must be numbers")
+            if config['weight'] < 0:
+                raise ValueError(f"Profile '{name}': metric '{metric_name}' has a negative weight")
+            if config['max'] < config['min']:
+                raise ValueError(f"Profile '{name}': metric '{metric_name}' has max below min")
+        
+        total_weight = sum(config['weight'] for config in metrics.values())
+        if total_weight != 100:
+            raise ValueError(f"Profile '{name}': metric weights must sum to 100, got {total_weight}")
+        
+        if not grade_thresholds or not all(_is_number(t) for t in grade_thresholds.values()):
+            raise ValueError(f"Profile '{name}': grade thresholds must be numbers")
+        
+        ordered = sorted(grade_thresholds.items(), key=lambda item: item[1])
+        names = tuple(metrics)
+        
+        set_field = object.__setattr__
+        set_field(self, 'name', name)
+        set_field(self, 'base_size', base_size)
+        set_field(self, 'metric_names', names)
+        set_field(self, 'weights', tuple(metrics[m]['weight'] for m in names))
+        set_field(self, 'mins', tuple(metrics[m]['min'] for m in names))
+        set_field(self, 'maxs', tuple(metrics[m]['max'] for m in names))
+        # File size metric is never scaled by itself
+        set_field(self, 'scale_flags', tuple(m != 'File size' for m in names))
+        set_field(self, 'grade_cutoffs', tuple(threshold for _, threshold in ordered))
+        set_field(self, 'grade_letters', tuple(grade for grade, _ in ordered))
+        set_field(self, 'arrays', None if np is None else {
+            'weights': np.array(self.weights, dtype=float),
+            'mins': np.array(self.mins, dtype=float),
+            'maxs': np.array(self.maxs, dtype=float),
+            'scale': np.array(self.scale_flags),
+            'cutoffs': np.array(self.grade_cutoffs, dtype=float),
+            'letters': np.array(self.grade_letters + ('F',))
+        })
+    
+    def __setattr__(self, key, value):
+        raise AttributeError("ScoringProfile is frozen")
+    
+    def __delattr__(self, key):
+        raise AttributeError("ScoringProfile is frozen")
+    
+    def __repr__(self):
+        return f"ScoringProfile(name={self.name!r}, metrics={len(self.metric_names)}, base_size={self.base_size})"
+    
+    def grade(self, score: float) -> str:
+        """Letter grade for a score: highest cutoff <= score, 'F' below all cutoffs."""
+        if score != score:
+            return 'F'  # NaN compares false against every cutoff
+        position = bisect_right(self.grade_cutoffs, score)
+        return self.grade_letters[position - 1] if position else 'F'
+    
+    @property
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Metric configuration as a new dict (SCORING_METRICS format)."""
+        return {
+            name: {'weight': weight, 'min': min_value, 'max': max_value}
+            for name, weight, min_value, max_value in zip(self.metric_names, self.weights, self.mins, self.maxs)
+        }
+    
+    @property
+    def grade_thresholds(self) -> Dict[str, float]:
+        """Grade thresholds as a new dict, highest first (GRADE_THRESHOLDS format)."""
+        return dict(reversed(list(zip(self.grade_letters, self.grade_cutoffs))))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form accepted by from_dict."""
+        return {
+            'name': self.name,
+            'base_size': self.base_size,
+            'metrics': self.metrics,
+            'grade_thresholds': self.grade_thresholds
+        }
+    
+    def with_overrides(self, metrics: Optional[Dict[str, Optional[Dict[str, float]]]] = None,
+                       base_size: Optional[float] = None,
+                       grade_thresholds: Optional[Dict[str, float]] = None,
+                       name: Optional[str] = None) -> 'ScoringProfile':
+        """
+        Return a new profile with some values changed.
+        
+        Args:
+            metrics: Metric name -> partial config, e.g. {'High Warnings': {'weight': 16}}.
+                     A value of None removes the metric.
+            base_size: New reference file size
+            grade_thresholds: New grade thresholds (replaces all of them)
+            name: New profile name (default: '<name>*')
+        """
+        merged = self.metrics
+        for metric_name, config in (metrics or {}).items():
+            if config is None:
+                merged.pop(metric_name, None)
+            else:
+                merged.setdefault(metric_name, {}).update(config)
+        return ScoringProfile(
+            merged,
+            base_size=self.base_size if base_size is None else base_size,
+            grade_thresholds=self.grade_thresholds if grade_thresholds is None else grade_thresholds,
+            name=f"{self.name}*" if name is None else name
+        )
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], name: Optional[str] = None) -> 'ScoringProfile':
+        """
+        Build a profile from a dict with 'metrics' and optional 'base_size',
+        'grade_thresholds' and 'name'.
+        """
+        if 'metrics' not in data:
+            raise ValueError(f"Profile '{name or data.get('name', '?')}': missing 'metrics' table")
+        return cls(
+            data['metrics'],
+            base_size=data.get('base_size', BASE_SIZE),
+            grade_thresholds=data.get('grade_thresholds'),
+            name=data.get('name', name or 'custom')
+        )
+    
+    @classmethod
+    def from_file(cls, file_path) -> 'ScoringProfile':
+        """
+        Load a profile from a .json or .toml file (name defaults to the file stem).
+        
+        Example TOML:
+            base_size = 500
+            [grade_thresholds]
+            A = 90
+            [metrics."High Warnings"]
+            weight = 12
+            min = 0
+            max = 30
+        """
+        file_path = Path(file_path)
+        return cls.from_dict(_read_profile_file(file_path), name=file_path.stem)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _read_profile_file(file_path: Path) -> Dict[str, Any]:
+    """Parse a .json or .toml profile file into a dict."""
+    if file_path.suffix.lower() == '.toml':
+        if tomllib is None:
+            raise ImportError("Reading TOML profiles requires Python 3.11+ (tomllib) or the tomli package")
+        with open(file_path, 'rb') as f:
+            return tomllib.load(f)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Validated at import time (replaces the old weight-sum assert)
+DEFAULT_PROFILE = ScoringProfile(SCORING_METRICS, BASE_SIZE, GRADE_THRESHOLDS, name='default')
+
+
+def load_hub_profiles(directory=None) -> Dict[str, ScoringProfile]:
+    """
+    Load per-hub scoring profiles from a directory of .json/.toml files.
+    
+    A profile applies to the hubs listed in its optional 'hubs' array,
+    otherwise to the hub named like the file stem.
+    
+    Args:
+        directory: Profiles directory (default: SCORING_PROFILES_DIR)
+        
+    Returns:
+        Dictionary of hub name -> ScoringProfile (empty if the directory does not exist)
+    """
+    directory = Path(directory) if directory else SCORING_PROFILES_DIR
+    profiles = {}
+    if not directory.is_dir():
+        return profiles
+    
+    for file_path in sorted(directory.iterdir()):
+        if file_path.suffix.lower() not in ('.json', '.toml'):
+            continue
+        data = _read_profile_file(file_path)
+        profile = ScoringProfile.from_dict(data, name=file_path.stem)
+        for hub in data.get('hubs') or [file_path.stem]:
+            profiles[hub] = profile
+    return profiles
+
+
+_hub_profiles: Optional[Dict[str, ScoringProfile]] = None
+
+
+def profile_for_hub(hub: Optional[str]) -> ScoringProfile:
+    """
+    Return the scoring profile for a hub, falling back to DEFAULT_PROFILE.
+    Profiles in SCORING_PROFILES_DIR are loaded once per process.
+    """
+    global _hub_profiles
+    if _hub_profiles is None:
+        _hub_profiles = load_hub_profiles()
+    return _hub_profiles.get(hub, DEFAULT_PROFILE)
+
+
 # =============================================================================
 # METRIC EXTRACTION - Extract values from SexyDuck data
 # =============================================================================
@@ -135,7 +408,8 @@ def extract_metrics(sexy_duck_data: Dict[str, Any]) -> Dict[str, float]:
 def calculate_metric_score(actual_value: float, min_value: float, 
                           max_value: float, weight: float, 
                           file_size: float = BASE_SIZE, 
-                          scale_by_size: bool = True) -> float:
+                          scale_by_size: bool = True,
+                          base_size: Optional[float] = None) -> float:
     """
     Calculate score for a single metric.
     
@@ -155,13 +429,16 @@ def calculate_metric_score(actual_value: float, min_value: float,
         weight: Point weight for this metric
         file_size: Actual file size in MB (default: BASE_SIZE)
         scale_by_size: Whether to scale max by file size ratio (default: True)
+        base_size: Reference file size in MB (default: BASE_SIZE)
         
     Returns:
         Score contribution (0 to weight)
     """
+    base_size = BASE_SIZE if base_size is None else base_size
+    
     # Scale min/max values based on file size ratio (except for file size metric itself)
     if scale_by_size and file_size > 0:
-        size_ratio = file_size / BASE_SIZE
+        size_ratio = file_size / base_size
         scaled_min = min_value * size_ratio
         scaled_max = max_value * size_ratio
     else:
@@ -179,23 +456,22 @@ def calculate_metric_score(actual_value: float, min_value: float,
     return weight * percentage
 
 
-def get_letter_grade(score: float) -> str:
+def get_letter_grade(score: float, profile: Optional[ScoringProfile] = None) -> str:
     """
     Convert numerical score to letter grade.
     
     Args:
         score: Numerical score (0-100)
+        profile: Scoring profile with the grade cutoffs (default: DEFAULT_PROFILE)
         
     Returns:
         Letter grade (A, B, C, D, or F)
     """
-    for grade, threshold in GRADE_THRESHOLDS.items():
-        if score >= threshold:
-            return grade
-    return 'F'
+    return (profile or DEFAULT_PROFILE).grade(score)
 
 
-def calculate_score(sexy_duck_data: Dict[str, Any]) -> Dict[str, Any]:
+def calculate_score(sexy_duck_data: Dict[str, Any],
+                    profile: Optional[ScoringProfile] = None) -> Dict[str, Any]:
     """
     Calculate score for a model based on SexyDuck data.
     
@@ -204,6 +480,7 @@ def calculate_score(sexy_duck_data: Dict[str, Any]) -> Dict[str, Any]:
     
     Args:
         sexy_duck_data: Parsed JSON from .sexyDuck file
+        profile: Scoring profile to apply (default: DEFAULT_PROFILE)
         
     Returns:
         Dictionary containing:
@@ -212,51 +489,66 @@ def calculate_score(sexy_duck_data: Dict[str, Any]) -> Dict[str, Any]:
             - metrics: List of individual metric scores
     """
     # Extract actual values from data
-    actual_metrics = extract_metrics(sexy_duck_data)
+    return score_metrics(extract_metrics(sexy_duck_data), profile)
+
+
+def score_metrics(actual_metrics: Dict[str, float],
+                  profile: Optional[ScoringProfile] = None) -> Dict[str, Any]:
+    """
+    Calculate score from already-extracted metric values.
+    
+    Args:
+        actual_metrics: Metric names and values as returned by extract_metrics
+        profile: Scoring profile to apply (default: DEFAULT_PROFILE)
+        
+    Returns:
+        Same structure as calculate_score
+    """
+    profile = profile or DEFAULT_PROFILE
+    base_size = profile.base_size
     
     # Get file size for scaling (all other metrics scale based on this)
-    file_size = actual_metrics.get('File size', BASE_SIZE)
+    file_size = actual_metrics.get('File size', base_size)
     
     # Calculate score for each metric
     metric_details = []
     total_score = 0.0
     
-    for metric_name, config in SCORING_METRICS.items():
+    for metric_name, weight, min_value, max_value, scale_by_size in zip(
+            profile.metric_names, profile.weights, profile.mins, profile.maxs, profile.scale_flags):
         actual_value = actual_metrics.get(metric_name, 0)
         
-        # File size metric should not scale by itself
-        scale_by_size = (metric_name != 'File size')
-        
         # Calculate score contribution
         contribution = calculate_metric_score(
             actual_value,
-            config['min'],
-            config['max'],
-            config['weight'],
+            min_value,
+            max_value,
+            weight,
             file_size=file_size,
-            scale_by_size=scale_by_size
+            scale_by_size=scale_by_size,
+            base_size=base_size
         )
         
         total_score += contribution
         
         # Determine individual metric grade
-        metric_percentage = (contribution / config['weight'] * 100) if config['weight'] > 0 else 0
-        metric_grade = get_letter_grade(metric_percentage)
+        metric_percentage = (contribution / weight * 100) if weight > 0 else 0
+        metric_grade = profile.grade(metric_percentage)
         
         # Calculate scaled min/max for display purposes
         if scale_by_size and file_size > 0:
-            size_ratio = file_size / BASE_SIZE
-            scaled_min = config['min'] * size_ratio
-            scaled_max = config['max'] * size_ratio
+            size_ratio = file_size / base_size
+            scaled_min = min_value * size_ratio
+            scaled_max = max_value * size_ratio
         else:
-            scaled_min = config['min']
-            scaled_max = config['max']
+            scaled_min = min_value
+            scaled_max = max_value
         
         metric_details.append({
             'metric': metric_name,
-            'weight': config['weight'],
-            'min': config['min'],
-            'max': config['max'],
+            'weight': weight,
+            'min': min_value,
+            'max': max_value,
             'scaled_min': round(scaled_min, 2),
             'scaled_max': round(scaled_max, 2),
             'actual': actual_value,
@@ -265,7 +557,7 @@ def calculate_score(sexy_duck_data: Dict[str, Any]) -> Dict[str, Any]:
         })
     
     # Get overall grade
-    overall_grade = get_letter_grade(total_score)
+    overall_grade = profile.grade(total_score)
     
     return {
         'total_score': round(total_score, 2),
@@ -275,66 +567,366 @@ def calculate_score(sexy_duck_data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 # =============================================================================
-# FILE OPERATIONS - Load, score, and save
+# BATCH SCORING - Score many models at once with array operations
 # =============================================================================
 
-def validate_sexy_duck_data(sexy_duck_data: Dict[str, Any], file_path: str = '') -> None:
+METRIC_NAMES = list(DEFAULT_PROFILE.metric_names)
+
+
+def _grades_from_scores(scores, profile: ScoringProfile) -> List[str]:
+    """Vectorized get_letter_grade over a NumPy array of scores."""
+    # Index of the highest cutoff <= score; scores below every cutoff map to the trailing 'F'
+    positions = np.searchsorted(profile.arrays['cutoffs'], scores, side='right') - 1
+    return profile.arrays['letters'][positions].tolist()
+
+
+def score_many(metric_rows: Sequence[Dict[str, float]], details: bool = False,
+               profile: Optional[ScoringProfile] = None) -> Dict[str, Any]:
     """
-    Validate that SexyDuck data contains required fields for scoring.
-    Raises ValueError if critical data is missing.
+    Score N models at once from extracted metric rows.
     
-    This enforces the 'No Fake Data' rule - we never estimate or fake values.
+    With NumPy installed, every contribution is computed over an N x (number of metrics)
+    matrix in one pass; without it, rows are scored one by one with score_metrics.
+    Totals and grades match calculate_score exactly (same operation order and rounding).
     
     Args:
-        sexy_duck_data: Parsed JSON from .sexyDuck file
-        file_path: Optional file path for better error messages
+        metric_rows: Sequence of dicts as returned by extract_metrics
+        details: Also build calculate_score-compatible result dicts (slower)
+        profile: Scoring profile to apply (default: DEFAULT_PROFILE)
+        
+    Returns:
+        Dictionary containing:
+            - metrics: Metric names (column order of contributions)
+            - total_score: List of rounded totals
+            - grade: List of letter grades
+            - contributions: N x M unrounded contributions (NumPy array, or lists without NumPy)
+            - results: List of calculate_score-style dicts (only when details=True)
+    """
+    profile = profile or DEFAULT_PROFILE
+    base_size = profile.base_size
+    metric_names = list(profile.metric_names)
+    
+    if np is None or not metric_rows:
+        results = [score_metrics(row, profile) for row in metric_rows]
+        batch = {
+            'metrics': metric_names,
+            'total_score': [r['total_score'] for r in results],
+            'grade': [r['grade'] for r in results],
+            'contributions': [[m['contribution'] for m in r['metrics']] for r in results]
+        }
+        if details:
+            batch['results'] = results
+        return batch
+    
+    weights = profile.arrays['weights']
+    mins = profile.arrays['mins']
+    maxs = profile.arrays['maxs']
+    
+    actuals = np.array([[row.get(name, 0) for name in metric_names] for row in metric_rows], dtype=float)
+    file_sizes = np.array([row.get('File size', base_size) for row in metric_rows], dtype=float)
+    
+    # Scale min/max by file size ratio (not for the file size metric itself)
+    scale = profile.arrays['scale'][None, :] & (file_sizes > 0)[:, None]
+    size_ratio = (file_sizes / base_size)[:, None]
+    scaled_min = np.where(scale, mins * size_ratio, mins)
+    scaled_max = np.where(scale, maxs * size_ratio, maxs)
+    
+    # Lower is better: full points at min, zero at max, linear in between
+    span = scaled_max - scaled_min
+    with np.errstate(divide='ignore', invalid='ignore'):
+        raw_percentage = (scaled_max - actuals) / span
+    contributions = weights * np.clip(raw_percentage, 0, 1)
+    # If min equals max, full points at or below that value
+    contributions = np.where(span == 0, np.where(actuals <= scaled_min, weights, 0.0), contributions)
+    
+    # Accumulate column by column to keep calculate_score's summation order
+    totals = np.zeros(len(metric_rows))
+    for j in range(len(metric_names)):
+        totals += contributions[:, j]
+    
+    batch = {
+        'metrics': metric_names,
+        'total_score': [round(total, 2) for total in totals.tolist()],
+        'grade': _grades_from_scores(totals, profile),
+        'contributions': contributions
+    }
+    
+    if details:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentages = np.where(weights > 0, contributions / weights * 100, 0)
+        metric_grades = [_grades_from_scores(percentages[:, j], profile) for j in range(len(metric_names))]
+        scale_list = scale.tolist()
+        scaled_min_list = scaled_min.tolist()
+        scaled_max_list = scaled_max.tolist()
+        raw_list = raw_percentage.tolist()
+        span_list = span.tolist()
+        contribution_list = contributions.tolist()
+        results = []
+        for i, row in enumerate(metric_rows):
+            metric_details = []
+            for j, name in enumerate(metric_names):
+                weight, min_value, max_value = profile.weights[j], profile.mins[j], profile.maxs[j]
+                # Reproduce calculate_metric_score's int results (weight or 0) at the bounds,
+                # so serialized output is identical to the one-at-a-time path
+                if span_list[i][j] == 0:
+                    contribution = weight if row.get(name, 0) <= scaled_min_list[i][j] else 0
+                elif raw_list[i][j] >= 1:
+                    contribution = weight * 1
+                elif raw_list[i][j] <= 0:
+                    contribution = 0
+                else:
+                    contribution = contribution_list[i][j]
+                scaled = scale_list[i][j]
+                metric_details.append({
+                    'metric': name,
+                    'weight': weight,
+                    'min': min_value,
+                    'max': max_value,
+                    'scaled_min': round(scaled_min_list[i][j] if scaled else min_value, 2),
+                    'scaled_max': round(scaled_max_list[i][j] if scaled else max_value, 2),
+                    'actual': row.get(name, 0),
+                    'contribution': round(contribution, 2),
+                    'grade': metric_grades[j][i]
+                })
+            results.append({
+                'total_score': batch['total_score'][i],
+                'grade': batch['grade'][i],
+                'metrics': metric_details
+            })
+        batch['results'] = results
+    
+    return batch
+
+
+# =============================================================================
+# PERCENTILE SCORING - Rank models against their cohort (week or hub)
+# =============================================================================
+
+def percentile_ranks(values: Sequence[float], higher_is_better: bool = False) -> List[float]:
     """
-    file_info = f" in {file_path}" if file_path else ""
+    Percentile rank of every value within its cohort, in one sort.
     
-    # Check for job_metadata
-    if 'job_metadata' not in sexy_duck_data:
-        raise ValueError(f"Missing 'job_metadata' section{file_info}")
+    The rank is the percentage of the other cohort members a value beats, with
+    ties counting half: 100 = best in the cohort, 0 = worst, 50 = middle.
+    A cohort of one ranks 100.
     
-    # Check for required file size data
-    job_metadata = sexy_duck_data.get('job_metadata', {})
-    if 'model_file_size_bytes' not in job_metadata or job_metadata.get('model_file_size_bytes', 0) <= 0:
-        raise ValueError(
-            f"Missing or invalid 'model_file_size_bytes' in job_metadata{file_info}. "
-            f"Cannot score without actual file size data. "
-            f"We never estimate or fake data (project rule)."
-        )
+    Args:
+        values: Metric values of one cohort
+        higher_is_better: False for metrics where lower is better (all scoring metrics)
+        
+    Returns:
+        List of ranks (0-100, one decimal) in input order
+    """
+    n = len(values)
+    if n == 0:
+        return []
+    if n == 1:
+        return [100.0]
+    
+    if np is not None:
+        array = np.asarray(values, dtype=float)
+        ordered = np.sort(array)
+        below = np.searchsorted(ordered, array, side='left')
+        up_to = np.searchsorted(ordered, array, side='right')
+        wins = below if higher_is_better else n - up_to
+        ranks = ((wins + 0.5 * (up_to - below - 1)) / (n - 1) * 100).tolist()
+    else:
+        ordered = sorted(values)
+        ranks = []
+        for value in values:
+            below = bisect_left(ordered, value)
+            up_to = bisect_right(ordered, value)
+            wins = below if higher_is_better else n - up_to
+            ranks.append((wins + 0.5 * (up_to - below - 1)) / (n - 1) * 100)
+    
+    return [round(rank, 1) for rank in ranks]
+
+
+def cohort_percentiles(metric_rows: Sequence[Dict[str, float]], total_scores: Sequence[float],
+                       cohort_keys: Sequence[Any]) -> List[Dict[str, Any]]:
+    """
+    Per-metric and total-score percentile ranks of each model within its cohort.
+    
+    Metric values other than file size are divided by the file size before
+    ranking, matching the size scaling of the absolute score (a 1000 MB model
+    may have twice the warnings of a 500 MB one).
     
-    # Check for result_data
-    if 'result_data' not in sexy_duck_data:
-        raise ValueError(f"Missing 'result_data' section{file_info}")
+    Args:
+        metric_rows: Extracted metric rows (as returned by extract_metrics)
+        total_scores: Absolute total score of each row
+        cohort_keys: Cohort of each row, e.g. its date or (hub, date)
+        
+    Returns:
+        One dict per row: cohort_size, total_score rank and metrics {name: rank}
+    """
+    cohorts: Dict[Any, List[int]] = {}
+    for i, key in enumerate(cohort_keys):
+        cohorts.setdefault(key, []).append(i)
+    
+    # Size-normalized value columns, built once for all rows
+    columns = {}
+    for name in METRIC_NAMES:
+        values = []
+        for row in metric_rows:
+            value = row.get(name, 0)
+            file_size = row.get('File size', 0)
+            values.append(value / file_size if name != 'File size' and file_size > 0 else value)
+        columns[name] = np.asarray(values, dtype=float) if np is not None else values
+    
+    results: List[Dict[str, Any]] = [{} for _ in metric_rows]
+    for indexes in cohorts.values():
+        totals = percentile_ranks([total_scores[i] for i in indexes], higher_is_better=True)
+        if np is not None:
+            selection = np.asarray(indexes)
+            metric_ranks = {name: percentile_ranks(column[selection]) for name, column in columns.items()}
+        else:
+            metric_ranks = {name: percentile_ranks([column[i] for i in indexes]) for name, column in columns.items()}
+        
+        for position, i in enumerate(indexes):
+            results[i] = {
+                'cohort_size': len(indexes),
+                'total_score': totals[position],
+                'metrics': {name: ranks[position] for name, ranks in metric_ranks.items()}
+            }
+    return results
+
+
+# =============================================================================
+# FILE OPERATIONS - Load, score, and save
+# =============================================================================
+
+# Per-date score index: {model name: score data} for every model in a date folder
+SCORE_INDEX_FILENAME = '_scores.json'
 
 
-def score_file(file_path: str) -> None:
+def write_json_atomic(file_path, data: Any, pretty: bool = False, sort_keys: bool = False) -> int:
     """
-    Load a SexyDuck file, calculate score, and write it back with 'score' key.
+    Write JSON to a temp file in the same folder, then rename it over the target.
+    Readers never see a partially written file.
     
-    Validates that all required data exists before scoring.
-    Follows 'No Fake Data' rule - will raise error if data is missing.
+    Args:
+        file_path: Target path
+        data: JSON-serializable data
+        pretty: 2-space indented (True) or compact (False) output, see json_io
+        sort_keys: Sort object keys
+        
+    Returns:
+        Number of bytes written
+    """
+    file_path = Path(file_path)
+    payload = json_io.dumpb(data, pretty=pretty, sort_keys=sort_keys)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{file_path.name}.", suffix='.tmp', dir=str(file_path.parent))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates owner-only files; keep the target's mode (or a normal 0644)
+        os.chmod(temp_path, file_path.stat().st_mode & 0o777 if file_path.exists() else 0o644)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return len(payload)
+
+
+def score_index_path(file_path) -> Path:
+    """Path of the score index for the date folder containing a .sexyDuck file."""
+    return Path(file_path).parent / SCORE_INDEX_FILENAME
+
+
+def load_score_index(date_dir) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the score index of a date folder.
+    
+    Returns:
+        Dictionary of model name (file stem) -> score data (empty if there is no index)
+    """
+    index_path = Path(date_dir) / SCORE_INDEX_FILENAME
+    if not index_path.exists():
+        return {}
+    return json_io.load(index_path).get('scores', {})
+
+
+def save_scores(date_dir, scores: Dict[str, Dict[str, Any]]) -> int:
+    """
+    Merge scores into a date folder's score index and write it atomically.
+    Nothing is written when every score is unchanged.
+    
+    Args:
+        date_dir: Folder containing the .sexyDuck files
+        scores: Dictionary of model name (file stem) -> score data
+        
+    Returns:
+        Number of bytes written (0 if the index was already up to date)
+    """
+    index = load_score_index(date_dir)
+    if all(index.get(model) == score_data for model, score_data in scores.items()):
+        return 0
+    
+    index.update(scores)
+    return write_json_atomic(
+        Path(date_dir) / SCORE_INDEX_FILENAME,
+        {'version': '1.0', 'scores': dict(sorted(index.items()))},
+        pretty=True
+    )
+
+
+def read_score(file_path) -> Optional[Dict[str, Any]]:
+    """
+    Return the stored score for a .sexyDuck file.
+    
+    Looks in the date folder's score index first, then falls back to a
+    'score' key embedded in the data file (files scored before the index existed).
     
     Args:
         file_path: Path to .sexyDuck file
         
+    Returns:
+        Score data, or None if the file has not been scored
+    """
+    file_path = Path(file_path)
+    score_data = load_score_index(file_path.parent).get(file_path.stem)
+    if score_data is not None:
+        return score_data
+    
+    return json_io.load(file_path).get('score')
+
+
+def compute_file_score(file_path, profile: Optional[ScoringProfile] = None) -> Dict[str, Any]:
+    """
+    Load and validate a SexyDuck file and calculate its score without storing it.
+    
     Raises:
         ValueError: If required data fields are missing
     """
-    # Load the data
-    with open(file_path, 'r', encoding='utf-8') as f:
-        sexy_duck_data = json.load(f)
+    sexy_duck_data = json_io.load(file_path)
     
     # Validate data completeness (enforces 'No Fake Data' rule)
-    validate_sexy_duck_data(sexy_duck_data, file_path)
+    validate_sexy_duck_data(sexy_duck_data, str(file_path))
     
-    # Calculate score
-    score_data = calculate_score(sexy_duck_data)
+    return calculate_score(sexy_duck_data, profile)
+
+
+def score_file(file_path: str, profile: Optional[ScoringProfile] = None) -> Dict[str, Any]:
+    """
+    Load a SexyDuck file, calculate its score and store it in the date folder's score index.
+    The data file itself is not modified.
     
-    # Add score to the data
-    sexy_duck_data['score'] = score_data
+    Validates that all required data exists before scoring.
+    Follows 'No Fake Data' rule - will raise error if data is missing.
     
-    # Write back to file
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(sexy_duck_data, f, indent=4)
+    Args:
+        file_path: Path to .sexyDuck file
+        profile: Scoring profile to apply (default: DEFAULT_PROFILE)
+        
+    Returns:
+        The score data written to the score index
+        
+    Raises:
+        ValueError: If required data fields are missing
+    """
+    score_data = compute_file_score(file_path, profile)
+    save_scores(Path(file_path).parent, {Path(file_path).stem: score_data})
+    return score_data
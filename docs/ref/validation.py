@@ -0,0 +1,74 @@
+"""
+HealthMetric SexyDuck Validation
+Checks whether a parsed .sexyDuck file can be merged and scored
+
+Simple usage:
+    from validation import sexy_duck_rejection, validate_sexy_duck_data
+    reason = sexy_duck_rejection(data)      # None if the run is usable
+    validate_sexy_duck_data(data, path)     # raises ValueError if data is missing
+
+Standard library only: the sender imports this module without scoring, so the
+sender EXE does not load (or bundle) NumPy. scoring re-exports both functions.
+"""
+
+from typing import Dict, Any, Optional
+
+
+def sexy_duck_rejection(sexy_duck_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Check the run status recorded in SexyDuck data (failed runs and mock data are never merged).
+    Shared by the merge and the sender, which checks files before uploading them.
+    
+    Args:
+        sexy_duck_data: Parsed JSON from .sexyDuck file
+        
+    Returns:
+        The reason the file is skipped, or None if it is usable
+    """
+    # Check status field
+    status = sexy_duck_data.get('status', '').lower()
+    if status == 'failed':
+        return "Status is 'failed'"
+    
+    # Check for error_occurred flag
+    result_data = sexy_duck_data.get('result_data', {})
+    debug_info = result_data.get('debug_info', {})
+    if debug_info.get('error_occurred', False):
+        return "Error occurred during processing"
+    
+    # Check for mock_mode (indicates real data collection failed)
+    if result_data.get('mock_mode', False):
+        return "Mock mode (real data failed)"
+    
+    return None
+
+
+def validate_sexy_duck_data(sexy_duck_data: Dict[str, Any], file_path: str = '') -> None:
+    """
+    Validate that SexyDuck data contains required fields for scoring.
+    Raises ValueError if critical data is missing.
+    
+    This enforces the 'No Fake Data' rule - we never estimate or fake values.
+    
+    Args:
+        sexy_duck_data: Parsed JSON from .sexyDuck file
+        file_path: Optional file path for better error messages
+    """
+    file_info = f" in {file_path}" if file_path else ""
+    
+    # Check for job_metadata
+    if 'job_metadata' not in sexy_duck_data:
+        raise ValueError(f"Missing 'job_metadata' section{file_info}")
+    
+    # Check for required file size data
+    job_metadata = sexy_duck_data.get('job_metadata', {})
+    if 'model_file_size_bytes' not in job_metadata or job_metadata.get('model_file_size_bytes', 0) <= 0:
+        raise ValueError(
+            f"Missing or invalid 'model_file_size_bytes' in job_metadata{file_info}. "
+            f"Cannot score without actual file size data. "
+            f"We never estimate or fake data (project rule)."
+        )
+    
+    # Check for result_data
+    if 'result_data' not in sexy_duck_data:
+        raise ValueError(f"Missing 'result_data' section{file_info}")
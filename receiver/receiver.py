@@ -6,13 +6,20 @@ Processes incoming data and extracts it to the local _data_received folder
 
 import json
 import os
+import re
 import sys
+import mmap
 import time
 import base64
+import binascii
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+
+# Shared JSON layer (orjson/msgspec when installed, stdlib json otherwise)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "docs" / "ref"))
+import json_io
 
 try:
     import requests
@@ -25,6 +32,304 @@ except ImportError:
     from github import Github, Auth
 
 
+# =============================================================================
+# ADMISSION CONTROL - Keep one huge batch from starving the jobs queued behind it
+# =============================================================================
+# Sizes come from the trigger (total_files/total_bytes declared by the sender from
+# batch_metadata) and the raw payload size (stat of the checkout, or the repo listing),
+# so nothing is downloaded or parsed before a batch is admitted.
+MAX_BATCH_BYTES = int(os.getenv('RECEIVER_MAX_BATCH_BYTES', 200 * 1024 * 1024))      # Larger → deferred lane
+MAX_BATCH_FILES = int(os.getenv('RECEIVER_MAX_BATCH_FILES', 5000))                   # More files → deferred lane
+RUN_BYTE_BUDGET = int(os.getenv('RECEIVER_RUN_BYTE_BUDGET', 1024 * 1024 * 1024))    # Per run; the rest stays queued
+DEFERRED_RUN_BYTE_BUDGET = int(os.getenv('RECEIVER_DEFERRED_RUN_BYTE_BUDGET', 2 * 1024 * 1024 * 1024))
+
+TRIGGER_DIR = ".github/triggers"
+DEFERRED_TRIGGER_DIR = ".github/triggers_deferred"
+LANES = {'main': TRIGGER_DIR, 'deferred': DEFERRED_TRIGGER_DIR}
+
+
+def estimate_payload_bytes(raw_size: Optional[int], declared_bytes: Optional[int]) -> Optional[int]:
+    """Raw payload size, or an estimate from the declared file bytes (base64 adds a third)."""
+    if raw_size is not None:
+        return raw_size
+    if declared_bytes is not None:
+        return declared_bytes * 4 // 3
+    return None
+
+
+def admit_jobs(jobs: List[Dict[str, Any]], lane: str = 'main') -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Decide which jobs this run processes, oldest first.
+    
+    Main lane: a batch over MAX_BATCH_BYTES or MAX_BATCH_FILES goes to the deferred lane;
+    the others are admitted until RUN_BYTE_BUDGET is used and the rest stay queued.
+    Deferred lane: admitted until DEFERRED_RUN_BYTE_BUDGET is used.
+    The first admissible job is always admitted, so the queue keeps moving.
+    A job of unknown size is admitted (nothing to judge it by).
+    
+    Args:
+        jobs: Dicts with 'bytes' and 'files' (None if unknown) and 'created_at' (ISO, may be '')
+        lane: 'main' or 'deferred'
+        
+    Returns:
+        {'admitted': [...], 'queued': [...], 'deferred': [...]}
+    """
+    plan = {'admitted': [], 'queued': [], 'deferred': []}
+    budget = RUN_BYTE_BUDGET if lane == 'main' else DEFERRED_RUN_BYTE_BUDGET
+    used = 0
+    for job in sorted(jobs, key=lambda j: (j.get('created_at') or '', j.get('name', ''))):
+        size = job.get('bytes') or 0
+        if lane == 'main' and (size > MAX_BATCH_BYTES or (job.get('files') or 0) > MAX_BATCH_FILES):
+            plan['deferred'].append(job)
+        elif plan['admitted'] and used + size > budget:
+            plan['queued'].append(job)
+        else:
+            plan['admitted'].append(job)
+            used += size
+    return plan
+
+
+def _wait_seconds(created_at: Optional[str], now: datetime) -> Optional[float]:
+    """Seconds since the sender created the job (created_at is UTC ISO), None if unknown."""
+    if not created_at:
+        return None
+    try:
+        return max(0.0, (now - datetime.fromisoformat(created_at.replace('Z', '+00:00')).replace(tzinfo=None)).total_seconds())
+    except ValueError:
+        return None
+
+
+def queue_report(plan: Dict[str, List[Dict[str, Any]]], lane: str, processed: List[str]) -> List[str]:
+    """
+    Summarize the queue at the end of a run: jobs per state with bytes and how long they waited.
+    
+    Args:
+        plan: Result of admit_jobs
+        lane: Lane of this run
+        processed: Names of admitted jobs that were extracted successfully
+        
+    Returns:
+        Report lines (markdown list items)
+    """
+    now = datetime.utcnow()
+    
+    def describe(jobs):
+        total = sum(job.get('bytes') or 0 for job in jobs)
+        waits = [w for w in (_wait_seconds(job.get('created_at'), now) for job in jobs) if w is not None]
+        wait = f", waited max {max(waits) / 60:.1f} min, avg {sum(waits) / len(waits) / 60:.1f} min" if waits else ""
+        return f"{len(jobs)} job(s), {total / 1048576:.1f} MB{wait}"
+    
+    lines = [
+        f"- Lane: {lane}",
+        f"- Admitted: {describe(plan['admitted'])} ({len(processed)} processed)",
+        f"- Queued for the next run (run budget): {describe(plan['queued'])}",
+        f"- Deferred to the large-batch lane: {describe(plan['deferred'])}",
+    ]
+    for state in ('queued', 'deferred'):
+        for job in plan[state]:
+            wait = _wait_seconds(job.get('created_at'), now)
+            size = f"{job['bytes'] / 1048576:.1f} MB" if job.get('bytes') is not None else "size unknown"
+            files = f", {job['files']} files" if job.get('files') is not None else ""
+            waited = f", waiting {wait / 60:.1f} min" if wait is not None else ""
+            lines.append(f"  - {state}: {job['name']} ({size}{files}{waited})")
+    return lines
+
+
+def write_queue_report(lines: List[str], logger: Optional[logging.Logger] = None) -> None:
+    """Log the queue report and add it to the Actions job summary when running in GitHub Actions."""
+    for line in lines:
+        if logger:
+            logger.info(line)
+        else:
+            print(line)
+    summary_path = os.getenv('GITHUB_STEP_SUMMARY')
+    if summary_path:
+        try:
+            with open(summary_path, 'a', encoding='utf-8') as f:
+                f.write("### Receiver queue\n\n" + "\n".join(lines) + "\n\n")
+        except OSError:
+            pass
+
+
+# =============================================================================
+# MAPPED PAYLOAD READING - Extract large raw payloads without loading them
+# =============================================================================
+# The raw file is memory-mapped; only the small values (batch metadata, file records)
+# are parsed, and each base64 content string is decoded in chunks straight from the
+# mapped buffer. Pages already extracted are released, so resident memory stays small.
+DECODE_CHUNK_CHARS = 4 * 1024 * 1024  # base64 characters decoded per step (multiple of 4)
+
+_WHITESPACE = b' \t\r\n'
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_SCALAR_END = re.compile(rb'[,}\]\s]')
+
+
+class _PayloadScanner:
+    """Walks the JSON structure of a mapped buffer, parsing only the values asked for"""
+    
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.pos = 0
+    
+    def peek(self) -> bytes:
+        """Next non-whitespace byte (pos moves to it)"""
+        buffer, pos, size = self.buffer, self.pos, len(self.buffer)
+        while pos < size and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self.pos = pos
+        return buffer[pos:pos + 1]
+    
+    def expect(self, char: bytes) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char.decode()} at byte {self.pos} of the payload")
+        self.pos += 1
+    
+    def string_span(self) -> Tuple[int, int]:
+        """(start, end) of the string at pos, without the quotes; pos moves past it"""
+        self.expect(b'"')
+        start = end = self.pos
+        while True:
+            end = self.buffer.find(b'"', end)
+            if end < 0:
+                raise ValueError(f"Unterminated string at byte {start} of the payload")
+            backslashes = 0
+            while end - backslashes > start and self.buffer[end - backslashes - 1] == 0x5C:
+                backslashes += 1
+            if backslashes % 2 == 0:
+                break
+            end += 1
+        self.pos = end + 1
+        return start, end
+    
+    def skip_value(self) -> Tuple[int, int]:
+        """(start, end) of the value at pos; pos moves past it"""
+        first = self.peek()
+        start = self.pos
+        if first == b'"':
+            self.string_span()
+        elif first in (b'{', b'['):
+            depth = 0
+            while True:
+                match = _STRUCTURAL.search(self.buffer, self.pos)
+                if match is None:
+                    raise ValueError(f"Unterminated value at byte {start} of the payload")
+                if match.group() == b'"':
+                    self.pos = match.start()
+                    self.string_span()
+                    continue
+                depth += 1 if match.group() in (b'{', b'[') else -1
+                self.pos = match.end()
+                if depth == 0:
+                    break
+        else:
+            match = _SCALAR_END.search(self.buffer, start)
+            self.pos = match.start() if match else len(self.buffer)
+        return start, self.pos
+    
+    def value(self) -> Any:
+        start, end = self.skip_value()
+        return json_io.loads(self.buffer[start:end])
+    
+    def members(self) -> Iterator[str]:
+        """Yield the keys of the object at pos; the caller consumes each value before resuming"""
+        self.expect(b'{')
+        if self.peek() == b'}':
+            self.pos += 1
+            return
+        while True:
+            start, end = self.string_span()
+            self.expect(b':')
+            yield json_io.loads(self.buffer[start - 1:end + 1])
+            separator = self.peek()
+            self.pos += 1
+            if separator == b'}':
+                return
+            if separator != b',':
+                raise ValueError(f"Expected , or }} at byte {self.pos - 1} of the payload")
+
+
+def iter_payload_files(buffer) -> Iterator[Tuple[str, Dict[str, Any], Optional[Tuple[int, int]]]]:
+    """
+    Iterate the files of a raw batch payload without parsing the payload as a whole
+    
+    Args:
+        buffer: Payload bytes (a mmap, bytes or any buffer supporting find)
+        
+    Returns:
+        Iterator of (key, file record without 'content', (start, end) of the base64
+        content string in buffer, or None when the record has no content string)
+    """
+    scanner = _PayloadScanner(buffer)
+    for key in scanner.members():
+        if key != 'files':
+            scanner.skip_value()
+            continue
+        for name in scanner.members():
+            info: Dict[str, Any] = {}
+            span = None
+            for field in scanner.members():
+                if field == 'content' and scanner.peek() == b'"':
+                    span = scanner.string_span()
+                else:
+                    info[field] = scanner.value()
+            yield name, info, span
+
+
+def _decode_span(buffer, view: memoryview, span: Tuple[int, int], out) -> int:
+    """Decode the base64 string at span of buffer into out, in chunks; returns bytes written"""
+    start, end = span
+    if (end - start) % 4 or buffer.find(b'\\', start, end) >= 0:
+        # Escaped or line-wrapped base64 (the sender writes neither): decode it whole
+        return out.write(base64.b64decode(json_io.loads(buffer[start - 1:end + 1])))
+    written = 0
+    for pos in range(start, end, DECODE_CHUNK_CHARS):
+        written += out.write(binascii.a2b_base64(view[pos:min(pos + DECODE_CHUNK_CHARS, end)]))
+    return written
+
+
+def safe_relative_path(relative_path: str) -> str:
+    """Normalize separators and drop empty, '.' and '..' parts so the path stays inside the job folder"""
+    parts = [part for part in Path(relative_path.replace('\\', '/')).parts if part not in ('', '.', '..', '/')]
+    return str(Path(*parts)) if parts else ''
+
+
+def extract_payload_mapped(json_path: Path, out_root: Path) -> Path:
+    """
+    Extract a raw batch payload into out_root/<payload name>/ from a memory map of the file
+    
+    Args:
+        json_path: Raw payload (_temp_storage/<job_name>.json)
+        out_root: Extraction root (_data_received)
+        
+    Returns:
+        The job folder
+    """
+    job_dir = out_root / json_path.stem
+    job_dir.mkdir(parents=True, exist_ok=True)
+    if json_path.stat().st_size == 0:
+        raise ValueError(f"Empty payload: {json_path}")
+    with open(json_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        view = memoryview(buffer)
+        try:
+            released = 0
+            for name, info, span in iter_payload_files(buffer):
+                relative_path = safe_relative_path(name)
+                if span is None or span[0] == span[1] or not relative_path:
+                    continue
+                dest = job_dir / relative_path
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                with open(dest, 'wb') as out:
+                    _decode_span(buffer, view, span, out)
+                # Drop the extracted pages from resident memory (they stay in the page cache)
+                release_to = span[1] - span[1] % mmap.PAGESIZE
+                if hasattr(mmap, 'MADV_DONTNEED') and release_to > released:
+                    buffer.madvise(mmap.MADV_DONTNEED, released, release_to - released)
+                    released = release_to
+        finally:
+            view.release()
+    return job_dir
+
+
 class HealthMetricReceiver:
     """Handles receiving and processing data from GitHub repository"""
     
@@ -43,6 +348,7 @@ class HealthMetricReceiver:
         self.repo_name = repo_name
         self.github = Github(auth=Auth.Token(self.token))
         self.repo = self.github.get_repo(self.repo_name)
+        self._listing_sizes: Dict[str, Dict[str, int]] = {}  # folder -> {path: size}, one listing per run
         
         # Setup logging
         self.setup_logging()
@@ -96,14 +402,8 @@ class HealthMetricReceiver:
             Processed batch data dictionary
         """
         try:
-            # Decode content
-            if isinstance(content, bytes):
-                content_str = content.decode('utf-8')
-            else:
-                content_str = content
-            
-            # Parse JSON
-            batch_data = json.loads(content_str)
+            # Parse JSON (bytes or text)
+            batch_data = json_io.loads(content)
             
             # Check if this is a batch payload
             if 'batch_metadata' not in batch_data or 'files' not in batch_data:
@@ -128,15 +428,7 @@ class HealthMetricReceiver:
                     file_content = base64.b64decode(file_info['content'])
                     
                     # Prefer relative_path from payload to reconstruct folders
-                    relative_path = file_info.get('relative_path', file_name)
-                    # Normalize separators and sanitize path components
-                    relative_path = relative_path.replace('\\', '/')
-                    safe_parts = []
-                    for part in Path(relative_path).parts:
-                        if part in ('', '.', '..'):
-                            continue
-                        safe_parts.append(part)
-                    relative_path = str(Path(*safe_parts))
+                    relative_path = safe_relative_path(file_info.get('relative_path', file_name))
 
                     # Save individual file to batch folder preserving structure
                     self.logger.info(f"Extracting file: name={file_name}, rel={relative_path}, size={len(file_content)} bytes")
@@ -278,14 +570,8 @@ class HealthMetricReceiver:
             Processed data dictionary
         """
         try:
-            # Decode content
-            if isinstance(content, bytes):
-                content_str = content.decode('utf-8')
-            else:
-                content_str = content
-            
-            # Parse JSON
-            data = json.loads(content_str)
+            # Parse JSON (bytes or text)
+            data = json_io.loads(content)
             
             # Add processing metadata
             processed_data = {
@@ -347,8 +633,7 @@ class HealthMetricReceiver:
             # Save to local storage
             output_path = storage_dir / processed_filename
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(processed_data, f, indent=2, ensure_ascii=False)
+            json_io.dump(processed_data, output_path, pretty=True)
             
             self.logger.info(f"Saved processed data to: {output_path}")
             return True
@@ -357,10 +642,9 @@ class HealthMetricReceiver:
             self.logger.error(f"Error saving processed data: {str(e)}")
             return False
     
-    def get_triggers(self) -> List[Dict[str, Any]]:
-        """List trigger files from the repository (.github/triggers)"""
+    def get_triggers(self, trigger_dir: str = TRIGGER_DIR) -> List[Dict[str, Any]]:
+        """List trigger files from the repository (.github/triggers or another lane)"""
         try:
-            trigger_dir = ".github/triggers"
             try:
                 contents = self.repo.get_contents(trigger_dir)
             except Exception as e:
@@ -413,25 +697,6 @@ class HealthMetricReceiver:
             self.logger.error(f"Error downloading url {url}: {str(e)}")
             return None
 
-    def _load_trigger_payload(self, trigger_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        if trigger_info.get('download_url'):
-            content = self._download_by_url(trigger_info['download_url'])
-        else:
-            try:
-                lp = trigger_info.get('local_path') or trigger_info.get('path')
-                with open(lp, 'rb') as f:
-                    content = f.read()
-            except Exception as e:
-                self.logger.error(f"Error reading local trigger {trigger_info.get('name')}: {str(e)}")
-                content = None
-        if content is None:
-            return None
-        try:
-            return json.loads(content.decode('utf-8'))
-        except Exception as e:
-            self.logger.error(f"Invalid trigger JSON {trigger_info['name']}: {str(e)}")
-            return None
-
     def _download_repo_file(self, path: str) -> Optional[bytes]:
         try:
             file_obj = self.repo.get_contents(path)
@@ -476,9 +741,25 @@ class HealthMetricReceiver:
         except Exception as e:
             self.logger.error(f"Error archiving trigger {trigger_info['name']}: {str(e)}")
 
+    def _pending_raw_paths(self) -> Set[str]:
+        """raw_path of every trigger still waiting in the workspace (main and deferred lanes)"""
+        pending = set()
+        for trigger_dir in LANES.values():
+            for trigger_path in Path(trigger_dir).glob("*.json"):
+                try:
+                    raw_path = json_io.load(trigger_path).get('raw_path')
+                except Exception as e:
+                    self.logger.error(f"Error reading trigger {trigger_path}: {str(e)}")
+                    continue
+                if raw_path:
+                    pending.add(raw_path.replace('\\', '/'))
+        return pending
+
     def _retain_temp_storage(self, days: int = 10) -> None:
+        """Delete raw payloads older than days, except those a pending (or deferred) trigger still points to"""
         try:
             cutoff = datetime.utcnow().timestamp() - days * 86400
+            pending = self._pending_raw_paths()
             try:
                 contents = self.repo.get_contents("_temp_storage")
             except Exception as e:
@@ -502,6 +783,9 @@ class HealthMetricReceiver:
                         # Fallback: keep if unknown
                         continue
                     if ts < cutoff:
+                        if content.path in pending:
+                            self.logger.info(f"Keeping old temp file with a pending trigger: {content.path}")
+                            continue
                         # Delete locally; workflow will commit the deletion
                         local_path = Path(content.path)
                         if local_path.exists():
@@ -512,18 +796,58 @@ class HealthMetricReceiver:
         except Exception as e:
             self.logger.error(f"Error enforcing retention: {str(e)}")
 
-    def process_triggers(self) -> Dict[str, Any]:
-        """Process all triggers: unpack raw payloads into _data_received and clean up"""
+    def _raw_payload_size(self, raw_path: str) -> Optional[int]:
+        """Size of a raw payload without downloading it: the workspace checkout, else the repo listing"""
+        local_path = Path(raw_path)
+        if local_path.exists():
+            return local_path.stat().st_size
+        folder = str(Path(raw_path).parent).replace('\\', '/')
+        if folder not in self._listing_sizes:
+            sizes = {}
+            try:
+                for content in self.repo.get_contents(folder):
+                    sizes[content.path] = content.size
+            except Exception as e:
+                self.logger.error(f"Error listing {folder} for payload sizes: {str(e)}")
+            self._listing_sizes[folder] = sizes
+        return self._listing_sizes[folder].get(raw_path)
+
+    def _defer_trigger(self, trigger_info: Dict[str, Any], content_bytes: bytes) -> None:
+        """Move trigger file to the deferred lane locally (workflow will commit changes)"""
+        try:
+            deferred_dir = Path(DEFERRED_TRIGGER_DIR)
+            deferred_dir.mkdir(parents=True, exist_ok=True)
+            (deferred_dir / trigger_info['name']).write_bytes(content_bytes)
+            original_path = Path(trigger_info['path'])
+            if original_path.exists():
+                original_path.unlink()
+            self.logger.info(f"Deferred trigger to {DEFERRED_TRIGGER_DIR}: {trigger_info['name']}")
+        except Exception as e:
+            self.logger.error(f"Error deferring trigger {trigger_info['name']}: {str(e)}")
+
+    def process_triggers(self, lane: str = 'main') -> Dict[str, Any]:
+        """
+        Process triggers: unpack raw payloads into _data_received and clean up
+        
+        Batches are admitted from their declared sizes first (see admit_jobs): oversized
+        batches move to the deferred lane and batches over the run budget stay queued.
+        
+        Args:
+            lane: 'main' (.github/triggers) or 'deferred' (.github/triggers_deferred)
+        """
         results = {
             'processed_jobs': [],
             'failed_jobs': [],
+            'deferred_jobs': [],
+            'queued_jobs': [],
             'processed_at': datetime.now().isoformat()
         }
 
-        triggers = self.get_triggers()
-        self.logger.info(f"Discovered {len(triggers)} trigger(s) to process")
+        triggers = self.get_triggers(LANES[lane])
+        self.logger.info(f"Discovered {len(triggers)} trigger(s) to process in the {lane} lane")
+        jobs = []
         for trig in triggers:
-            self.logger.info(f"Processing trigger: {trig.get('name')} (path={trig.get('path')}, local={trig.get('local_path', '')})")
+            self.logger.info(f"Reading trigger: {trig.get('name')} (path={trig.get('path')}, local={trig.get('local_path', '')})")
             
             # Try to download if download_url is available
             trig_bytes = None
@@ -541,8 +865,12 @@ class HealthMetricReceiver:
                     self.logger.error(f"Failed to load trigger from local file {lp}: {e}")
                     results['failed_jobs'].append({'trigger': trig['name'], 'error': f'Failed to load trigger: {str(e)}'})
                     continue
-            trig_payload = self._load_trigger_payload(trig)
-            if trig_payload is None:
+            try:
+                trig_payload = json_io.loads(trig_bytes)
+            except Exception as e:
+                self.logger.error(f"Invalid trigger JSON {trig['name']}: {str(e)}")
+                trig_payload = None
+            if not isinstance(trig_payload, dict):
                 results['failed_jobs'].append({'trigger': trig['name'], 'error': 'Invalid trigger payload'})
                 continue
 
@@ -552,6 +880,31 @@ class HealthMetricReceiver:
                 results['failed_jobs'].append({'trigger': trig['name'], 'error': 'Missing raw_path'})
                 continue
 
+            # Declared sizes only; the raw payload is not downloaded before admission
+            jobs.append({
+                'name': job_name,
+                'raw_path': raw_path,
+                'trigger': trig,
+                'trigger_bytes': trig_bytes,
+                'files': trig_payload.get('total_files'),
+                'bytes': estimate_payload_bytes(self._raw_payload_size(raw_path), trig_payload.get('total_bytes')),
+                'created_at': trig_payload.get('created_at') or ''
+            })
+
+        plan = admit_jobs(jobs, lane)
+        for job in plan['deferred']:
+            self._defer_trigger(job['trigger'], job['trigger_bytes'])
+            results['deferred_jobs'].append({'job_name': job['name'], 'bytes': job['bytes'], 'files': job['files']})
+        for job in plan['queued']:
+            self.logger.info(f"Run budget used; {job['name']} stays queued for the next run")
+            results['queued_jobs'].append({'job_name': job['name'], 'bytes': job['bytes'], 'files': job['files']})
+
+        for job in plan['admitted']:
+            trig = job['trigger']
+            job_name = job['name']
+            raw_path = job['raw_path']
+            self.logger.info(f"Processing trigger: {trig['name']} ({job['bytes'] if job['bytes'] is not None else '?'} bytes)")
+
             # Download raw payload from repo with small retry for eventual consistency
             raw_bytes = None
             for attempt in range(5):
@@ -565,6 +918,7 @@ class HealthMetricReceiver:
 
             # Process batch into _data_received/job_name
             processed = self.process_batch_payload(raw_bytes, f"{job_name}.json")
+            del raw_bytes
             self.logger.info(f"Wrote extraction for job {job_name} into _data_received/{job_name}")
 
             # Skip writing job summaries to _storage_meta
@@ -581,7 +935,7 @@ class HealthMetricReceiver:
                 self.logger.info(f"KEEP_TEMP_STORAGE enabled; retaining raw package {raw_path}")
 
             # Archive/delete trigger
-            self._move_trigger_to_processed(trig, trig_bytes)
+            self._move_trigger_to_processed(trig, job['trigger_bytes'])
 
             results['processed_jobs'].append({'job_name': job_name, 'raw_path': raw_path})
 
@@ -590,6 +944,9 @@ class HealthMetricReceiver:
         if enforce_retention:
             self._retain_temp_storage(days=10)
 
+        results['queue_report'] = queue_report(plan, lane, [job['job_name'] for job in results['processed_jobs']])
+        self.logger.info("Queue report:")
+        write_queue_report(results['queue_report'], self.logger)
         return results
     
     def cleanup_trigger_files(self):
@@ -620,13 +977,13 @@ class HealthMetricReceiver:
         except Exception as e:
             self.logger.error(f"Error cleaning up trigger files: {str(e)}")
     
-    def run(self):
+    def run(self, lane: str = 'main'):
         """Main processing loop"""
         try:
-            self.logger.info("HealthMetric Receiver starting...")
+            self.logger.info(f"HealthMetric Receiver starting ({lane} lane)...")
 
             # Process triggers-driven pipeline
-            results = self.process_triggers()
+            results = self.process_triggers(lane)
 
             # Skip writing run summary to disk
             self.logger.info("HealthMetric Receiver completed successfully")
@@ -637,40 +994,25 @@ class HealthMetricReceiver:
             return False
 
 
-def _run_local_mode() -> bool:
+def _run_local_mode(lane: str = 'main') -> bool:
     """Process triggers and payloads locally without GitHub API.
 
-    - Reads triggers from .github/triggers
-    - Unpacks raw payloads from _temp_storage into _data_received/<job_name>/
+    - Reads triggers from .github/triggers (.github/triggers_deferred for the deferred lane)
+    - Admits batches by size like process_triggers (admit_jobs)
+    - Unpacks raw payloads from _temp_storage into _data_received/<job_name>/ (memory-mapped)
     - Archives triggers to .github/triggers_processed
     """
     try:
         from pathlib import Path
-        import json
         import shutil
         # Reuse local unpack helper
         try:
             from receiver.local_unpack import extract_job  # type: ignore
         except Exception:
-            # Fallback: minimal inline extractor
-            import base64
-
-            def extract_job(json_path: Path, out_root: Path) -> Path:
-                data = json.loads(json_path.read_text(encoding="utf-8"))
-                job_dir = out_root / json_path.stem
-                job_dir.mkdir(parents=True, exist_ok=True)
-                files = data.get("files", {})
-                for rel, info in files.items():
-                    b64 = info.get("content")
-                    if not b64:
-                        continue
-                    content = base64.b64decode(b64)
-                    dest = job_dir / rel
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    dest.write_bytes(content)
-                return job_dir
+            # Fallback: memory-mapped extractor (decodes file by file, the payload is never loaded whole)
+            extract_job = extract_payload_mapped
 
-        trigger_dir = Path(".github/triggers")
+        trigger_dir = Path(LANES[lane])
         processed_dir = Path(".github/triggers_processed")
         processed_dir.mkdir(parents=True, exist_ok=True)
         out_root = Path("_data_received")
@@ -685,9 +1027,10 @@ def _run_local_mode() -> bool:
             print("No local triggers found.")
             return True
 
+        jobs = []
         for trig_path in triggers:
             try:
-                payload = json.loads(trig_path.read_text(encoding="utf-8"))
+                payload = json_io.load(trig_path)
                 raw_path = payload.get("raw_path")
                 job_name = payload.get("job_name") or trig_path.stem
                 if not raw_path:
@@ -697,14 +1040,38 @@ def _run_local_mode() -> bool:
                 if not raw_json.exists():
                     print(f"Skip {trig_path.name}: raw payload not found {raw_path}")
                     continue
+                jobs.append({
+                    'name': job_name,
+                    'trigger': trig_path,
+                    'raw_json': raw_json,
+                    'files': payload.get("total_files"),
+                    'bytes': raw_json.stat().st_size,
+                    'created_at': payload.get("created_at") or ''
+                })
+            except Exception as inner:
+                print(f"Error reading {trig_path.name}: {inner}")
+
+        plan = admit_jobs(jobs, lane)
+        for job in plan['deferred']:
+            deferred_dir = Path(DEFERRED_TRIGGER_DIR)
+            deferred_dir.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(job['trigger']), str(deferred_dir / job['trigger'].name))
+            print(f"Deferred {job['name']} ({job['bytes']} bytes) to {DEFERRED_TRIGGER_DIR}")
+
+        processed = []
+        for job in plan['admitted']:
+            trig_path = job['trigger']
+            try:
                 # Extract
-                job_dir = extract_job(raw_json, out_root)
+                job_dir = extract_job(job['raw_json'], out_root)
                 # Archive trigger
                 dest = processed_dir / trig_path.name
                 shutil.move(str(trig_path), str(dest))
-                print(f"Processed {job_name} -> {job_dir}")
+                processed.append(job['name'])
+                print(f"Processed {job['name']} -> {job_dir}")
             except Exception as inner:
                 print(f"Error processing {trig_path.name}: {inner}")
+        write_queue_report(queue_report(plan, lane, processed))
         return True
     except Exception as e:
         print(f"Local mode failed: {e}")
@@ -720,6 +1087,8 @@ def main():
     parser.add_argument("--repo", default="ennead-architects-llp/HealthMetric", help="Repository name")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--local", action="store_true", help="Run in local mode without GitHub API")
+    parser.add_argument("--lane", choices=sorted(LANES), default="main",
+                        help="Trigger lane: main, or deferred for batches over the per-batch limits")
     
     args = parser.parse_args()
     
@@ -729,13 +1098,13 @@ def main():
     
     # Local mode: no GitHub required
     if args.local or not (args.token or os.getenv('GITHUB_TOKEN')):
-        success = _run_local_mode()
+        success = _run_local_mode(args.lane)
         print("✅ Data processing completed successfully!" if success else "❌ Data processing failed")
         return 0 if success else 1
     
     try:
         receiver = HealthMetricReceiver(token=args.token, repo_name=args.repo)
-        success = receiver.run()
+        success = receiver.run(args.lane)
         
         if success:
             print("✅ Data processing completed successfully!")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - JSON Backend Benchmark
+==============================================
+
+Measures docs/ref/json_io.py with every installed backend (json, orjson,
+msgspec) on synthetic .sexyDuck documents of increasing size:
+
+    loads    parse the 4-space indented file bytes (as exported)
+    compact  json_io.dumpb(pretty=False)
+    pretty   json_io.dumpb(pretty=True)
+
+Reports MB/s per backend and the speedup over stdlib json.
+
+Usage:
+    python scripts/benchmark_json.py
+    python scripts/benchmark_json.py --scales 1 10 40 --repeat 5
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "docs" / "ref"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import json_io
+from synthetic_sexyduck import generate_sexy_duck
+
+BACKENDS = ['json', 'orjson', 'msgspec']
+
+
+def use_backend(name):
+    """Reload json_io with a forced backend; returns the module or None if unavailable."""
+    os.environ['HEALTHMETRIC_JSON_BACKEND'] = name
+    module = importlib.reload(json_io)
+    return module if module.BACKEND == name else None
+
+
+def best_of(func, items, repeat):
+    """Best wall time of `repeat` passes of func over items."""
+    seconds = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        seconds = min(seconds, time.perf_counter() - start)
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark json_io backends on synthetic .sexyDuck documents")
+    parser.add_argument("--scales", type=float, nargs='+', default=[1, 10, 40],
+                        help="Document size multipliers (default: 1 10 40, ~50 KB to ~2 MB)")
+    parser.add_argument("--count", type=int, default=20, help="Documents per scale (default: 20)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes, best kept (default: 3)")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("🧪 JSON Backend Benchmark")
+    print("=" * 78)
+
+    rng = random.Random(42)
+    print(f"{'scale':>6} {'avg KB':>8} {'backend':<8} {'loads MB/s':>11} {'compact MB/s':>13} {'pretty MB/s':>12} {'vs json':>8}")
+    for scale in args.scales:
+        documents = [
+            generate_sexy_duck(rng, 'Synthetic Hub', 'Synthetic Project', f"SYN_{i:04d}",
+                               datetime(2025, 9, 1, 9, 0, 0), scale)
+            for i in range(args.count)
+        ]
+        raw = [json.dumps(document, indent=4, ensure_ascii=False).encode('utf-8') for document in documents]
+        megabytes = sum(len(r) for r in raw) / 1048576
+
+        baseline = None
+        for backend in BACKENDS:
+            module = use_backend(backend)
+            if module is None:
+                continue
+            loads = megabytes / best_of(module.loads, raw, args.repeat)
+            compact = megabytes / best_of(lambda d: module.dumpb(d), documents, args.repeat)
+            pretty = megabytes / best_of(lambda d: module.dumpb(d, pretty=True), documents, args.repeat)
+            if baseline is None:
+                baseline = loads + compact
+            speedup = (loads + compact) / baseline
+            print(f"{scale:>6g} {megabytes * 1024 / len(raw):>8.0f} {backend:<8} {loads:>11.1f} "
+                  f"{compact:>13.1f} {pretty:>12.1f} {speedup:>7.1f}x")
+
+    installed = [backend for backend in BACKENDS if use_backend(backend) is not None]
+    os.environ.pop('HEALTHMETRIC_JSON_BACKEND', None)
+    print(f"\nInstalled backends: {', '.join(installed)} (default: {importlib.reload(json_io).BACKEND})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
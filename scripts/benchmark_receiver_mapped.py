@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Receiver Mapped Extraction Benchmark
+=============================================================
+
+Compares the two ways local mode (receiver.py --local) can unpack a raw batch
+payload from _temp_storage into _data_received/<job_name>/:
+
+    loaded   parse the whole payload (json_io.load), then base64-decode each file
+             (the previous inline extractor)
+    mapped   extract_payload_mapped(): memory-map the file, parse only the file
+             records and decode each content string in chunks from the map
+
+Each mode runs in a fresh interpreter on the same synthetic payload and reports
+wall time and peak resident memory; the extracted trees must be identical.
+Peak memory needs the resource module (Linux/macOS); it shows n/a elsewhere.
+
+Usage:
+    python scripts/benchmark_receiver_mapped.py
+    python scripts/benchmark_receiver_mapped.py --mb 500 --files 200
+"""
+
+import argparse
+import base64
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+RUNNER = r'''
+import sys, time, base64
+sys.path.insert(0, sys.argv[1])
+from pathlib import Path
+import receiver
+mode, raw, out = sys.argv[2], Path(sys.argv[3]), Path(sys.argv[4])
+start = time.perf_counter()
+if mode == "mapped":
+    receiver.extract_payload_mapped(raw, out)
+else:
+    data = receiver.json_io.load(raw)
+    job_dir = out / raw.stem
+    for rel, info in data.get("files", {}).items():
+        if info.get("content"):
+            dest = job_dir / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(base64.b64decode(info["content"]))
+seconds = time.perf_counter() - start
+try:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak = peak / 1048576 if sys.platform == "darwin" else peak / 1024
+except ImportError:
+    peak = -1
+print(f"{seconds} {peak}")
+'''
+
+
+def write_payload(path, megabytes, files):
+    """Synthetic raw payload shaped like the sender's, written file by file (never held whole)."""
+    size = megabytes * 1024 * 1024 // files
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"batch_metadata": {"total_files": %d}, "files": {' % files)
+        for i in range(files):
+            rel = f"task_output/job_{i % 10:02d}/model_{i:04d}.sexyDuck"
+            content = base64.b64encode(os.urandom(size)).decode('ascii')
+            f.write('%s"%s": {"filename": "model_%04d.sexyDuck", "relative_path": "%s", "size": %d, '
+                    '"content": "%s"}' % (',' if i else '', rel, i, rel, size, content))
+        f.write('}}')
+
+
+def tree_digest(root):
+    digest = hashlib.sha256()
+    for path in sorted(p for p in Path(root).rglob('*') if p.is_file()):
+        digest.update(str(path.relative_to(root)).encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare loaded and memory-mapped raw payload extraction")
+    parser.add_argument("--mb", type=int, default=200, help="Decoded file bytes in the payload, MB (default: 200)")
+    parser.add_argument("--files", type=int, default=100, help="Files in the payload (default: 100)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🧪 Receiver Mapped Extraction Benchmark")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory(prefix="healthmetric_mapped_") as temp:
+        raw = Path(temp) / "revit_slave_benchmark.json"
+        write_payload(raw, args.mb, args.files)
+        print(f"Payload: {raw.stat().st_size / 1048576:.0f} MB raw, {args.files} files")
+
+        print(f"\n{'mode':<8} {'seconds':>8} {'peak RSS MB':>12}")
+        digests = {}
+        for mode in ("loaded", "mapped"):
+            out = Path(temp) / mode
+            result = subprocess.run([sys.executable, "-c", RUNNER, str(PROJECT_ROOT / "receiver"), mode, str(raw), str(out)],
+                                    capture_output=True, text=True, check=True)
+            seconds, peak = (float(value) for value in result.stdout.split()[-2:])
+            print(f"{mode:<8} {seconds:>8.2f} {peak:>12.0f}" if peak >= 0 else f"{mode:<8} {seconds:>8.2f} {'n/a':>12}")
+            digests[mode] = tree_digest(out)
+
+    same = digests["loaded"] == digests["mapped"]
+    print(f"\nExtracted trees identical: {'yes' if same else 'NO'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
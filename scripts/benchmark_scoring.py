@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Batch Scoring Benchmark
+===============================================
+
+Compares one-at-a-time scoring (score_metrics per model) with the batch
+score_many API on synthetic extracted-metric rows, and checks that totals
+and grades are identical.
+
+Usage:
+    python scripts/benchmark_scoring.py
+    python scripts/benchmark_scoring.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "docs" / "ref"))
+import scoring
+from scoring import SCORING_METRICS, score_metrics, score_many
+
+
+def synthetic_metric_rows(count, seed=42):
+    """Generate extracted-metric rows with realistic ranges (many zeros, some over max)."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        row = {}
+        for name, config in SCORING_METRICS.items():
+            if rng.random() < 0.3:
+                row[name] = 0
+            else:
+                row[name] = rng.randint(0, int(config['max'] * 2))
+        row['File size'] = rng.uniform(5, 1500)
+        rows.append(row)
+    return rows
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch scoring")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🧪 Batch Scoring Benchmark")
+    print("=" * 70)
+    print(f"NumPy backend: {'available' if scoring.np is not None else 'not installed (pure Python fallback)'}")
+    print()
+    print(f"{'models':>10} {'loop (s)':>12} {'batch (s)':>12} {'speedup':>10} {'match':>8}")
+
+    all_match = True
+    for size in args.sizes:
+        rows = synthetic_metric_rows(size)
+        loop_results, loop_seconds = time_call(lambda r: [score_metrics(row) for row in r], rows)
+        batch, batch_seconds = time_call(score_many, rows)
+
+        match = (
+            batch['total_score'] == [r['total_score'] for r in loop_results]
+            and batch['grade'] == [r['grade'] for r in loop_results]
+        )
+        all_match = all_match and match
+        speedup = loop_seconds / batch_seconds if batch_seconds > 0 else float('inf')
+        print(f"{size:>10} {loop_seconds:>12.3f} {batch_seconds:>12.3f} {speedup:>9.1f}x {'✅' if match else '❌':>7}")
+
+    return 0 if all_match else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
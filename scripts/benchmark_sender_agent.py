@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Sender Agent Benchmark
+==============================================
+
+Measures the change detection used by sender agent mode (sender.py --agent)
+on a synthetic RevitSlaveDatabase tree, against the full rescan the one-shot
+sender does on every run:
+
+    full rescan     walk + stat every file with the send rules (one-shot sender)
+    first poll      FolderWatcher.poll() with an empty cache
+    idle poll       poll with nothing changed (one stat per folder)
+    1 new file      poll after one job folder received one new file
+
+Then simulates Revit jobs writing output in bursts while the agent runs with
+short intervals (nothing is sent; send_data_and_trigger_dispatch is replaced
+by a recorder) and reports batches, files per batch and the delay from the
+last write of a file to the batch that carried it. No network access.
+
+Usage:
+    python scripts/benchmark_sender_agent.py
+    python scripts/benchmark_sender_agent.py --jobs 500 --files-per-job 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "sender"))
+
+# Smallest .sexyDuck the sender's validation accepts
+SEXY_DUCK = b'{"job_metadata": {"model_file_size_bytes": 1024, "model_name": "benchmark"}, "result_data": {}}'
+
+
+def build_tree(root, jobs, files_per_job):
+    """task_output/<job>/<model>.sexyDuck plus _debug noise, like a RevitSlaveDatabase folder."""
+    for job in range(jobs):
+        job_dir = root / "task_output" / f"job_{job:05d}"
+        job_dir.mkdir(parents=True)
+        for i in range(files_per_job):
+            (job_dir / f"model_{i:03d}.sexyDuck").write_bytes(SEXY_DUCK)
+    debug_dir = root / "_debug"
+    debug_dir.mkdir()
+    for i in range(jobs):
+        (debug_dir / f"debug_{i:05d}.txt").write_bytes(b"debug")
+
+
+def best_ms(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def simulate(sender_module, root, bursts, files_per_burst):
+    """Run the agent while bursts of files are written under root; returns (batches, delays)."""
+    batches = []
+    last_write = {}
+
+    class RecordingSender(sender_module.HealthMetricSender):
+        def send_data_and_trigger_dispatch(self, data, filename, job_name, source_label, user_name=None):
+            batches.append((time.time(), list(data['files'])))
+            return True
+
+    def writer():
+        for burst in range(bursts):
+            job_dir = root / "task_output" / f"burst_{burst:03d}"
+            job_dir.mkdir(parents=True)
+            for i in range(files_per_burst):
+                path = job_dir / f"model_{i:03d}.sexyDuck"
+                path.write_bytes(SEXY_DUCK)
+                last_write[f"task_output/{job_dir.name}/{path.name}"] = time.time()
+                time.sleep(0.05)
+            time.sleep(1.5)
+
+    agent = RecordingSender()
+    agent.default_source_folder = str(root)
+    thread = threading.Thread(target=writer)
+    thread.start()
+    agent.run_agent(poll_seconds=0.1, debounce_seconds=0.5, max_delay_seconds=3,
+                    full_rescan_seconds=60, batch_files=50,
+                    max_polls=int((bursts * (files_per_burst * 0.05 + 1.5) + 3) / 0.1))
+    thread.join()
+    delays = [sent_at - last_write[path] for sent_at, files in batches for path in files if path in last_write]
+    return batches, delays
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure sender agent change detection and batching")
+    parser.add_argument("--jobs", type=int, default=200, help="Job folders in the synthetic tree (default: 200)")
+    parser.add_argument("--files-per-job", type=int, default=10, help="Files per job folder (default: 10)")
+    parser.add_argument("--bursts", type=int, default=4, help="Simulated Revit jobs (default: 4)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes, best kept (default: 5)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🧪 Sender Agent Benchmark")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory(prefix="healthmetric_agent_") as temp:
+        root = Path(temp) / "RevitSlaveDatabase"
+        build_tree(root, args.jobs, args.files_per_job)
+        os.environ['HEALTHMETRIC_AGENT_STATE'] = str(Path(temp) / "agent_state.json")
+        os.environ['HEALTHMETRIC_VALIDATION_CACHE'] = str(Path(temp) / "validation.json")
+        import sender
+
+        rules = sender.SendRules.load()
+        total = args.jobs * args.files_per_job
+        print(f"Tree: {total} files in {args.jobs} job folders (+{args.jobs} excluded debug files), rules: {rules.source}")
+
+        def full_rescan():
+            skipped = {key: 0 for key in ('excluded', 'not_included', 'too_large', 'too_old', 'over_quota', 'bytes')}
+            sender.HealthMetricSender._select_files(None, root, rules, skipped)
+
+        watcher = sender.FolderWatcher(str(root), rules)
+        print(f"\n{'measurement':<14} {'best ms':>9}")
+        print(f"{'full rescan':<14} {best_ms(full_rescan, args.repeat):>9.1f}")
+        first = best_ms(lambda: sender.FolderWatcher(str(root), rules).poll(), args.repeat)
+        print(f"{'first poll':<14} {first:>9.1f}")
+        watcher.poll()
+        print(f"{'idle poll':<14} {best_ms(watcher.poll, args.repeat):>9.1f}")
+        counter = iter(range(args.repeat))
+
+        def poll_new_file():
+            (root / "task_output" / "job_00000" / f"new_{next(counter)}.sexyDuck").write_bytes(b"{}")
+            changed = watcher.poll()
+            assert len(changed) == 1, changed
+
+        print(f"{'1 new file':<14} {best_ms(poll_new_file, args.repeat):>9.1f}")
+
+        print(f"\nSimulating {args.bursts} Revit job(s) writing 10 files each into an empty folder...")
+        sim_root = Path(temp) / "SimulatedDatabase"
+        sim_root.mkdir()
+        batches, delays = simulate(sender, sim_root, args.bursts, 10)
+        new_files = args.bursts * 10
+        sent_new = len(delays)
+        print(f"Batches: {len(batches)}, files per batch: {[len(files) for _, files in batches]}")
+        print(f"Files sent: {sent_new}/{new_files}")
+        if delays:
+            print(f"Delay after last write: median {statistics.median(delays):.2f}s, max {max(delays):.2f}s")
+    return 0 if sent_new == new_files else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
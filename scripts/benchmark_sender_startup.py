@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Sender Startup Benchmark
+================================================
+
+Measures how fast the sender reaches its first decision when there is nothing
+to send (no network access is needed - the GitHub connection is never opened):
+
+    import          time to import sender.py (script mode only)
+    missing folder  process start to exit, RevitSlaveDatabase folder does not exist
+    empty folder    process start to exit, folder exists but holds no files
+
+The script is run through a small wrapper that points sender.USERS_ROOT at a
+temp users folder before calling sender.main() (the sender itself only searches
+its canonical per-user folder). The frozen executable built by
+build_sender_exe.bat cannot be redirected, so when it exists
+(sender/dist/HealthMetricSender.exe) or is given with --exe it is measured once
+against this machine's real folder ("installed folder").
+
+Usage:
+    python scripts/benchmark_sender_startup.py
+    python scripts/benchmark_sender_startup.py --exe path/to/HealthMetricSender.exe --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Same relative path as sender.SOURCE_FOLDER_SUFFIX (importing sender here would skew the timings)
+SOURCE_FOLDER_SUFFIX = Path("Documents", "EnneadTab Ecosystem", "Dump", "RevitSlaveDatabase")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SENDER_SCRIPT = PROJECT_ROOT / "sender" / "sender.py"
+DEFAULT_EXE = PROJECT_ROOT / "sender" / "dist" / "HealthMetricSender.exe"
+BENCHMARK_USER = "healthmetric_benchmark"
+
+# python sender/sender.py, with the users root monkeypatched to argv[2]
+WRAPPER = (
+    "import sys; sys.path.insert(0, sys.argv[1]); import sender; "
+    "sender.USERS_ROOT = sys.argv[2]; sys.argv = sys.argv[:1]; sys.exit(sender.main())"
+)
+
+
+def time_process(command, runs, cwd):
+    """Median and best wall time (ms) of running command until it exits."""
+    # The sender takes the current user from USERNAME/USER
+    env = dict(os.environ, USERNAME=BENCHMARK_USER, USER=BENCHMARK_USER)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, env=env, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), min(times)
+
+
+def time_import(runs):
+    """Median and best in-process import time (ms) of sender.py, each in a fresh interpreter."""
+    code = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]); start = time.perf_counter(); "
+        "import sender; sys.__stdout__.write(str((time.perf_counter() - start) * 1000))"
+    )
+    times = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", code, str(SENDER_SCRIPT.parent)],
+                                capture_output=True, text=True, check=True)
+        times.append(float(result.stdout.strip()))
+    return statistics.median(times), min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure sender startup and time to first decision")
+    parser.add_argument("--exe", type=Path, default=DEFAULT_EXE, help="Frozen sender executable")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement (default: 10)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🧪 Sender Startup Benchmark")
+    print("=" * 70)
+
+    if not args.exe.exists():
+        print(f"Executable not found ({args.exe}) - build it with build_sender_exe.bat to include it")
+
+    print(f"\n{'target':<8} {'measurement':<16} {'median ms':>10} {'best ms':>9}")
+    median, best = time_import(args.runs)
+    print(f"{'script':<8} {'import':<16} {median:>10.1f} {best:>9.1f}")
+
+    with tempfile.TemporaryDirectory(prefix="healthmetric_sender_") as temp:
+        missing_root = Path(temp) / "missing_users"
+        empty_root = Path(temp) / "Users"
+        (empty_root / BENCHMARK_USER / SOURCE_FOLDER_SUFFIX).mkdir(parents=True)
+        for label, users_root in (("missing folder", missing_root), ("empty folder", empty_root)):
+            command = [sys.executable, "-c", WRAPPER, str(SENDER_SCRIPT.parent), str(users_root)]
+            median, best = time_process(command, args.runs, temp)
+            print(f"{'script':<8} {label:<16} {median:>10.1f} {best:>9.1f}")
+        if args.exe.exists():
+            median, best = time_process([str(args.exe)], args.runs, temp)
+            print(f"{'exe':<8} {'installed folder':<16} {median:>10.1f} {best:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Scoring and Merge Benchmark Suite
+=========================================================
+
+Generates synthetic .sexyDuck files (scripts/synthetic_sexyduck.py) and measures:
+    parse            json.load of every file (reference cost)
+    extract_metrics  metric extraction from parsed documents
+    calculate_score  full scoring from parsed documents
+    score_file       load + validate + score + score index write, per file
+    merge            full merge pipeline on a scratch copy of the repo (new data received)
+    merge_rerun      second merge run with nothing received (caches warm)
+
+For each benchmark it reports throughput (files/s and MB/s), peak memory
+(traced allocations in-process, peak RSS for the merge subprocess), and
+the throughput change against a stored baseline. Baselines are machine specific,
+so save one locally before comparing.
+
+Usage:
+    python scripts/benchmark_suite.py --save-baseline
+    python scripts/benchmark_suite.py                       # compare with scripts/benchmark_baseline.json
+    python scripts/benchmark_suite.py --count 2000 --scale 2 --skip-merge
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "docs" / "ref"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from scoring import extract_metrics, calculate_score, score_file, SCORE_INDEX_FILENAME
+from synthetic_sexyduck import write_documents
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "benchmark_baseline.json"
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def measure(func, items, total_bytes, repeat=3, setup=None):
+    """
+    Time func over items (best of `repeat` runs), then run once more under
+    tracemalloc for peak traced memory.
+
+    Args:
+        setup: Optional untimed callable run before every pass
+
+    Returns:
+        dict: seconds, files_per_sec, mb_per_sec, peak_mb
+    """
+    seconds = float('inf')
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    for item in items:
+        func(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'seconds': round(seconds, 4),
+        'files_per_sec': round(len(items) / seconds, 1) if seconds > 0 else None,
+        'mb_per_sec': round(total_bytes / 1048576 / seconds, 2) if seconds > 0 else None,
+        'peak_mb': round(peak / 1048576, 2)
+    }
+
+
+def run_merge(repo_dir, file_count, total_bytes):
+    """Run the merge script in a scratch repo; time it and read the child's peak RSS."""
+    command = [sys.executable, str(repo_dir / ".github" / "scripts" / "merge_data_received.py")]
+    with tempfile.TemporaryFile(mode='w+') as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=str(repo_dir), stdout=subprocess.DEVNULL, stderr=stderr)
+        peak_mb = None
+        if hasattr(os, 'wait4'):
+            # wait4 returns this child's own resource usage (Linux: KB, macOS: bytes)
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            peak_mb = round(usage.ru_maxrss / (1048576 if sys.platform == 'darwin' else 1024), 2)
+        else:
+            process.wait()
+        seconds = time.perf_counter() - start
+        if process.returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"Merge failed: {stderr.read().strip()[-500:]}")
+    return {
+        'seconds': round(seconds, 4),
+        'files_per_sec': round(file_count / seconds, 1) if seconds > 0 else None,
+        'mb_per_sec': round(total_bytes / 1048576 / seconds, 2) if seconds > 0 else None,
+        'peak_mb': peak_mb
+    }
+
+
+def build_scratch_repo(root, count, scale, seed):
+    """Copy the merge scripts and scoring code into a scratch repo with synthetic received data."""
+    repo_dir = root / "repo"
+    shutil.copytree(PROJECT_ROOT / ".github" / "scripts", repo_dir / ".github" / "scripts",
+                    ignore=shutil.ignore_patterns('__pycache__'))
+    shutil.copytree(PROJECT_ROOT / "docs" / "ref", repo_dir / "docs" / "ref",
+                    ignore=shutil.ignore_patterns('__pycache__', '*.xlsx'))
+    (repo_dir / "docs" / "asset" / "data").mkdir(parents=True)
+    paths = write_documents(repo_dir / "_data_received", count, scale, seed, layout='received')
+    return repo_dir, paths
+
+
+# =============================================================================
+# BASELINE COMPARISON
+# =============================================================================
+
+def compare(results, baseline, tolerance):
+    """
+    Throughput change per benchmark against the baseline.
+
+    Returns:
+        tuple: (deltas dict of name -> percent change, list of regressed names)
+    """
+    deltas = {}
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get('results', {}).get(name, {}).get('files_per_sec')
+        new = result.get('files_per_sec')
+        if not old or not new:
+            continue
+        change = (new - old) / old
+        deltas[name] = round(change * 100, 1)
+        if change < -tolerance:
+            regressions.append(name)
+    return deltas, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scoring and the merge pipeline on synthetic data")
+    parser.add_argument("--count", type=int, default=500, help="Synthetic files (default: 500)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Document size multiplier (default: 1.0, ~50 KB)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per in-process benchmark, best kept (default: 3)")
+    parser.add_argument("--skip-merge", action="store_true", help="Skip the full merge benchmarks")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed throughput drop before flagging a regression (default: 0.15 = 15%%)")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("🧪 Scoring and Merge Benchmark Suite")
+    print("=" * 78)
+    print(f"Python {platform.python_version()} on {platform.system()} - {args.count} file(s), scale {args.scale}")
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="healthmetric_bench_") as temp:
+        temp = Path(temp)
+
+        print("\nGenerating synthetic data...")
+        paths = write_documents(temp / "tree", args.count, args.scale, args.seed, layout='tree')
+        total_bytes = sum(p.stat().st_size for p in paths)
+        print(f"  {len(paths)} file(s), {total_bytes / 1048576:.1f} MB")
+
+        def load(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        documents = [load(p) for p in paths]
+
+        print("Running in-process benchmarks...")
+        results['parse'] = measure(load, paths, total_bytes, args.repeat)
+        results['extract_metrics'] = measure(extract_metrics, documents, total_bytes, args.repeat)
+        results['calculate_score'] = measure(calculate_score, documents, total_bytes, args.repeat)
+        # Start every pass without score indexes so each pass pays for the index writes
+        clear_indexes = lambda: [index.unlink() for index in (temp / "tree").rglob(SCORE_INDEX_FILENAME)]
+        results['score_file'] = measure(score_file, paths, total_bytes, args.repeat, setup=clear_indexes)
+
+        if not args.skip_merge:
+            print("Running full merge (scratch repo)...")
+            repo_dir, received = build_scratch_repo(temp, args.count, args.scale, args.seed)
+            received_bytes = sum(p.stat().st_size for p in received)
+            results['merge'] = run_merge(repo_dir, len(received), received_bytes)
+            (repo_dir / "_data_received").mkdir(exist_ok=True)
+            results['merge_rerun'] = run_merge(repo_dir, len(received), received_bytes)
+
+    baseline = None
+    if args.baseline.exists() and not args.save_baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    deltas, regressions = compare(results, baseline, args.tolerance) if baseline else ({}, [])
+
+    print()
+    print(f"{'benchmark':<16} {'seconds':>9} {'files/s':>10} {'MB/s':>8} {'peak MB':>9} {'vs base':>9}")
+    for name, result in results.items():
+        delta = f"{deltas[name]:+.1f}%" if name in deltas else '-'
+        peak = f"{result['peak_mb']:.1f}" if result['peak_mb'] is not None else '-'
+        print(f"{name:<16} {result['seconds']:>9.3f} {result['files_per_sec'] or 0:>10.1f} "
+              f"{result['mb_per_sec'] or 0:>8.2f} {peak:>9} {delta:>9}{'  ⚠️' if name in regressions else ''}")
+
+    params = {'count': args.count, 'scale': args.scale, 'seed': args.seed}
+    if baseline:
+        if baseline.get('params') != params:
+            print(f"\n⚠️  Baseline was recorded with {baseline.get('params')}; deltas are not like for like")
+        print(f"\nBaseline: {args.baseline} ({baseline.get('generated_at')})")
+        if regressions:
+            print(f"❌ Throughput regressions beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        else:
+            print(f"✅ No throughput regressions beyond {args.tolerance:.0%}")
+    elif not args.save_baseline:
+        print(f"\nNo baseline at {args.baseline} - run with --save-baseline to create one")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generated_at': datetime.now().isoformat(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'params': params,
+                'results': results
+            }, f, indent=2)
+        print(f"\n✅ Baseline saved to {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Git Data API Upload Check
+=================================================
+
+Runs the sender's GitDataClient (sender/sender.py) against a local fake of the
+GitHub Git Data API (blobs, trees, commits, refs, plus the Contents API PUT for
+comparison) served from memory on 127.0.0.1 with a fixed latency per request.
+
+Checks:
+    one commit      N files land in exactly one commit on top of the branch head,
+                    with their content, and files already on the branch are kept
+    dedup           identical contents are uploaded as one blob
+    moved branch    a push landing during the upload is not overwritten: the commit
+                    is rebuilt on the new head (ref update is fast-forward only)
+    errors          API errors surface as GitDataError with the HTTP status
+    multi-root      HealthMetricSender sends two users' folders as one commit
+                    (workflow dispatch is recorded, not sent)
+
+Then reports commits and wall time for N files through the Contents API (one
+PUT and one commit per file) and the Git Data API with 1 and 8 blob workers.
+No network access. Exits 1 on any failed check.
+
+Usage:
+    python scripts/git_data_upload_check.py
+    python scripts/git_data_upload_check.py --files 40 --latency-ms 80
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "sender"))
+
+REPO = "ennead-architects-llp/HealthMetric"
+
+
+# =============================================================================
+# FAKE GITHUB DATA API
+# =============================================================================
+
+class FakeGitHub:
+    """In-memory repository: blobs, flat trees ({path: blob sha}), commits and branch refs"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.blobs = {}
+        self.trees = {}
+        self.commits = {}
+        self.refs = {}
+        self.requests = []
+        self.move_branch_once = None  # (branch, {path: bytes}): pushed right after the next tree is created
+        root_tree = self._store_tree({})
+        self.refs['main'] = self._store_commit("Initial commit", root_tree, [])
+
+    @staticmethod
+    def _sha(*parts):
+        return hashlib.sha1(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _store_blob(self, content):
+        sha = hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+        self.blobs[sha] = content
+        return sha
+
+    def _store_tree(self, entries):
+        sha = self._sha('tree', entries)
+        self.trees[sha] = dict(entries)
+        return sha
+
+    def _store_commit(self, message, tree, parents):
+        sha = self._sha('commit', message, tree, parents, len(self.commits))
+        self.commits[sha] = {'message': message, 'tree': tree, 'parents': parents}
+        return sha
+
+    def push(self, branch, files, message="Concurrent push"):
+        """Commit files directly (another client pushing to the branch)."""
+        head = self.refs[branch]
+        entries = dict(self.trees[self.commits[head]['tree']])
+        for path, content in files.items():
+            entries[path] = self._store_blob(content)
+        self.refs[branch] = self._store_commit(message, self._store_tree(entries), [head])
+
+    def files(self, branch='main'):
+        """{path: content} at the branch head."""
+        tree = self.trees[self.commits[self.refs[branch]]['tree']]
+        return {path: self.blobs[sha] for path, sha in tree.items()}
+
+    def commit_count(self, branch='main'):
+        count, sha = 0, self.refs[branch]
+        while self.commits[sha]['parents']:
+            count += 1
+            sha = self.commits[sha]['parents'][0]
+        return count
+
+    def handle(self, method, path, body):
+        """Dispatch one API call; returns (status, response dict)."""
+        time.sleep(self.latency)
+        prefix = f"/repos/{REPO}/"
+        if not path.startswith(prefix):
+            return 404, {'message': 'Not Found'}
+        path = path[len(prefix):]
+        with self.lock:
+            self.requests.append((method, path.split('/')[0] + '/' + path.split('/')[1] if '/' in path else path))
+            if method == 'GET' and path.startswith('git/ref/heads/'):
+                branch = path[len('git/ref/heads/'):]
+                if branch not in self.refs:
+                    return 404, {'message': 'Not Found'}
+                return 200, {'ref': f"refs/heads/{branch}", 'object': {'sha': self.refs[branch], 'type': 'commit'}}
+            if method == 'GET' and path.startswith('git/commits/'):
+                commit = self.commits.get(path[len('git/commits/'):])
+                if commit is None:
+                    return 404, {'message': 'Not Found'}
+                return 200, {'tree': {'sha': commit['tree']}, 'parents': [{'sha': p} for p in commit['parents']]}
+            if method == 'POST' and path == 'git/blobs':
+                return 201, {'sha': self._store_blob(base64.b64decode(body['content']))}
+            if method == 'POST' and path == 'git/trees':
+                entries = dict(self.trees.get(body.get('base_tree'), {}))
+                for entry in body['tree']:
+                    if entry['sha'] not in self.blobs:
+                        return 422, {'message': 'Invalid tree info'}
+                    entries[entry['path']] = entry['sha']
+                sha = self._store_tree(entries)
+                if self.move_branch_once:
+                    branch, files = self.move_branch_once
+                    self.move_branch_once = None
+                    self.push(branch, files)
+                return 201, {'sha': sha}
+            if method == 'POST' and path == 'git/commits':
+                return 201, {'sha': self._store_commit(body['message'], body['tree'], body['parents'])}
+            if method == 'PATCH' and path.startswith('git/refs/heads/'):
+                branch = path[len('git/refs/heads/'):]
+                head = self.refs.get(branch)
+                if not body.get('force') and head not in self.commits[body['sha']]['parents']:
+                    return 422, {'message': 'Update is not a fast forward'}
+                self.refs[branch] = body['sha']
+                return 200, {'object': {'sha': body['sha']}}
+            if method == 'PUT' and path.startswith('contents/'):
+                self.push(body.get('branch', 'main'), {path[len('contents/'):]: base64.b64decode(body['content'])},
+                          body['message'])
+                return 201, {'content': {'path': path[len('contents/'):]}}
+        return 404, {'message': 'Not Found'}
+
+
+def serve(fake):
+    """Start an HTTP server for fake on a free port; returns (server, base url)."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            body = json.loads(self.rfile.read(length)) if length else None
+            status, response = fake.handle(self.command, self.path, body)
+            payload = json.dumps(response).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PATCH = do_PUT = _reply
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def contents_put(api_url, path, content, message):
+    """Contents API create (one commit per file), for the comparison."""
+    body = json.dumps({'message': message, 'content': base64.b64encode(content).decode('ascii'),
+                       'branch': 'main'}).encode('utf-8')
+    request = urllib.request.Request(f"{api_url}/repos/{REPO}/contents/{path}", data=body, method='PUT',
+                                     headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request) as response:
+        response.read()
+
+
+# =============================================================================
+# CHECKS
+# =============================================================================
+
+def make_files(count, size, tag):
+    return {f"_temp_storage/{tag}_{i:03d}.json": (f'{{"batch": "{tag}", "index": {i}, "pad": "'.encode()
+                                                  + os.urandom(size // 2).hex().encode() + b'"}')
+            for i in range(count)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the sender's Git Data API uploads against a local fake")
+    parser.add_argument("--files", type=int, default=20, help="Files per timed upload (default: 20)")
+    parser.add_argument("--size-kb", type=int, default=64, help="Size of each file in KB (default: 64)")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Fake latency per request (default: 50)")
+    args = parser.parse_args()
+
+    fake = FakeGitHub(latency=args.latency_ms / 1000)
+    server, api_url = serve(fake)
+    os.environ['HEALTHMETRIC_GITHUB_API'] = api_url
+    import sender
+
+    failures = []
+
+    def check(name, condition):
+        print(f"  {'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    print("=" * 70)
+    print("🧪 Git Data API Upload Check")
+    print("=" * 70)
+    client = sender.GitDataClient("fake-token", REPO, api_url)
+
+    # One commit with every file, earlier files kept
+    fake.push('main', {'docs/existing.txt': b'keep me'})
+    commits_before = fake.commit_count()
+    files = make_files(5, 1024, 'one')
+    client.commit_files(files, "$$$ Add new data: check", 'main')
+    on_branch = fake.files()
+    check("one commit", fake.commit_count() == commits_before + 1)
+    check("all files with their content", all(on_branch.get(path) == content for path, content in files.items()))
+    check("existing files kept", on_branch.get('docs/existing.txt') == b'keep me')
+
+    # Identical contents -> one blob upload
+    fake.requests.clear()
+    duplicate = {f"_temp_storage/dup_{i}.json": b'{"same": true}' for i in range(4)}
+    client.commit_files(duplicate, "$$$ Add duplicates", 'main')
+    blob_posts = sum(1 for method, path in fake.requests if method == 'POST' and path == 'git/blobs')
+    check("identical contents uploaded once", blob_posts == 1 and all(fake.files()[p] == b'{"same": true}' for p in duplicate))
+
+    # A push lands between tree creation and ref update -> rebuilt on the new head, nothing lost
+    fake.move_branch_once = ('main', {'docs/concurrent.txt': b'other client'})
+    files = make_files(3, 256, 'race')
+    client.commit_files(files, "$$$ Add new data: race", 'main')
+    on_branch = fake.files()
+    check("moved branch: concurrent push kept", on_branch.get('docs/concurrent.txt') == b'other client')
+    check("moved branch: files committed", all(on_branch.get(path) == content for path, content in files.items()))
+
+    # Errors carry the HTTP status
+    try:
+        client.commit_files({'_temp_storage/x.json': b'{}'}, "missing branch", 'no-such-branch')
+        check("errors: GitDataError 404", False)
+    except sender.GitDataError as e:
+        check("errors: GitDataError 404", e.status == 404)
+
+    # HealthMetricSender: two users' folders -> one commit, one dispatch per job
+    with tempfile.TemporaryDirectory(prefix="healthmetric_gitdata_") as temp:
+        for user in ('alice', 'bob'):
+            folder = Path(temp) / "Users" / user / sender.SOURCE_FOLDER_SUFFIX
+            (folder / "task_output").mkdir(parents=True)
+            (folder / "task_output" / "model.sexyDuck").write_text(json.dumps(
+                {'job_metadata': {'model_file_size_bytes': 1024, 'model_name': user}, 'result_data': {}}))
+        # Point the canonical per-user search at the fixture users
+        sender.USERS_ROOT = str(Path(temp) / "Users")
+        os.environ['HEALTHMETRIC_VALIDATION_CACHE'] = str(Path(temp) / "validation.json")
+        os.environ['HEALTHMETRIC_REMOTE_SHA_CACHE'] = str(Path(temp) / "remote_shas.json")
+        dispatched = []
+
+        class RecordingSender(sender.HealthMetricSender):
+            def trigger_workflow_dispatch(self, job_name, raw_filename, source_label, user_name=None, sizes=None):
+                dispatched.append(f"_temp_storage/{raw_filename}")
+                return True
+
+        agent = RecordingSender()
+        agent.rate_budget.min_interval = 0
+        commits_before = fake.commit_count()
+        # Skip the 3 s propagation wait (time is the module shared with the fake server)
+        sleep = time.sleep
+        sender.time.sleep = lambda seconds: None if seconds >= 1 else sleep(seconds)
+        try:
+            ok = agent.send_revit_slave_data()
+        finally:
+            sender.time.sleep = sleep
+        on_branch = fake.files()
+        check("multi-root: one commit for two jobs", ok and fake.commit_count() == commits_before + 1)
+        check("multi-root: each payload committed and dispatched",
+              len(dispatched) == 2 and all(path in on_branch for path in dispatched))
+
+    # Timing: Contents API vs Git Data API
+    print(f"\n{args.files} files of {args.size_kb} KB, {args.latency_ms:g} ms per request")
+    print(f"{'upload':<24} {'commits':>8} {'requests':>9} {'seconds':>8}")
+    for label, run in (
+        ("contents API", lambda files: [contents_put(api_url, p, c, f"$$$ Add new data: {p}") for p, c in files.items()]),
+        ("git data, 1 worker", lambda files: client.commit_files(files, "$$$ timing", 'main', workers=1)),
+        ("git data, 8 workers", lambda files: client.commit_files(files, "$$$ timing", 'main', workers=8)),
+    ):
+        files = make_files(args.files, args.size_kb * 1024, label.replace(' ', '_').replace(',', ''))
+        commits_before = fake.commit_count()
+        fake.requests.clear()
+        start = time.perf_counter()
+        run(files)
+        seconds = time.perf_counter() - start
+        print(f"{label:<24} {fake.commit_count() - commits_before:>8} {len(fake.requests):>9} {seconds:>8.2f}")
+
+    server.shutdown()
+    print("✅ All checks passed" if not failures else f"❌ {len(failures)} check(s) failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - JSON Backend Round-Trip Check
+=====================================================
+
+Checks that docs/ref/json_io.py behaves like the standard library json module
+with every installed backend (json, orjson, msgspec):
+
+    decode     json_io.loads(text) == json.loads(text), for bytes and str input
+    roundtrip  json_io.loads(json_io.dumpb(x)) == json.loads(json.dumps(x)), compact and pretty
+    stdlib     stdlib json parses json_io output to the same value
+    errors     invalid input raises json.JSONDecodeError
+    bytes      output bytes identical to stdlib json (reported, not required)
+
+Cases are edge cases (unicode, floats, non-string keys, NaN input), synthetic
+.sexyDuck documents and up to --real real files from docs/asset/data. The
+differences documented in json_io (integers beyond 64 bits, NaN output) are
+not checked. Exits 1 on any mismatch.
+
+Usage:
+    python scripts/json_roundtrip_check.py
+    python scripts/json_roundtrip_check.py --synthetic 50 --real 0
+"""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "docs" / "ref"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import json_io
+from synthetic_sexyduck import generate_sexy_duck
+
+BACKENDS = ['json', 'orjson', 'msgspec']
+
+
+def use_backend(name):
+    """Reload json_io with a forced backend; returns the module or None if unavailable."""
+    os.environ['HEALTHMETRIC_JSON_BACKEND'] = name
+    module = importlib.reload(json_io)
+    return module if module.BACKEND == name else None
+
+
+def same(a, b):
+    """Deep equality that treats NaN as equal to NaN."""
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def edge_cases():
+    return {
+        'unicode': {'hub': 'Ennead Architects LLP', 'project': 'Café – 東京 🦆', 'escape': 'quote " backslash \\ tab \t'},
+        'empty': {'list': [], 'dict': {}, 'string': '', 'nested': [[], {}]},
+        'numbers': {'int': 0, 'negative': -17, 'big': 2 ** 63 - 1, 'float': 0.1, 'small': 1e-7,
+                    'exponent': 1.5e300, 'negative_zero': -0.0, 'bool': True, 'none': None},
+        'int_keys': {1: 'one', 2: 'two'},
+        'score': {'total_score': 58.84, 'grade': 'F', 'metrics': [{'metric': 'High Warnings', 'score': 0.0}]},
+    }
+
+
+# Text that only stdlib json accepts; a fast backend must fall back
+LENIENT_TEXTS = ['{"value": NaN}', '[Infinity, -Infinity]']
+INVALID_TEXTS = ['', '{', '{"a": 1,}', '[1 2]', "{'a': 1}"]
+
+
+def check_backend(module, cases, failures, byte_diffs):
+    for name, value in cases:
+        expected = json.loads(json.dumps(value))
+        for pretty in (False, True):
+            mode = 'pretty' if pretty else 'compact'
+            encoded = module.dumpb(value, pretty=pretty)
+            if not same(module.loads(encoded), expected):
+                failures.append(f"{module.BACKEND} roundtrip {mode}: {name}")
+            if not same(json.loads(encoded.decode('utf-8')), expected):
+                failures.append(f"{module.BACKEND} stdlib-parse {mode}: {name}")
+            if module.dumps(value, pretty=pretty).encode('utf-8') != encoded:
+                failures.append(f"{module.BACKEND} dumps/dumpb {mode}: {name}")
+            stdlib = (json.dumps(value, indent=2, ensure_ascii=False) if pretty
+                      else json.dumps(value, separators=(',', ':'), ensure_ascii=False)).encode('utf-8')
+            if encoded != stdlib:
+                byte_diffs.append(f"{mode}: {name}")
+
+        text = json.dumps(value, indent=4, ensure_ascii=False)
+        if not same(module.loads(text), expected) or not same(module.loads(text.encode('utf-8')), expected):
+            failures.append(f"{module.BACKEND} decode: {name}")
+
+    for text in LENIENT_TEXTS:
+        if not same(module.loads(text), json.loads(text)):
+            failures.append(f"{module.BACKEND} lenient decode: {text}")
+
+    for text in INVALID_TEXTS:
+        try:
+            module.loads(text)
+            failures.append(f"{module.BACKEND} accepted invalid JSON: {text!r}")
+        except json.JSONDecodeError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check json_io against stdlib json for every installed backend")
+    parser.add_argument("--synthetic", type=int, default=20, help="Synthetic documents (default: 20)")
+    parser.add_argument("--real", type=int, default=50, help="Max real files from docs/asset/data (default: 50)")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    cases = list(edge_cases().items())
+    for i in range(args.synthetic):
+        document = generate_sexy_duck(rng, 'Synthetic Hub', 'Synthetic Project', f"SYN_{i:04d}",
+                                      datetime(2025, 9, 1, 9, 0, 0), scale=rng.choice([0.5, 1, 4]))
+        cases.append((f"synthetic #{i}", document))
+    real_files = sorted((PROJECT_ROOT / "docs" / "asset" / "data").rglob("*.sexyDuck"))[:args.real]
+    for file_path in real_files:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            cases.append((file_path.name, json.load(f)))
+
+    print("=" * 70)
+    print("🧪 JSON Backend Round-Trip Check")
+    print("=" * 70)
+    print(f"{len(cases)} case(s): {len(edge_cases())} edge, {args.synthetic} synthetic, {len(real_files)} real")
+
+    failures = []
+    for backend in BACKENDS:
+        module = use_backend(backend)
+        if module is None:
+            print(f"  {backend:<8} not installed - skipped")
+            continue
+        byte_diffs = []
+        before = len(failures)
+        check_backend(module, cases, failures, byte_diffs)
+        status = "✅" if len(failures) == before else "❌"
+        print(f"  {backend:<8} {status} {len(failures) - before} failure(s), "
+              f"{len(byte_diffs)} case/mode(s) with bytes differing from stdlib")
+        for diff in byte_diffs[:5]:
+            print(f"           bytes differ: {diff}")
+
+    for failure in failures:
+        print(f"  ❌ {failure}")
+    print("✅ All backends match stdlib json" if not failures else f"❌ {len(failures)} mismatch(es)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Metrics Cache Checkout Check
+====================================================
+
+Checks that the extracted-metrics cache (docs/ref/metrics_cache.py) survives a
+fresh checkout, where every file keeps its content but gets a new mtime:
+
+    checkout    every mtime changed: no file is parsed again and
+                metrics_cache.json is not rewritten
+    edit        one file's content changed: only that file is parsed and
+                the cache is written
+    prefetch    the same two cases through the process pool (--workers)
+
+Runs on synthetic .sexyDuck files in a temp folder; nothing in the repository
+is touched. Exits 1 on any failed check.
+
+Usage:
+    python scripts/metrics_cache_checkout_check.py
+    python scripts/metrics_cache_checkout_check.py --count 200 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "docs" / "ref"))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from metrics_cache import MetricsCache, METRICS_CACHE_FILENAME
+from synthetic_sexyduck import write_documents
+
+
+def run_pass(data_dir, files, workers):
+    """Read every file through a fresh cache, as one merge run does; returns (stats, bytes written)."""
+    with MetricsCache(data_dir / METRICS_CACHE_FILENAME, root_dir=data_dir) as cache:
+        if workers > 1:
+            cache.prefetch(files, workers)
+        for file_path in files:
+            cache.metrics(file_path)
+        written = cache.save()
+        return cache.stats(), written
+
+
+def simulate_checkout(files):
+    """Give every file a new mtime without changing its content."""
+    for file_path in files:
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 3_600_000_000_000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that a fresh checkout neither reparses nor rewrites the metrics cache")
+    parser.add_argument("--count", type=int, default=60, help="Synthetic files (default: 60)")
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes for the prefetch case (default: 2)")
+    args = parser.parse_args()
+
+    failures = []
+
+    def check(name, condition):
+        print(f"  {'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    print("=" * 70)
+    print("🧪 Metrics Cache Checkout Check")
+    print("=" * 70)
+
+    for label, workers in (("sequential", 1), ("prefetch", args.workers)):
+        with tempfile.TemporaryDirectory(prefix="healthmetric_metrics_cache_") as temp:
+            data_dir = Path(temp)
+            files = write_documents(data_dir, args.count)
+            cache_file = data_dir / METRICS_CACHE_FILENAME
+
+            stats, written = run_pass(data_dir, files, workers)
+            print(f"\n{label}: first run {stats['misses']} parsed, {written:,} bytes written")
+            check(f"{label}: first run writes the cache", written > 0 and cache_file.exists())
+            cached = cache_file.read_bytes()
+
+            simulate_checkout(files)
+            stats, written = run_pass(data_dir, files, workers)
+            check(f"{label}: checkout parses nothing", stats['misses'] == 0)
+            check(f"{label}: checkout leaves the cache file unchanged", written == 0 and cache_file.read_bytes() == cached)
+
+            files[0].write_text(files[0].read_text(encoding='utf-8').replace('"model_name"', '"model_name" ', 1),
+                                encoding='utf-8')
+            stats, written = run_pass(data_dir, files, workers)
+            check(f"{label}: edit parses one file", stats['misses'] == 1)
+            check(f"{label}: edit writes the cache", written > 0)
+
+    print("\n✅ All checks passed" if not failures else f"\n❌ {len(failures)} check(s) failed")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
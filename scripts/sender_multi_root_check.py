@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Sender Multi-Root Check
+===============================================
+
+Checks how the sender treats several RevitSlaveData roots (one per user on a
+shared box) in one send pass:
+
+    idle        a secondary user whose folder only holds files the send rules
+                leave out (debug output, files outside the include globs) is
+                skipped before anything is read; the pass still succeeds and
+                sends the active user
+    invalid     a user whose only .sexyDuck fails validation counts as
+                nothing to send, not as a failed send
+    nothing     no root with anything to send: the pass succeeds and main()
+                would exit 0
+    agent       run_agent() watches every user's folder, not only the current
+                user's, and a restart resends nothing
+    counters    ValidationCache hit/check counters stay exact when the scan
+                pool threads share one cache
+
+Nothing reaches GitHub: send_data records the payload and the workflow
+dispatch goes to an in-memory repository object. The fixture users are
+reached through sender.USERS_ROOT. No network access. Exits 1 on any failed
+check.
+
+Usage:
+    python scripts/sender_multi_root_check.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "sender"))
+
+# Smallest .sexyDuck the sender's validation accepts
+SEXY_DUCK = b'{"job_metadata": {"model_file_size_bytes": 1024, "model_name": "multi"}, "result_data": {}}'
+# Fails validation (no model_file_size_bytes)
+INVALID_SEXY_DUCK = b'{"job_metadata": {"model_name": "broken"}, "result_data": {}}'
+
+
+class FakeRepo:
+    """Records repository_dispatch calls instead of sending them"""
+
+    def __init__(self):
+        self.dispatches = []
+
+    def create_repository_dispatch(self, event_type, client_payload):
+        self.dispatches.append(client_payload['job_name'])
+
+
+def make_sender(sender_module, folder):
+    """Sender with the upload recorded, the repository faked and only the given own folder."""
+
+    class RecordingSender(sender_module.HealthMetricSender):
+        def send_data(self, data, filename):
+            self.sent_payloads.append(data['batch_metadata']['source'])
+            return True
+
+    agent = RecordingSender()
+    agent.sent_payloads = []
+    agent.default_source_folder = str(folder)
+    agent.upload_mode = 'contents'
+    agent.rate_budget.min_interval = 0
+    agent._repo = FakeRepo()
+    return agent
+
+
+def user_folder(sender_module, user):
+    folder = Path(sender_module.USERS_ROOT) / user / sender_module.SOURCE_FOLDER_SUFFIX
+    folder.mkdir(parents=True)
+    return folder
+
+
+def main():
+    failures = []
+
+    def check(name, condition):
+        print(f"  {'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    with tempfile.TemporaryDirectory(prefix="healthmetric_multi_root_") as temp:
+        os.environ['HEALTHMETRIC_AGENT_STATE'] = str(Path(temp) / "agent_state.json")
+        os.environ['HEALTHMETRIC_VALIDATION_CACHE'] = str(Path(temp) / "validation.json")
+        os.environ['HEALTHMETRIC_REMOTE_SHA_CACHE'] = str(Path(temp) / "remote_shas.json")
+        import sender
+
+        print("=" * 70)
+        print("🧪 Sender Multi-Root Check")
+        print("=" * 70)
+
+        # Skip the 3 s propagation wait after each upload
+        sleep = time.sleep
+        sender.time.sleep = lambda seconds: None if seconds >= 1 else sleep(seconds)
+        try:
+            sender.USERS_ROOT = str(Path(temp) / "Users")
+
+            # Idle: only excluded debug output and a file outside the include globs
+            active = user_folder(sender, "active")
+            (active / "task_output").mkdir()
+            (active / "task_output" / "model.sexyDuck").write_bytes(SEXY_DUCK)
+            idle = user_folder(sender, "idle")
+            (idle / "_debug").mkdir()
+            (idle / "_debug" / "trace.sexyDuck").write_bytes(SEXY_DUCK)
+            (idle / "notes.txt").write_text("not included by the send rules")
+            rules = sender.SendRules.load()
+            check("idle: root without sendable files is not a candidate",
+                  not sender.HealthMetricSender._has_sendable_file(str(idle), rules))
+            check("idle: root with a sendable file is a candidate",
+                  sender.HealthMetricSender._has_sendable_file(str(active), rules))
+            agent = make_sender(sender, Path(temp) / "missing")
+            ok = agent.send_revit_slave_data()
+            check("idle: pass succeeds", ok)
+            check("idle: only the active user is sent", agent.sent_payloads == [str(active)])
+
+            # Invalid: a user whose only .sexyDuck fails validation
+            broken = user_folder(sender, "broken")
+            (broken / "task_output").mkdir()
+            (broken / "task_output" / "model.sexyDuck").write_bytes(INVALID_SEXY_DUCK)
+            agent = make_sender(sender, Path(temp) / "missing")
+            ok = agent.send_revit_slave_data()
+            check("invalid: pass succeeds", ok)
+            check("invalid: the active user is still sent", agent.sent_payloads == [str(active)])
+
+            # Nothing: no root with anything to send
+            sender.USERS_ROOT = str(Path(temp) / "NoUsers")
+            agent = make_sender(sender, idle)
+            check("nothing: pass succeeds without sending", agent.send_revit_slave_data() and not agent.sent_payloads)
+
+            # Agent: the current user and a second user, each with new files
+            sender.USERS_ROOT = str(Path(temp) / "AgentUsers")
+            own = user_folder(sender, "own")
+            other = user_folder(sender, "other")
+            for folder in (own, other):
+                (folder / "task_output").mkdir()
+                (folder / "task_output" / "model.sexyDuck").write_bytes(SEXY_DUCK)
+
+            def run(agent):
+                agent.run_agent(poll_seconds=0.01, debounce_seconds=0, max_delay_seconds=0,
+                                full_rescan_seconds=60, batch_files=10, max_polls=3)
+                return sorted(agent.sent_payloads)
+
+            check("agent: every user's folder is sent", run(make_sender(sender, own)) == sorted([str(own), str(other)]))
+            check("agent: a restart resends nothing", run(make_sender(sender, own)) == [])
+
+            # Counters: several threads validating through one shared cache
+            validation = sender.ValidationCache(str(Path(temp) / "shared_validation.json"))
+            contents = [SEXY_DUCK.replace(b'"multi"', f'"model_{i % 50}"'.encode()) for i in range(2000)]
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(validation.check, contents))
+            check("counters: every check counted once", validation.checked + validation.hits == len(contents))
+            check("counters: one result per distinct file", len(validation.results) == 50)
+        finally:
+            sender.time.sleep = sleep
+
+    print("\n✅ All checks passed" if not failures else f"\n❌ {len(failures)} check(s) failed")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Sender Rate Budget Check
+================================================
+
+Checks that the sender's API write cap (RateBudget, API_MAX_WRITES_PER_RUN)
+applies per send pass and never stops a long-lived sender for good:
+
+    agent       run_agent() sends one file per poll until it has made more
+                write calls than the cap; every file must still be sent
+    passes      two send_revit_slave_data() passes on one sender with a cap
+                that only fits one pass; the second must still send
+
+Nothing reaches GitHub: send_data books its budget and records the payload,
+and the workflow dispatch goes to an in-memory repository object. The fixture
+folder is reached by setting default_source_folder and sender.USERS_ROOT.
+No network access. Exits 1 on any failed check.
+
+Usage:
+    python scripts/sender_rate_budget_check.py
+    python scripts/sender_rate_budget_check.py --files 150
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "sender"))
+
+# Smallest .sexyDuck the sender's validation accepts
+SEXY_DUCK = b'{"job_metadata": {"model_file_size_bytes": 1024, "model_name": "budget"}, "result_data": {}}'
+
+
+class FakeRepo:
+    """Records repository_dispatch calls instead of sending them"""
+
+    def __init__(self):
+        self.dispatches = []
+
+    def create_repository_dispatch(self, event_type, client_payload):
+        self.dispatches.append(client_payload['job_name'])
+
+
+def make_sender(sender_module, folder):
+    """Sender with the upload replaced by a budget booking and the repository faked."""
+
+    class RecordingSender(sender_module.HealthMetricSender):
+        def send_data(self, data, filename):
+            return self.rate_budget.acquire(filename)
+
+    agent = RecordingSender()
+    agent.default_source_folder = str(folder)
+    agent.rate_budget.min_interval = 0
+    agent._repo = FakeRepo()
+    return agent
+
+
+def write_files(folder, count, tag):
+    for i in range(count):
+        job_dir = folder / "task_output" / f"{tag}_{i:04d}"
+        job_dir.mkdir(parents=True)
+        (job_dir / "model.sexyDuck").write_bytes(SEXY_DUCK)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the sender's API write cap is per send pass")
+    parser.add_argument("--files", type=int, default=80,
+                        help="Files the agent sends, one per poll (default: 80, 2 write calls each)")
+    args = parser.parse_args()
+
+    failures = []
+
+    def check(name, condition):
+        print(f"  {'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    with tempfile.TemporaryDirectory(prefix="healthmetric_budget_") as temp:
+        os.environ['HEALTHMETRIC_AGENT_STATE'] = str(Path(temp) / "agent_state.json")
+        os.environ['HEALTHMETRIC_VALIDATION_CACHE'] = str(Path(temp) / "validation.json")
+        os.environ['HEALTHMETRIC_REMOTE_SHA_CACHE'] = str(Path(temp) / "remote_shas.json")
+        import sender
+
+        print("=" * 70)
+        print("🧪 Sender Rate Budget Check")
+        print("=" * 70)
+
+        # Skip the 3 s propagation wait after each upload
+        sleep = time.sleep
+        sender.time.sleep = lambda seconds: None if seconds >= 1 else sleep(seconds)
+        try:
+            # Agent: more write calls in total than one pass may make
+            folder = Path(temp) / "AgentDatabase"
+            write_files(folder, args.files, "job")
+            agent = make_sender(sender, folder)
+            agent.run_agent(poll_seconds=0.01, debounce_seconds=0, max_delay_seconds=0,
+                            full_rescan_seconds=60, batch_files=1, max_polls=args.files + 5)
+            calls = 2 * len(agent._repo.dispatches)
+            print(f"Agent: {len(agent._repo.dispatches)} batches, {calls} write calls "
+                  f"(cap {sender.API_MAX_WRITES_PER_RUN} per pass)")
+            check("agent: write calls beyond one pass's cap", calls > sender.API_MAX_WRITES_PER_RUN)
+            check("agent: every file sent", len(agent._repo.dispatches) == args.files)
+
+            # Passes: a cap that fits one pass (upload + dispatch), two passes on one sender
+            sender.USERS_ROOT = str(Path(temp) / "Users")
+            user_folder = Path(sender.USERS_ROOT) / "budget_user" / sender.SOURCE_FOLDER_SUFFIX
+            write_files(user_folder, 1, "pass")
+            passes = make_sender(sender, Path(temp) / "missing")
+            passes.rate_budget.max_calls = 2
+            first = passes.send_revit_slave_data()
+            second = passes.send_revit_slave_data()
+            check("passes: first pass sent", first)
+            check("passes: second pass sent with a fresh budget", second and len(passes._repo.dispatches) == 2)
+        finally:
+            sender.time.sleep = sleep
+
+    print("\n✅ All checks passed" if not failures else f"\n❌ {len(failures)} check(s) failed")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Sender Upload Dedup Check
+=================================================
+
+Checks that the sender recognises a payload it already uploaded by the files
+it sends, not by its upload name (every run picks a new batch name and
+batch_metadata timestamp):
+
+    rerun       a second pass over unchanged files uploads nothing, looks up
+                only the earlier payload's path and triggers on that payload
+    changed     an edited file is uploaded again under the new name
+    processed   once the receiver has deleted the earlier payload, the same
+                files are uploaded again
+    hash        payload_content_sha ignores batch_metadata (timestamp, skip
+                counts) and changes with any file's content
+    commit      several users in one pass (Git Data API, one commit): only the
+                user whose files changed is committed, every user is triggered
+
+Nothing reaches GitHub: the repository is an in-memory object that answers
+per-path get_contents and records create_file and repository_dispatch calls.
+Fixture users are reached through sender.USERS_ROOT. No network access.
+Exits 1 on any failed check.
+
+Usage:
+    python scripts/sender_upload_dedup_check.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "sender"))
+
+# Smallest .sexyDuck the sender's validation accepts
+SEXY_DUCK = b'{"job_metadata": {"model_file_size_bytes": 1024, "model_name": "dedup"}, "result_data": {}}'
+
+
+class NotFound(Exception):
+    status = 404
+
+
+class FakeRepo:
+    """In-memory repository: per-path lookups, file creation and dispatches"""
+
+    def __init__(self, git_blob_sha):
+        self.git_blob_sha = git_blob_sha
+        self.files = {}
+        self.lookups = []
+        self.created = []
+        self.dispatches = []
+
+    def get_contents(self, path, ref=None):
+        self.lookups.append(path)
+        if path not in self.files:
+            raise NotFound(path)
+        return SimpleNamespace(path=path, sha=self.git_blob_sha(self.files[path]))
+
+    def create_file(self, path, message, content, branch):
+        self.created.append(path)
+        self.files[path] = content
+        return {'content': SimpleNamespace(path=path, sha=self.git_blob_sha(content))}
+
+    def create_repository_dispatch(self, event_type, client_payload):
+        self.dispatches.append(client_payload['raw_path'])
+
+
+class FakeGitData:
+    """Git Data API stand-in: blobs and one commit per call, written into the fake repository"""
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.blobs = {}
+        self.commits = []
+
+    def create_blob(self, content):
+        sha = self.repo.git_blob_sha(content)
+        self.blobs[sha] = content
+        return sha
+
+    def commit_blobs(self, entries, message, branch):
+        self.commits.append(sorted(entries))
+        for path, sha in entries.items():
+            self.repo.files[path] = self.blobs[sha]
+        return "c0ffee0"
+
+
+def make_sender(sender_module, repo, folder, upload_mode='contents'):
+    agent = sender_module.HealthMetricSender()
+    agent.default_source_folder = str(folder)
+    agent.upload_mode = upload_mode
+    agent.rate_budget.min_interval = 0
+    agent._repo = repo
+    agent._git_data = FakeGitData(repo)
+    return agent
+
+
+def user_folder(sender_module, user):
+    folder = Path(sender_module.USERS_ROOT) / user / sender_module.SOURCE_FOLDER_SUFFIX / "task_output"
+    folder.mkdir(parents=True)
+    (folder / "model.sexyDuck").write_bytes(SEXY_DUCK.replace(b'"dedup"', f'"{user}"'.encode()))
+    return folder.parent
+
+
+def main():
+    failures = []
+
+    def check(name, condition):
+        print(f"  {'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    with tempfile.TemporaryDirectory(prefix="healthmetric_upload_dedup_") as temp:
+        os.environ['HEALTHMETRIC_VALIDATION_CACHE'] = str(Path(temp) / "validation.json")
+        os.environ['HEALTHMETRIC_REMOTE_SHA_CACHE'] = str(Path(temp) / "remote_shas.json")
+        import sender
+
+        print("=" * 70)
+        print("🧪 Sender Upload Dedup Check")
+        print("=" * 70)
+
+        # Skip the 3 s propagation wait after each upload
+        sleep = time.sleep
+        sender.time.sleep = lambda seconds: None if seconds >= 1 else sleep(seconds)
+        try:
+            sender.USERS_ROOT = str(Path(temp) / "Users")
+            own = user_folder(sender, "own")
+            repo = FakeRepo(sender.git_blob_sha)
+
+            # Rerun: a new sender (new batch name and timestamp) over the same files
+            check("first pass sends", make_sender(sender, repo, own).send_revit_slave_data())
+            first = list(repo.created)
+            check("first pass uploads one payload", len(first) == 1)
+            repo.lookups.clear()
+            check("rerun succeeds", make_sender(sender, repo, own).send_revit_slave_data())
+            check("rerun uploads nothing", repo.created == first)
+            check("rerun looks up only the earlier payload", repo.lookups == first)
+            check("rerun triggers on the earlier payload", repo.dispatches == first * 2)
+
+            # Changed: one file edited
+            (own / "task_output" / "model.sexyDuck").write_bytes(SEXY_DUCK.replace(b'1024', b'2048'))
+            make_sender(sender, repo, own).send_revit_slave_data()
+            check("changed files are uploaded under the new name",
+                  len(repo.created) == 2 and repo.created[1] != first[0])
+
+            # Processed: the receiver deleted the payload
+            del repo.files[repo.created[1]]
+            make_sender(sender, repo, own).send_revit_slave_data()
+            check("a processed payload is uploaded again", len(repo.created) == 3)
+
+            # Hash: only the source and the files count
+            payload = make_sender(sender, repo, own).create_batch_payload(str(own))
+            same = dict(payload, batch_metadata=dict(payload['batch_metadata'], timestamp="2000-01-01T00:00:00",
+                                                     skipped={}))
+            edited = dict(payload, files={path: dict(record, content=record['content'][::-1])
+                                          for path, record in payload['files'].items()})
+            check("hash ignores batch_metadata", sender.payload_content_sha(payload) == sender.payload_content_sha(same))
+            check("hash follows file content", sender.payload_content_sha(payload) != sender.payload_content_sha(edited))
+
+            # Commit: two users, one commit; a rerun after editing one user commits only that user
+            sender.USERS_ROOT = str(Path(temp) / "CommitUsers")
+            first_user = user_folder(sender, "first")
+            second_user = user_folder(sender, "second")
+            repo = FakeRepo(sender.git_blob_sha)
+            agent = make_sender(sender, repo, first_user, upload_mode='git')
+            agent.send_revit_slave_data()
+            check("commit: both users in one commit", [len(paths) for paths in agent.git_data.commits] == [2])
+            (second_user / "task_output" / "model.sexyDuck").write_bytes(SEXY_DUCK.replace(b'1024', b'4096'))
+            repo.dispatches.clear()
+            agent = make_sender(sender, repo, first_user, upload_mode='git')
+            check("commit: rerun succeeds", agent.send_revit_slave_data())
+            check("commit: only the changed user is committed", [len(paths) for paths in agent.git_data.commits] == [1])
+            check("commit: both users are triggered", len(repo.dispatches) == 2)
+        finally:
+            sender.time.sleep = sleep
+
+    print("\n✅ All checks passed" if not failures else f"\n❌ {len(failures)} check(s) failed")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+🧪 LOCAL TESTING ONLY - Synthetic SexyDuck Generator
+====================================================
+
+Generates realistic .sexyDuck documents with the same job_metadata/result_data
+shape as real exports (warnings, views_sheets, families, linked_files, group
+usage analyses, templates, rooms, project_info) for benchmarking. Values are
+random but deterministic for a given seed; nothing here is real model data.
+
+Usage:
+    python scripts/synthetic_sexyduck.py OUTPUT_DIR --count 500
+    python scripts/synthetic_sexyduck.py OUTPUT_DIR --count 200 --scale 4 --layout received
+
+Layouts:
+    tree      OUTPUT_DIR/<Hub>/<Project>/<YYYY-MM-DD>/<Model>.sexyDuck (docs/asset/data shape)
+    received  OUTPUT_DIR/revit_slave_<stamp>/task_output/<job>/<Model>.sexyDuck (_data_received shape)
+"""
+
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+HUBS = ['Synthetic Hub A', 'Synthetic Hub B', 'Synthetic Hub C']
+VIEW_TYPES = ['DrawingSheet', 'ProjectBrowser', 'Legend', 'DraftingView', 'SystemBrowser', 'CeilingPlan',
+              'Section', 'Elevation', 'ThreeD', 'Schedule', 'FloorPlan', 'Detail']
+WARNING_TEXTS = ['Highlighted walls overlap', 'Elements have duplicate Mark values', 'Room is not in a properly enclosed region',
+                 'Line is slightly off axis', 'Room separation line overlaps', 'Multiple Rooms are in the same enclosed region',
+                 'There are identical instances in the same place', 'Duct length exceeds maximum specified length']
+LINK_TYPES = ['rvt', 'rvt', 'dwg', 'dxf', 'ifc']
+USERS = ['user.alpha', 'user.bravo', 'user.charlie', 'user.delta']
+
+
+def _names(rng, prefix, count):
+    return [f"{prefix} {rng.randint(1, 9999):04d}" for _ in range(count)]
+
+
+def generate_sexy_duck(rng, hub, project, model, timestamp, scale=1.0):
+    """
+    Build one synthetic SexyDuck document.
+
+    Args:
+        rng: random.Random instance
+        hub, project, model: Identity fields for job_metadata
+        timestamp: datetime of the export
+        scale: Multiplier for list/dict sizes (1.0 is roughly a 50 KB file)
+
+    Returns:
+        dict: SexyDuck document (without a score)
+    """
+    n = lambda base: max(1, int(base * scale * rng.uniform(0.5, 1.5)))
+    # Scoring inputs are skewed like real exports: most models are healthy, a few are not
+    skewed = lambda mean: int(rng.expovariate(1 / mean))
+
+    size_bytes = int(rng.uniform(20, 1200) * 1048576)
+    warning_count = skewed(120)
+    critical = min(warning_count, skewed(6))
+    categories = {f"{rng.choice(WARNING_TEXTS)} #{i}": rng.randint(1, 200) for i in range(n(40))}
+    per_user = {user: {text: rng.randint(1, 50) for text in rng.sample(WARNING_TEXTS, 3)} for user in USERS[:rng.randint(1, 4)]}
+
+    views_by_type = {view_type: rng.randint(0, 900) for view_type in VIEW_TYPES}
+    templates_by_type = {view_type: rng.randint(0, 50) for view_type in VIEW_TYPES[5:]}
+    total_views = sum(views_by_type.values())
+
+    def group_analysis():
+        type_usage = {name: 1 + skewed(4) for name in _names(rng, 'Group', n(250))}
+        overused = [name for name, uses in type_usage.items() if uses > 30]
+        return {
+            'overused_count': len(overused),
+            'total_types': len(type_usage),
+            'overused_groups': overused,
+            'usage_threshold': 30,
+            'type_usage': type_usage
+        }
+
+    worksets = _names(rng, 'WS', n(30))
+    linked_files = [
+        {'name': f"Link {i}.{link_type}", 'type': link_type, 'is_loaded': rng.random() > 0.1}
+        for i, link_type in enumerate(rng.choice(LINK_TYPES) for _ in range(skewed(3)))
+    ]
+    unused_families = _names(rng, 'Family', n(180))
+
+    result_data = {
+        'purgeable_elements': skewed(60),
+        'document_title': model,
+        'critical_warning_count': critical,
+        'warning_count': warning_count,
+        'warnings': {
+            'warning_count_per_user': {user: rng.randint(0, 200) for user in per_user},
+            'critical_warning_count': critical,
+            'warning_count': warning_count,
+            'warning_categories': categories,
+            'warning_details_per_user': per_user
+        },
+        'views_sheets': {
+            'view_count_by_type': views_by_type,
+            'view_count_by_type_non_template': {k: max(0, v - templates_by_type.get(k, 0)) for k, v in views_by_type.items()},
+            'view_count_by_type_template': templates_by_type,
+            'schedules_not_on_sheets': rng.randint(0, 100),
+            'views_not_on_sheets': min(total_views, skewed(60)),
+            'total_sheets': views_by_type['DrawingSheet'],
+            'total_views': total_views,
+            'copied_views': rng.randint(0, 300)
+        },
+        'families': {
+            'non_parametric_families_creators': {user: rng.randint(0, 300) for user in USERS[:2]},
+            'unused_families_names': unused_families,
+            'non_parametric_families': rng.randint(0, 400),
+            'unused_families_count': len(unused_families),
+            'detail_components': rng.randint(0, 800),
+            'generic_models_types': rng.randint(0, 300),
+            'in_place_families_creators': {user: rng.randint(0, 20) for user in USERS[:2]},
+            'in_place_families': skewed(4),
+            'total_families': rng.randint(200, 2500)
+        },
+        'model_group_usage_analysis': group_analysis(),
+        'detail_group_usage_analysis': group_analysis(),
+        'linked_files': linked_files,
+        'linked_files_count': len(linked_files),
+        'templates_filters': {
+            'unused_view_templates': skewed(2),
+            'filters': rng.randint(0, 500),
+            'unused_filters': rng.randint(0, 200),
+            'view_templates': rng.randint(0, 150)
+        },
+        'rooms': {'unplaced_rooms': rng.randint(0, 30), 'unbounded_rooms': rng.randint(0, 30), 'total_rooms': rng.randint(0, 900)},
+        'cad_files': {'cad_layers_imports_in_families': rng.randint(0, 5), 'imported_dwgs': rng.randint(0, 5),
+                      'linked_dwgs': rng.randint(0, 5), 'dwg_files': rng.randint(0, 10)},
+        'project_info': {
+            'is_EnneadTab_Available': False,
+            'client_name': 'SYNTHETIC CLIENT',
+            'project_number': f"{rng.randint(1000, 9999)}.00",
+            'timestamp': timestamp.isoformat(),
+            'project_name': project,
+            'project_phases': ['Existing', 'Phase 1'],
+            'is_workshared': True,
+            'document_title': model,
+            'worksets': {
+                'workset_details': [
+                    {'kind': 'UserWorkset', 'is_editable': True, 'name': name, 'id': i, 'is_open': True, 'owner': rng.choice(USERS)}
+                    for i, name in enumerate(worksets)
+                ],
+                'user_worksets': len(worksets),
+                'workset_names': worksets,
+                'total_worksets': len(worksets),
+                'workset_element_counts': {name: rng.randint(0, 50000) for name in worksets},
+                'workset_ownership': {}
+            }
+        },
+        'timestamp': timestamp.isoformat(),
+        'dimension_types': rng.randint(0, 200),
+        'reference_planes': rng.randint(0, 500),
+        'materials': rng.randint(50, 800),
+        'dimensions': rng.randint(0, 150000),
+        'line_count': rng.randint(0, 200000),
+        'text_notes_instances': rng.randint(0, 10000),
+        'text_notes_types': rng.randint(0, 100),
+        'text_notes_width_factor_not_1': rng.randint(0, 20),
+        'text_notes_types_solid_background': rng.randint(0, 20),
+        'text_notes_all_caps': rng.randint(0, 50),
+        'dimension_overrides': rng.randint(0, 1000),
+        'is_EnneadTab_Available': False,
+        'detail_group_types': rng.randint(0, 500),
+        'detail_group_instances': rng.randint(0, 2000),
+        'model_group_types': rng.randint(0, 500),
+        'model_group_instances': rng.randint(0, 2000),
+        'total_elements': rng.randint(10000, 600000),
+        'revision_clouds': rng.randint(0, 800),
+        'line_patterns': rng.randint(0, 1200),
+        'reference_planes_no_name': rng.randint(0, 100),
+        'detail_lines': rng.randint(0, 160000)
+    }
+
+    return {
+        'result_data': result_data,
+        'job_metadata': {
+            'project_name': project,
+            'revit_version': rng.choice(['2022', '2023', '2024']),
+            'hub_name': hub,
+            'model_file_size_readable': f"{size_bytes / 1048576:.2f} MB",
+            'execution_time_seconds': round(rng.uniform(1, 120), 2),
+            'model_name': model,
+            'job_id': f"job_{timestamp:%Y%m%d_%H%M%S}_{rng.randint(1, 99)}",
+            'model_file_size_bytes': size_bytes,
+            'timestamp': timestamp.isoformat(),
+            'execution_time_readable': '1 seconds'
+        },
+        'status': 'completed'
+    }
+
+
+def monday_of(timestamp):
+    """Week folder date used by the merge (Monday of the export week)."""
+    return (timestamp - timedelta(days=timestamp.weekday())).strftime('%Y-%m-%d')
+
+
+def write_documents(output_dir, count, scale=1.0, seed=42, layout='tree', projects_per_hub=5, weeks=4):
+    """
+    Write `count` synthetic .sexyDuck files.
+
+    Args:
+        output_dir: Target directory
+        count: Number of files
+        scale: Document size multiplier (see generate_sexy_duck)
+        seed: Random seed
+        layout: 'tree' (docs/asset/data) or 'received' (_data_received)
+        projects_per_hub: Projects per synthetic hub
+        weeks: Number of weekly snapshots models are spread over
+
+    Returns:
+        list: Paths of the written files
+    """
+    rng = random.Random(seed)
+    output_dir = Path(output_dir)
+    start = datetime(2025, 9, 1, 9, 0, 0)
+    paths = []
+
+    for i in range(count):
+        hub = HUBS[i % len(HUBS)]
+        project = f"{1000 + (i // len(HUBS)) % projects_per_hub}_Synthetic Project"
+        model = f"SYN_{i // weeks:05d}_A_MDL"
+        timestamp = start + timedelta(weeks=i % weeks, hours=rng.randint(0, 48), seconds=i)
+        document = generate_sexy_duck(rng, hub, project, model, timestamp, scale)
+
+        if layout == 'received':
+            folder = output_dir / f"revit_slave_{start:%Y%m%d}_{i // 100:06d}" / 'task_output' / f"job_{i:06d}"
+        else:
+            folder = output_dir / hub / project / monday_of(timestamp)
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"{model}.sexyDuck"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=4, ensure_ascii=False)
+        paths.append(path)
+
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic .sexyDuck files for benchmarking")
+    parser.add_argument("output_dir", help="Directory to write into")
+    parser.add_argument("--count", type=int, default=100, help="Number of files (default: 100)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Document size multiplier (default: 1.0, ~50 KB)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--layout", choices=['tree', 'received'], default='tree')
+    args = parser.parse_args()
+
+    paths = write_documents(args.output_dir, args.count, args.scale, args.seed, args.layout)
+    total = sum(p.stat().st_size for p in paths)
+    print(f"✅ Wrote {len(paths)} file(s), {total / 1048576:.1f} MB, to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ block_cipher = None
 
 a = Analysis(
     ['sender.py'],
-    pathex=[],
+    pathex=['../docs/ref'],
     binaries=[],
     datas=[],
     hiddenimports=[
@@ -12,6 +12,9 @@ a = Analysis(
         'github',
         'PyGithub',
         'json',
+        'json_io',
+        'validation',
+        'orjson',
         'base64',
         'zipfile',
         'io',
@@ -4,18 +4,63 @@ HealthMetric Data Sender
 Sends data to GitHub repository and triggers GitHub Actions workflow
 """
 
-import json
 import os
 import sys
 import builtins
-import io
+import logging
+import logging.handlers
+import random
+import re
+import threading
 import time
+import urllib.error
+import urllib.request
 import base64
+import hashlib
 import zipfile
 import io
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
+
+# Shared JSON layer (orjson/msgspec when installed, stdlib json otherwise);
+# bundled into the EXE through pathex in HealthMetricSender.spec
+try:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "docs" / "ref"))
+    import json_io
+except ImportError:
+    # Sender copied without docs/ref: the same calls on stdlib json
+    import json
+
+    class json_io:
+        JSONDecodeError = json.JSONDecodeError
+
+        @staticmethod
+        def loads(data: Any) -> Any:
+            return json.loads(data)
+
+        @staticmethod
+        def load(file_path) -> Any:
+            with open(file_path, 'rb') as f:
+                return json.loads(f.read())
+
+        @staticmethod
+        def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> str:
+            if pretty:
+                return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, sort_keys=sort_keys)
+
+        @staticmethod
+        def dumpb(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+            return json_io.dumps(obj, pretty, sort_keys).encode('utf-8')
+
+        @staticmethod
+        def dump(obj: Any, file_path, pretty: bool = False, sort_keys: bool = False) -> int:
+            data = json_io.dumpb(obj, pretty, sort_keys)
+            with open(file_path, 'wb') as f:
+                f.write(data)
+            return len(data)
 
 # Force UTF-8 I/O as early as possible for consistent encoding behavior
 os.environ.setdefault("PYTHONIOENCODING", "utf-8:replace")
@@ -31,9 +76,44 @@ try:
 except Exception:
     pass
 
+# Log file used when there is no stdout (windowed EXE): buffered in memory and
+# written through one open handle, rotated by size, flushed at exit and on errors
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_BUFFER_LINES = 200
+LOG_LEVEL = getattr(logging, os.getenv('HEALTHMETRIC_LOG_LEVEL', 'INFO').upper(), logging.INFO)
+
+_file_logger = None
+
+
+def _get_file_logger() -> logging.Logger:
+    """Create the buffered, rotating file logger on first use (_logs/sender.log next to the executable)."""
+    global _file_logger
+    if _file_logger is None:
+        exe_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+        log_dir = os.path.join(exe_dir, "_logs")
+        os.makedirs(log_dir, exist_ok=True)
+        rotating = logging.handlers.RotatingFileHandler(
+            os.path.join(log_dir, "sender.log"), maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8', errors='replace', delay=True
+        )
+        rotating.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        # logging.shutdown (registered atexit by the logging module) flushes the buffer
+        buffered = logging.handlers.MemoryHandler(LOG_BUFFER_LINES, flushLevel=logging.ERROR, target=rotating)
+        logger = logging.getLogger('HealthMetricSender')
+        logger.setLevel(LOG_LEVEL)
+        logger.propagate = False
+        logger.addHandler(buffered)
+        _file_logger = logger
+    return _file_logger
+
+
 # Best-effort safe print that avoids UnicodeEncodeError on misconfigured consoles
-def _write_text(text: str) -> None:
-    """Write text either to stdout if available or to a rotating log file."""
+def _write_text(text: str, level: int = logging.INFO) -> None:
+    """Write text either to stdout if available or to the buffered, rotating log file."""
+    if level < LOG_LEVEL:
+        return
+
     # Try stdout first when available
     try:
         if getattr(sys, 'stdout', None) and hasattr(sys.stdout, 'write') and sys.stdout is not None:
@@ -46,34 +126,29 @@ def _write_text(text: str) -> None:
     except Exception:
         pass
 
-    # No stdout (windowed EXE) → write to log file near the executable
+    # No stdout (windowed EXE) → log file near the executable
     try:
-        exe_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-        log_dir = os.path.join(exe_dir, "_logs")
-        os.makedirs(log_dir, exist_ok=True)
-        log_path = os.path.join(log_dir, "sender.log")
-        with open(log_path, 'a', encoding='utf-8', errors='replace') as log_file:
-            log_file.write(text)
+        _get_file_logger().log(level, text.rstrip('\n'))
     except Exception:
         # Last resort: ignore
         pass
 
 
-def safe_print(message: Any) -> None:
+def safe_print(message: Any, level: int = logging.INFO) -> None:
     try:
         # Fast path: attempt normal print
         text = str(message)
-        _write_text(text + "\n")
+        _write_text(text + "\n", level)
     except UnicodeEncodeError:
         # Fallback: replace non-ASCII characters
         try:
             text = str(message)
             ascii_safe = text.encode('ascii', errors='replace').decode('ascii', errors='replace')
-            _write_text(ascii_safe + "\n")
+            _write_text(ascii_safe + "\n", level)
         except Exception:
             # Ultimate fallback: avoid crashing logging entirely
             try:
-                _write_text("[LOG] <unprintable message due to encoding>\n")
+                _write_text("[LOG] <unprintable message due to encoding>\n", level)
             except Exception:
                 pass
 
@@ -97,15 +172,496 @@ def _global_print(*args, **kwargs):
                 pass
 
 builtins.print = _global_print
-try:
-    import requests
-    from github import Github, Auth
-except ImportError:
-    safe_print("Required packages not installed. Installing...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "requests", "PyGithub"])
-    import requests
-    from github import Github, Auth
+
+
+def _import_github():
+    """
+    Import PyGithub on first use (installing it if missing).
+    Deferred so runs with nothing to send never pay for the import or the install check.
+    """
+    try:
+        from github import Github, Auth
+    except ImportError:
+        safe_print("Required packages not installed. Installing...")
+        import subprocess
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "requests", "PyGithub"])
+        from github import Github, Auth
+    return Github, Auth
+
+
+# Folder scanning rules: which files create_batch_payload sends (send_rules.json next to the sender)
+SEND_RULES_FILENAME = "send_rules.json"
+
+# Used when there is no send_rules.json; same as the file shipped with the sender
+DEFAULT_SEND_RULES = {
+    "include": ["task_output/*.sexyDuck", "task_output/*/*.sexyDuck"],
+    "exclude": ["_debug/**", "_log/**", "**/*.tmp"],
+    "max_file_size_mb": 100,
+    "max_age_days": None,
+    "extension_quotas": {".sexyDuck": 5000},
+    "invalid_files": "exclude"
+}
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """
+    Translate a path glob to a regex: '*' and '?' stay within one folder,
+    '**/' matches any number of folders and a trailing '**' matches everything below.
+    """
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            parts.append('[^/]')
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return ''.join(parts)
+
+
+class SendRules:
+    """Include/exclude globs, size/age limits and per-extension quotas for batch payloads"""
+    
+    def __init__(self, rules: Dict[str, Any], source: str = "defaults"):
+        """
+        Compile scanning rules.
+        
+        Args:
+            rules: Dict with include/exclude glob lists (relative POSIX paths, case-insensitive),
+                   max_file_size_mb, max_age_days and extension_quotas ({".ext": max files});
+                   missing or null entries mean no limit. invalid_files is "exclude" (default)
+                   or "flag" for .sexyDuck files that fail validation (see ValidationCache)
+            source: Where the rules came from (recorded in batch_metadata)
+        """
+        self.source = source
+        self.include = self._compile(rules.get("include") or ["**"])
+        self.exclude = self._compile(rules.get("exclude") or [])
+        max_size = rules.get("max_file_size_mb")
+        self.max_size_bytes = int(max_size * 1024 * 1024) if max_size else None
+        max_age = rules.get("max_age_days")
+        self.max_age_seconds = max_age * 86400 if max_age else None
+        self.extension_quotas = {ext.lower(): int(limit) for ext, limit in (rules.get("extension_quotas") or {}).items()}
+        self.invalid_files = rules.get("invalid_files") or "exclude"
+        if self.invalid_files not in ("exclude", "flag"):
+            raise ValueError(f"invalid_files must be 'exclude' or 'flag', got {self.invalid_files!r}")
+    
+    @staticmethod
+    def _compile(patterns: List[str]) -> Optional["re.Pattern"]:
+        """Precompile a list of globs into one case-insensitive regex (None if empty)."""
+        if not patterns:
+            return None
+        return re.compile('|'.join(f"(?:{_glob_to_regex(p)})" for p in patterns), re.IGNORECASE)
+    
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "SendRules":
+        """
+        Load rules from HEALTHMETRIC_SEND_RULES, the given path, or send_rules.json next to
+        the sender (the EXE folder when frozen). Falls back to DEFAULT_SEND_RULES.
+        """
+        if path is None:
+            sender_dir = os.path.dirname(sys.executable if getattr(sys, 'frozen', False) else os.path.abspath(__file__))
+            path = os.getenv('HEALTHMETRIC_SEND_RULES') or os.path.join(sender_dir, SEND_RULES_FILENAME)
+        if not os.path.exists(path):
+            return cls(DEFAULT_SEND_RULES)
+        return cls(json_io.load(path), source=os.path.basename(path))
+    
+    def prune_dir(self, relative_dir: str) -> bool:
+        """True if a whole folder is excluded, so the walk can skip it."""
+        return bool(self.exclude and self.exclude.fullmatch(relative_dir + '/'))
+    
+    def check(self, relative_path: str, size: int, mtime: float, now: float) -> Optional[str]:
+        """
+        Check one file against the rules (quotas are applied separately).
+        
+        Returns:
+            None if the file is sent, otherwise the skip reason
+            ('excluded', 'not_included', 'too_large' or 'too_old')
+        """
+        if self.exclude and self.exclude.fullmatch(relative_path):
+            return 'excluded'
+        if self.include and not self.include.fullmatch(relative_path):
+            return 'not_included'
+        if self.max_size_bytes is not None and size > self.max_size_bytes:
+            return 'too_large'
+        if self.max_age_seconds is not None and now - mtime > self.max_age_seconds:
+            return 'too_old'
+        return None
+
+
+def _sender_data_path(filename: str, env_var: str) -> str:
+    """Path of a sender state file next to the executable (env_var overrides)."""
+    exe_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+    return os.getenv(env_var) or os.path.join(exe_dir, filename)
+
+
+# Sender-side validation of .sexyDuck files: the checks the merge and scoring apply,
+# run before upload so invalid files never cost bandwidth, a commit or runner time
+VALIDATION_CACHE_FILENAME = "sender_validation_cache.json"
+VALIDATION_CACHE_VERSION = 1      # Bump when the validation rules change so old results are discarded
+VALIDATION_CACHE_MAX_ENTRIES = 20000
+VALIDATED_EXTENSIONS = ('.sexyduck',)
+
+
+class ValidationCache:
+    """
+    Validation results for .sexyDuck files keyed by a hash of the file content,
+    so an unchanged file is parsed and checked only once however often it is scanned.
+    The checks are validation.sexy_duck_rejection (failed status, error_occurred, mock_mode)
+    and validation.validate_sexy_duck_data (job_metadata, model_file_size_bytes, result_data),
+    the same ones merge_data_received applies (through scoring, which re-exports them).
+    One cache is shared by the scan pool threads; its results and counters are guarded by a lock.
+    """
+    
+    def __init__(self, cache_path: Optional[str] = None):
+        self.cache_path = cache_path or _sender_data_path(VALIDATION_CACHE_FILENAME, 'HEALTHMETRIC_VALIDATION_CACHE')
+        self.results: Dict[str, Optional[str]] = {}
+        self.hits = 0
+        self.checked = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            cached = json_io.load(self.cache_path)
+            if cached.get('version') == VALIDATION_CACHE_VERSION:
+                self.results = cached.get('results', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+    
+    @staticmethod
+    def validate(content_bytes: bytes, source: str = '') -> Optional[str]:
+        """Validate .sexyDuck content; returns the rejection reason or None if valid."""
+        # Imported on first use: runs with nothing to send never load it.
+        # validation is standard library only; scoring would pull in NumPy
+        from validation import sexy_duck_rejection, validate_sexy_duck_data
+        if not content_bytes.strip():
+            return "File is empty"
+        try:
+            data = json_io.loads(content_bytes)
+        except json_io.JSONDecodeError as e:
+            return f"Invalid JSON: {str(e)[:50]}..."
+        try:
+            return sexy_duck_rejection(data) or validate_sexy_duck_data(data, source)
+        except (ValueError, AttributeError, TypeError) as e:
+            return str(e)
+    
+    def check(self, content_bytes: bytes, source: str = '') -> Optional[str]:
+        """Cached validate(): returns the rejection reason or None if valid."""
+        digest = hashlib.sha256(content_bytes).hexdigest()[:32]
+        with self._lock:
+            if digest in self.results:
+                self.hits += 1
+                return self.results[digest]
+        # Validated outside the lock: parsing is the slow part and other threads keep going
+        reason = self.validate(content_bytes, source)
+        with self._lock:
+            self.checked += 1
+            self.results[digest] = reason
+            self._dirty = True
+        return reason
+    
+    def save(self) -> None:
+        """Write the cache atomically if it changed (oldest entries dropped beyond the cap)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            if len(self.results) > VALIDATION_CACHE_MAX_ENTRIES:
+                self.results = dict(list(self.results.items())[-VALIDATION_CACHE_MAX_ENTRIES:])
+            results = dict(self.results)
+        temp_path = self.cache_path + '.tmp'
+        try:
+            json_io.dump({'version': VALIDATION_CACHE_VERSION, 'results': results}, temp_path)
+            os.replace(temp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            safe_print(f"Could not save validation cache: {str(e)}", logging.ERROR)
+
+
+# Agent mode (sender.py --agent): stay resident, poll for new/modified files and send small batches
+AGENT_STATE_FILENAME = "sender_agent_state.json"
+AGENT_POLL_SECONDS = 30          # Time between polls (±20% jitter so senders drift apart)
+AGENT_DEBOUNCE_SECONDS = 60      # A file must be unchanged this long, and the folder quiet, before sending
+AGENT_MAX_DELAY_SECONDS = 600    # Send ready files after this long even if the folder never goes quiet
+AGENT_FULL_RESCAN_SECONDS = 900  # Re-stat every file periodically (catches in-place rewrites)
+AGENT_BATCH_FILES = 200          # Max files per incremental batch (one batch per poll)
+AGENT_MAX_BACKOFF_SECONDS = 900  # Retry delay cap after a failed send
+
+
+class FolderWatcher:
+    """
+    Change detection for a folder tree by polling directory mtimes.
+    A poll costs one stat per folder; files are only listed and stat'd again in folders
+    whose mtime changed (a file was added, removed or replaced) or on a full rescan.
+    """
+    
+    def __init__(self, folder: str, rules: SendRules):
+        self.folder = folder
+        self.rules = rules
+        # relative dir -> (dir mtime_ns, subfolder names, {filename: (size, mtime_ns)})
+        self._dirs: Dict[str, Tuple[int, List[str], Dict[str, Tuple[int, int]]]] = {}
+    
+    def poll(self, full: bool = False) -> Dict[str, Tuple[int, int]]:
+        """
+        Scan for changes since the previous poll (everything is new on the first poll).
+        
+        Args:
+            full: Re-list every folder even if its mtime did not change
+            
+        Returns:
+            {relative POSIX path: (size, mtime_ns)} for new or changed files allowed by the rules
+        """
+        changed: Dict[str, Tuple[int, int]] = {}
+        seen = set()
+        self._scan('', full, time.time(), changed, seen)
+        for relative_dir in set(self._dirs) - seen:
+            del self._dirs[relative_dir]
+        return changed
+    
+    def files(self) -> Dict[str, Tuple[int, int]]:
+        """All files known from the last poll, {relative path: (size, mtime_ns)}."""
+        known = {}
+        for relative_dir, (_, _, files) in self._dirs.items():
+            prefix = relative_dir + '/' if relative_dir else ''
+            for name, signature in files.items():
+                known[prefix + name] = signature
+        return known
+    
+    def _scan(self, relative_dir: str, full: bool, now: float,
+              changed: Dict[str, Tuple[int, int]], seen: set) -> None:
+        path = os.path.join(self.folder, relative_dir) if relative_dir else self.folder
+        try:
+            dir_mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        seen.add(relative_dir)
+        prefix = relative_dir + '/' if relative_dir else ''
+        cached = self._dirs.get(relative_dir)
+        
+        if cached is not None and cached[0] == dir_mtime and not full:
+            subdirs = cached[1]
+        else:
+            previous = cached[2] if cached is not None else {}
+            subdirs, files = [], {}
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                return
+            for entry in entries:
+                relative_path = prefix + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self.rules.prune_dir(relative_path):
+                            subdirs.append(entry.name)
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        if self.rules.check(relative_path, stat.st_size, stat.st_mtime, now):
+                            continue
+                        signature = (stat.st_size, stat.st_mtime_ns)
+                        files[entry.name] = signature
+                        if previous.get(entry.name) != signature:
+                            changed[relative_path] = signature
+                except OSError:
+                    continue
+            self._dirs[relative_dir] = (dir_mtime, subdirs, files)
+        
+        for name in subdirs:
+            self._scan(prefix + name, full, now, changed, seen)
+
+
+# One run may send several source roots (every user's RevitSlaveDatabase on a shared box);
+# the jobs share one GitHub connection, one API rate budget and one scan pool.
+# Only the canonical per-user folder is searched: USERS_ROOT\<user>\SOURCE_FOLDER_SUFFIX
+USERS_ROOT = "C:\\Users"
+SOURCE_FOLDER_SUFFIX = os.path.join("Documents", "EnneadTab Ecosystem", "Dump", "RevitSlaveDatabase")
+SCAN_WORKERS = 2                 # Payloads built at once (each holds its files in memory until sent)
+API_MIN_INTERVAL_SECONDS = 1.0   # Spacing between GitHub write calls (secondary rate limits)
+API_MAX_WRITES_PER_RUN = 100     # Write calls per pass (one run, or one agent poll); the rest wait for the next
+
+
+# Blob SHAs of payloads this sender uploaded and the paths of their content hashes
+# (next to the EXE), so a retried or duplicate send is recognised before uploading the content again
+REMOTE_SHA_CACHE_FILENAME = "sender_remote_shas.json"
+REMOTE_SHA_CACHE_MAX_ENTRIES = 2000
+
+
+def git_blob_sha(content: bytes) -> str:
+    """The SHA git (and the GitHub contents API) reports for a file with this content."""
+    digest = hashlib.sha1(b"blob %d\0" % len(content))
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def payload_content_sha(payload: Dict[str, Any]) -> Optional[str]:
+    """
+    Hash of what a batch payload sends: its source and each file's path and content.
+    batch_metadata (timestamp, skip counts) and the upload name change on every run and
+    are left out, so the same files sent again give the same hash. None for other data.
+    """
+    files = payload.get('files')
+    if not isinstance(files, dict):
+        return None
+    digest = hashlib.sha256(str(payload.get('batch_metadata', {}).get('source', '')).encode('utf-8'))
+    for relative_path in sorted(files):
+        digest.update(b"\0" + relative_path.encode('utf-8') + b"\0")
+        digest.update(str(files[relative_path].get('content', '')).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def declared_sizes(payload: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Sizes the receiver admits a batch by before downloading it (sent in the dispatch/trigger).
+    
+    Returns:
+        {'total_files': ..., 'total_bytes': ...} (bytes of the files, before base64)
+    """
+    files = payload.get('files', {})
+    return {
+        'total_files': payload.get('batch_metadata', {}).get('total_files', len(files)),
+        'total_bytes': sum(info.get('size', 0) for info in files.values())
+    }
+
+
+class RateBudget:
+    """Spacing and cap for GitHub API write calls, shared by every job of one send pass (see refill)"""
+    
+    def __init__(self, min_interval: float = API_MIN_INTERVAL_SECONDS, max_calls: int = API_MAX_WRITES_PER_RUN):
+        self.min_interval = min_interval
+        self.max_calls = max_calls
+        self.calls = 0
+        self._last_call = 0.0
+    
+    def acquire(self, label: str, calls: int = 1) -> bool:
+        """
+        Wait for the next call slot; False (and nothing is called) when the budget is used up.
+        calls > 1 books one operation made of several write requests (e.g. a Git Data API commit).
+        """
+        if self.calls + calls > self.max_calls:
+            safe_print(f"API budget used up ({self.max_calls} write calls this pass), skipping: {label}", logging.ERROR)
+            return False
+        wait = self._last_call + self.min_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_call = time.monotonic()
+        self.calls += calls
+        return True
+    
+    def refill(self) -> None:
+        """Start a new pass with the full cap (the spacing to the last call is kept)."""
+        self.calls = 0
+
+
+# Git Data API uploads: blobs -> tree -> commit -> ref update puts many files in one atomic commit.
+# HEALTHMETRIC_UPLOAD_MODE: "auto" (Git Data API when one send holds several files),
+# "git" (always) or "contents" (Contents API, one commit per file)
+GITHUB_API_URL = os.getenv('HEALTHMETRIC_GITHUB_API', 'https://api.github.com')
+UPLOAD_MODES = ('auto', 'git', 'contents')
+BLOB_WORKERS = 8           # Parallel blob uploads
+REF_UPDATE_RETRIES = 3     # Rebuilds of tree/commit when the branch moved during the upload
+
+
+class GitDataError(Exception):
+    """Error response from the GitHub API (status is the HTTP status code)"""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(f"GitHub API {status}: {message}")
+        self.status = status
+
+
+class GitDataClient:
+    """
+    Minimal client for the GitHub Git Data API (blobs, trees, commits, refs) over urllib.
+    Every request is independent, so blobs can be uploaded from several threads at once
+    (a PyGithub session is not shared between threads).
+    """
+    
+    def __init__(self, token: str, repo_name: str, api_url: str = GITHUB_API_URL, timeout: float = 300):
+        self.token = token
+        self.repo_name = repo_name
+        self.api_url = api_url.rstrip('/')
+        self.timeout = timeout
+        self.requests = 0
+    
+    def _request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Any:
+        request = urllib.request.Request(
+            f"{self.api_url}/repos/{self.repo_name}/{path}",
+            data=json_io.dumpb(body) if body is not None else None,
+            method=method,
+            headers={
+                'Authorization': f"Bearer {self.token}",
+                'Accept': 'application/vnd.github+json',
+                'X-GitHub-Api-Version': '2022-11-28',
+                'Content-Type': 'application/json',
+                'User-Agent': 'HealthMetricSender'
+            }
+        )
+        self.requests += 1
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json_io.loads(response.read())
+        except urllib.error.HTTPError as e:
+            try:
+                message = json_io.loads(e.read()).get('message', e.reason)
+            except Exception:
+                message = e.reason
+            raise GitDataError(e.code, message) from None
+    
+    def create_blob(self, content: bytes) -> str:
+        """Upload file content; returns its blob SHA."""
+        body = {'content': base64.b64encode(content).decode('ascii'), 'encoding': 'base64'}
+        return self._request('POST', 'git/blobs', body)['sha']
+    
+    def upload_blobs(self, contents: List[bytes], workers: int = BLOB_WORKERS) -> List[str]:
+        """Upload several contents in parallel (identical contents once); returns blob SHAs in order."""
+        unique = {}
+        for content in contents:
+            unique.setdefault(git_blob_sha(content), content)
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(unique)))) as pool:
+            uploaded = dict(zip(unique, pool.map(self.create_blob, unique.values())))
+        return [uploaded[git_blob_sha(content)] for content in contents]
+    
+    def commit_blobs(self, entries: Dict[str, str], message: str, branch: str,
+                     retries: int = REF_UPDATE_RETRIES) -> str:
+        """
+        Commit uploaded blobs on top of the branch head in one commit.
+        
+        Args:
+            entries: {repository path: blob SHA}
+            message: Commit message
+            branch: Branch to update (fast-forward only)
+            retries: Rebuilds when another push moved the branch meanwhile
+            
+        Returns:
+            str: SHA of the new commit
+        """
+        tree_entries = [{'path': path, 'mode': '100644', 'type': 'blob', 'sha': sha} for path, sha in entries.items()]
+        for attempt in range(retries + 1):
+            parent = self._request('GET', f"git/ref/heads/{branch}")['object']['sha']
+            base_tree = self._request('GET', f"git/commits/{parent}")['tree']['sha']
+            tree = self._request('POST', 'git/trees', {'base_tree': base_tree, 'tree': tree_entries})['sha']
+            commit = self._request('POST', 'git/commits', {'message': message, 'tree': tree, 'parents': [parent]})['sha']
+            try:
+                self._request('PATCH', f"git/refs/heads/{branch}", {'sha': commit, 'force': False})
+                return commit
+            except GitDataError as e:
+                # 422: not a fast-forward (the branch moved); blobs stay valid, rebuild on the new head
+                if e.status != 422 or attempt == retries:
+                    raise
+                safe_print(f"Branch {branch} moved during upload, retrying commit ({attempt + 1}/{retries})", logging.WARNING)
+    
+    def commit_files(self, files: Dict[str, bytes], message: str, branch: str,
+                     workers: int = BLOB_WORKERS) -> str:
+        """Upload files (blobs in parallel) and commit them in one commit; returns the commit SHA."""
+        paths = list(files)
+        shas = self.upload_blobs([files[path] for path in paths], workers)
+        return self.commit_blobs(dict(zip(paths, shas)), message, branch)
 
 
 def get_token():
@@ -136,40 +692,71 @@ class HealthMetricSender:
             # Set default repository and folder
             self.repo_name = "ennead-architects-llp/HealthMetric"
             current_user = os.getenv('USERNAME') or os.getenv('USER') or 'USERNAME'
-            self.default_source_folder = rf"C:\Users\{current_user}\Documents\EnneadTab Ecosystem\Dump\RevitSlaveDatabase"
+            self.default_source_folder = os.path.join(USERS_ROOT, current_user, SOURCE_FOLDER_SUFFIX)
             
             # Get computer identification
             import socket
             self.computer_name = socket.gethostname()
             self.user_name = current_user
             
-            # Connect to GitHub
-            self.github = Github(auth=Auth.Token(self.token))
-            self.repo = self.github.get_repo(self.repo_name)
+            # GitHub connection is opened on first use (see the repo property)
+            self._github = None
+            self._repo = None
+            self.rate_budget = RateBudget()
+            self._remote_shas = None      # {path: blob sha} uploaded before (loaded on first send)
+            self._payload_paths = None    # {payload content sha: path} uploaded before (loaded with _remote_shas)
+            self._remote_path_shas = {}   # {path: blob sha or None} looked up in this run
+            self.upload_mode = os.getenv('HEALTHMETRIC_UPLOAD_MODE', 'auto').lower()
+            if self.upload_mode not in UPLOAD_MODES:
+                raise ValueError(f"HEALTHMETRIC_UPLOAD_MODE must be one of {', '.join(UPLOAD_MODES)}")
+            self._git_data = None
             
             # Get branch from environment variable or use default
             self.branch = os.getenv('HEALTHMETRIC_BRANCH', 'main')
             
-            safe_print(f"Connected to repository: {self.repo_name}")
+            safe_print(f"Repository: {self.repo_name}")
             safe_print(f"Target branch: {self.branch}")
             safe_print(f"Computer: {self.computer_name}")
             safe_print(f"User: {self.user_name}")
             safe_print(f"Source folder: {self.default_source_folder}")
             
         except Exception as e:
-            safe_print(f"Initialization error: {str(e)}")
+            safe_print(f"Initialization error: {str(e)}", logging.ERROR)
             raise
     
+    @property
+    def repo(self):
+        """GitHub repository, connected on first access (the only network round-trip before sending)."""
+        if self._repo is None:
+            Github, Auth = _import_github()
+            self._github = Github(auth=Auth.Token(self.token))
+            self._repo = self._github.get_repo(self.repo_name)
+            safe_print(f"Connected to repository: {self.repo_name}")
+        return self._repo
+    
+    @property
+    def git_data(self) -> GitDataClient:
+        """Git Data API client for multi-file commits (no connection is opened until used)."""
+        if self._git_data is None:
+            self._git_data = GitDataClient(self.token, self.repo_name)
+        return self._git_data
+    
     def send_data(self, data: Dict[Any, Any], filename: Optional[str] = None) -> bool:
         """
         Send data to the repository and trigger GitHub Actions
         
+        The git blob SHA of the payload is computed locally. When the same path was uploaded
+        before (a retry), it is compared with the remote SHA and an identical payload is not
+        uploaded again; a changed one updates the file with that SHA. Batch payloads whose
+        files were already uploaded under another name are caught earlier, by
+        send_data_and_trigger_dispatch (see payload_content_sha).
+        
         Args:
             data: Data dictionary to send
             filename: Optional custom filename (defaults to timestamp)
             
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if successful (or already uploaded), False otherwise
         """
         try:
             # Generate filename if not provided
@@ -181,51 +768,155 @@ class HealthMetricSender:
             if not filename.endswith('.json'):
                 filename += '.json'
             
-            # Convert data to JSON
-            json_data = json.dumps(data, indent=2, ensure_ascii=False)
+            # Convert data to JSON (compact: payloads are mostly base64 content, never read by people)
+            json_data = json_io.dumpb(data)
+            local_sha = git_blob_sha(json_data)
+            content_sha = payload_content_sha(data)
             
             # Create file path in temporary storage folder in the repo
             file_path = f"_temp_storage/{filename}"
             
             safe_print(f"Sending data to: {file_path}")
             
+            # Only a path uploaded before (a retry) needs the remote SHA: one call for that path
+            remote_sha = self._remote_sha(file_path) if file_path in self._load_remote_shas() else None
+            if remote_sha == local_sha:
+                safe_print(f"Skipped upload: identical content already at {file_path} (blob {local_sha[:7]})")
+                return True
+            if not self.rate_budget.acquire(file_path, 4 if self.upload_mode == 'git' else 1):
+                return False
+            
+            # Git Data API: blob -> tree -> commit -> ref (the path is overwritten, no SHA needed)
+            if self.upload_mode == 'git':
+                self.git_data.commit_files({file_path: json_data}, f"$$$ Add new data: {filename}", self.branch)
+                safe_print(f"Committed {file_path} on branch {self.branch} (Git Data API)")
+                self._remember_remote_sha(file_path, local_sha, content_sha)
+                return True
+            
             # Upload file to repository
-            try:
-                # Try to get existing file to check if it exists
-                existing_file = self.repo.get_contents(file_path, ref=self.branch)
-                
-                # Update existing file
-                commit_message = f"$$$ Update data: {filename}"
-                self.repo.update_file(
+            if remote_sha is None:
+                try:
+                    result = self.repo.create_file(
+                        path=file_path,
+                        message=f"$$$ Add new data: {filename}",
+                        content=json_data,
+                        branch=self.branch
+                    )
+                    safe_print(f"Created new file: {file_path} on branch {self.branch}")
+                except Exception as e:
+                    # 422: the file exists but was not uploaded by this sender (or its cache was lost)
+                    if getattr(e, 'status', None) != 422:
+                        raise
+                    remote_sha = self._remote_sha(file_path, refresh=True)
+                    if remote_sha is None:
+                        raise
+                    if remote_sha == local_sha:
+                        self._remember_remote_sha(file_path, remote_sha, content_sha)
+                        safe_print(f"Skipped upload: identical content already at {file_path} (blob {local_sha[:7]})")
+                        return True
+            if remote_sha is not None:
+                result = self.repo.update_file(
                     path=file_path,
-                    message=commit_message,
+                    message=f"$$$ Update data: {filename}",
                     content=json_data,
-                    sha=existing_file.sha,
+                    sha=remote_sha,
                     branch=self.branch
                 )
                 safe_print(f"Updated existing file: {file_path} on branch {self.branch}")
-                
-            except Exception:
-                # Create new file
-                commit_message = f"$$$ Add new data: {filename}"
-                self.repo.create_file(
-                    path=file_path,
-                    message=commit_message,
-                    content=json_data,
-                    branch=self.branch
-                )
-                safe_print(f"Created new file: {file_path} on branch {self.branch}")
+            self._remember_remote_sha(file_path, result['content'].sha, content_sha)
             
             # No implicit trigger here; caller will create an explicit trigger with metadata
             
             return True
             
         except Exception as e:
-            safe_print(f"Error sending data: {str(e)}")
+            safe_print(f"Error sending data: {str(e)}", logging.ERROR)
             return False
     
-    def create_trigger(self, job_name: str, raw_filename: str, source_label: str) -> bool:
-        """Create a JSON trigger file in .github/triggers pointing to the raw payload"""
+    def _load_remote_shas(self) -> Dict[str, str]:
+        """Blob SHAs uploaded to this repository and branch by earlier sends (loaded once)."""
+        if self._remote_shas is None:
+            self._remote_shas = {}
+            self._payload_paths = {}
+            key = f"{self.repo_name}@{self.branch}"
+            try:
+                cached = json_io.load(_sender_data_path(REMOTE_SHA_CACHE_FILENAME, 'HEALTHMETRIC_REMOTE_SHA_CACHE'))
+                self._remote_shas = dict(cached.get(key, {}))
+                self._payload_paths = dict(cached.get('payloads', {}).get(key, {}))
+            except (OSError, ValueError, AttributeError):
+                pass
+        return self._remote_shas
+    
+    def _remember_remote_sha(self, file_path: str, blob_sha: str, content_sha: Optional[str] = None) -> None:
+        """
+        Record an uploaded blob SHA (and the payload content hash it holds) and save the cache
+        (oldest entries dropped beyond the cap).
+        """
+        shas = self._load_remote_shas()
+        shas.pop(file_path, None)
+        shas[file_path] = blob_sha
+        self._remote_path_shas[file_path] = blob_sha
+        if len(shas) > REMOTE_SHA_CACHE_MAX_ENTRIES:
+            self._remote_shas = shas = dict(list(shas.items())[-REMOTE_SHA_CACHE_MAX_ENTRIES:])
+        payloads = self._payload_paths
+        if content_sha:
+            payloads.pop(content_sha, None)
+            payloads[content_sha] = file_path
+            if len(payloads) > REMOTE_SHA_CACHE_MAX_ENTRIES:
+                self._payload_paths = payloads = dict(list(payloads.items())[-REMOTE_SHA_CACHE_MAX_ENTRIES:])
+        cache_path = _sender_data_path(REMOTE_SHA_CACHE_FILENAME, 'HEALTHMETRIC_REMOTE_SHA_CACHE')
+        try:
+            cached = json_io.load(cache_path)
+            if not isinstance(cached, dict):
+                cached = {}
+        except (OSError, ValueError):
+            cached = {}
+        key = f"{self.repo_name}@{self.branch}"
+        cached[key] = shas
+        if not isinstance(cached.get('payloads'), dict):
+            cached['payloads'] = {}
+        cached['payloads'][key] = payloads
+        try:
+            json_io.dump(cached, cache_path + '.tmp')
+            os.replace(cache_path + '.tmp', cache_path)
+        except OSError as e:
+            safe_print(f"Could not save remote SHA cache: {str(e)}", logging.ERROR)
+    
+    def _remote_sha(self, file_path: str, refresh: bool = False) -> Optional[str]:
+        """
+        Current blob SHA of a file on the branch, or None if it does not exist.
+        Looks up that one path (not its folder, whose listing stops at 1,000 entries),
+        at most once per run unless refresh is set.
+        """
+        if refresh or file_path not in self._remote_path_shas:
+            try:
+                entry = self.repo.get_contents(file_path, ref=self.branch)
+                self._remote_path_shas[file_path] = None if isinstance(entry, list) else entry.sha
+            except Exception as e:
+                if getattr(e, 'status', None) != 404:
+                    raise
+                self._remote_path_shas[file_path] = None
+        return self._remote_path_shas[file_path]
+    
+    def _uploaded_payload_path(self, content_sha: Optional[str]) -> Optional[str]:
+        """
+        Repository path of a payload with the same content uploaded by an earlier send,
+        if it is still there unchanged (the receiver deletes payloads it has processed).
+        """
+        if not content_sha:
+            return None
+        self._load_remote_shas()
+        file_path = self._payload_paths.get(content_sha)
+        if file_path is None:
+            return None
+        if self._remote_sha(file_path) == self._remote_shas.get(file_path):
+            return file_path
+        self._payload_paths.pop(content_sha, None)
+        return None
+    
+    def create_trigger(self, job_name: str, raw_filename: str, source_label: str,
+                       sizes: Optional[Dict[str, int]] = None) -> bool:
+        """Create a JSON trigger file in .github/triggers pointing to the raw payload (sizes: see declared_sizes)"""
         try:
             trigger_dir = ".github/triggers"
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -239,19 +930,24 @@ class HealthMetricSender:
                 "created_at": datetime.utcnow().isoformat(),
                 "schema_version": "1.0.0"
             }
+            trigger_payload.update(sizes or {})
 
+            if not self.rate_budget.acquire(trigger_path):
+                return False
             self.repo.create_file(
                 path=trigger_path,
                 message=f"Create trigger for job {job_name}",
-                content=json.dumps(trigger_payload, ensure_ascii=False, indent=2)
+                content=json_io.dumps(trigger_payload, pretty=True)
             )
             safe_print(f"Created trigger: {trigger_path}")
             return True
         except Exception as e:
-            safe_print(f"Could not create trigger: {str(e)}")
+            safe_print(f"Could not create trigger: {str(e)}", logging.ERROR)
             return False
     
-    def trigger_workflow_dispatch(self, job_name: str, raw_filename: str, source_label: str) -> bool:
+    def trigger_workflow_dispatch(self, job_name: str, raw_filename: str, source_label: str,
+                                  user_name: Optional[str] = None,
+                                  sizes: Optional[Dict[str, int]] = None) -> bool:
         """
         Trigger workflow via repository_dispatch event (no commit needed!)
         
@@ -259,22 +955,30 @@ class HealthMetricSender:
             job_name: Job name for the trigger
             raw_filename: Filename of the data file
             source_label: Source label for the trigger
+            user_name: User whose data was sent (default: the user running the sender)
+            sizes: total_files/total_bytes of the batch (see declared_sizes), used by the
+                receiver's admission control before it downloads anything
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
+            user_name = user_name or self.user_name
             payload = {
                 "raw_path": f"_temp_storage/{raw_filename}",
                 "job_name": job_name,
                 "source": source_label,
                 "computer_name": self.computer_name,
-                "user_name": self.user_name,
+                "user_name": user_name,
                 "created_at": datetime.utcnow().isoformat()
             }
+            # repository_dispatch allows at most 10 top-level client_payload properties
+            payload.update(sizes or {})
             
             safe_print(f"Triggering workflow via repository_dispatch...")
-            safe_print(f"Computer: {self.computer_name}, User: {self.user_name}")
+            safe_print(f"Computer: {self.computer_name}, User: {user_name}")
+            if not self.rate_budget.acquire(f"dispatch {job_name}"):
+                return False
             
             # Trigger repository_dispatch event
             self.repo.create_repository_dispatch(
@@ -286,10 +990,11 @@ class HealthMetricSender:
             return True
             
         except Exception as e:
-            safe_print(f"Error triggering workflow: {str(e)}")
+            safe_print(f"Error triggering workflow: {str(e)}", logging.ERROR)
             return False
     
-    def send_data_and_trigger_dispatch(self, data: Dict[Any, Any], filename: str, job_name: str, source_label: str) -> bool:
+    def send_data_and_trigger_dispatch(self, data: Dict[Any, Any], filename: str, job_name: str, source_label: str,
+                                       user_name: Optional[str] = None) -> bool:
         """
         Send data file (1 commit) and trigger workflow via dispatch (no commit)
         This is the most efficient approach - only 1 commit per ingestion!
@@ -299,38 +1004,56 @@ class HealthMetricSender:
             filename: Filename for the data file
             job_name: Job name for the trigger
             source_label: Source label for the trigger
+            user_name: User whose data is sent (default: the user running the sender)
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Step 1: Send data file (creates 1 commit)
-            safe_print(f"Sending data file: {filename}")
-            data_sent = self.send_data(data, filename)
-            
-            if not data_sent:
-                return False
-            
-            # Small delay to ensure GitHub propagates the commit before workflow starts
-            safe_print("Waiting for GitHub to propagate commit...")
-            time.sleep(3)
+            # The same files already uploaded by an earlier run: trigger on that payload instead
+            existing = self._uploaded_payload_path(payload_content_sha(data))
+            if existing:
+                filename = existing.rsplit('/', 1)[-1]
+                safe_print(f"Skipped upload: identical payload already at {existing}")
+            else:
+                # Step 1: Send data file (creates 1 commit)
+                safe_print(f"Sending data file: {filename}")
+                data_sent = self.send_data(data, filename)
+                
+                if not data_sent:
+                    return False
+                
+                # Small delay to ensure GitHub propagates the commit before workflow starts
+                safe_print("Waiting for GitHub to propagate commit...")
+                time.sleep(3)
             
             # Step 2: Trigger workflow via repository_dispatch (no commit!)
-            return self.trigger_workflow_dispatch(job_name, filename, source_label)
+            return self.trigger_workflow_dispatch(job_name, filename, source_label, user_name, declared_sizes(data))
             
         except Exception as e:
-            safe_print(f"Error in send_data_and_trigger_dispatch: {str(e)}")
+            safe_print(f"Error in send_data_and_trigger_dispatch: {str(e)}", logging.ERROR)
             return False
     
-    def create_batch_payload(self, path_to_send: str) -> Dict[str, Any]:
+    def create_batch_payload(self, path_to_send: str, rules: Optional[SendRules] = None,
+                             files: Optional[List[Path]] = None,
+                             validation: Optional["ValidationCache"] = None) -> Dict[str, Any]:
         """
         Create a batch payload from a folder (recursively) or a single file.
+        Folder walks only send files allowed by the send rules; a single file is always sent.
         
         Args:
             path_to_send: Path to a folder (recursed) or to a single file
+            rules: Scanning rules (default: SendRules.load(), i.e. send_rules.json next to the sender)
+            files: Explicit files inside the folder to send instead of walking it
+                   (already selected, e.g. by agent mode; the rules are not applied again)
+            validation: Validation cache shared by several payloads (saved by the caller);
+                        default: the sender's cache file, saved when the payload is built
             
         Returns:
-            Dictionary containing batch payload with files
+            Dictionary containing batch payload with files; batch_metadata['skipped']
+            counts files left out per reason and batch_metadata['rejected'] lists the
+            .sexyDuck files that failed validation (left out, or sent and flagged with
+            invalid_files "flag" and for a single file)
         """
         target_path = Path(path_to_send)
         if not target_path.exists():
@@ -349,21 +1072,58 @@ class HealthMetricSender:
                 'timestamp': datetime.now().isoformat(),
                 'source': source_label,
                 'total_files': 0,
-                'files': []
+                'files': [],
+                'skipped': {
+                    'rules': None,
+                    'excluded': 0,
+                    'not_included': 0,
+                    'too_large': 0,
+                    'too_old': 0,
+                    'over_quota': 0,
+                    'invalid': 0,
+                    'bytes': 0
+                },
+                'rejected': []
             },
             'files': {}
         }
 
+        own_validation = validation is None
+        validation = validation or ValidationCache()
+        # A single explicit file is always sent; folder sends follow the rules
+        if target_path.is_file():
+            invalid_files = "flag"
+        else:
+            rules = rules or SendRules.load()
+            invalid_files = rules.invalid_files
+
         def add_file_to_payload(file_path: Path) -> None:
             nonlocal payload
             try:
                 with open(file_path, 'rb') as file_handle:
                     content_bytes = file_handle.read()
-                content_b64 = base64.b64encode(content_bytes).decode('utf-8')
 
                 relative_path = str(file_path.relative_to(base_dir)) if base_dir in file_path.parents or file_path == base_dir / file_path.name else file_path.name
                 # Normalize to POSIX-style paths for cross-platform safety
                 relative_path = relative_path.replace('\\', '/')
+
+                # Validate .sexyDuck content before it costs upload bandwidth, a commit and runner time
+                if file_path.suffix.lower() in VALIDATED_EXTENSIONS:
+                    reason = validation.check(content_bytes, relative_path)
+                    if reason:
+                        sent = invalid_files == "flag"
+                        payload['batch_metadata']['rejected'].append({
+                            'relative_path': relative_path,
+                            'reason': reason,
+                            'sent': sent
+                        })
+                        if not sent:
+                            payload['batch_metadata']['skipped']['invalid'] += 1
+                            payload['batch_metadata']['skipped']['bytes'] += len(content_bytes)
+                            safe_print(f"Skipping invalid file: {relative_path} ({reason})", logging.WARNING)
+                            return
+
+                content_b64 = base64.b64encode(content_bytes).decode('utf-8')
                 file_record = {
                     'filename': file_path.name,
                     'relative_path': relative_path,
@@ -382,21 +1142,94 @@ class HealthMetricSender:
                     'extension': file_path.suffix.lower()
                 })
                 payload['batch_metadata']['total_files'] += 1
-                safe_print(f"Added file: {relative_path} ({len(content_bytes)} bytes)")
+                safe_print(f"Added file: {relative_path} ({len(content_bytes)} bytes)", logging.DEBUG)
             except Exception as ex:
-                safe_print(f"Error reading file {file_path}: {str(ex)}")
+                safe_print(f"Error reading file {file_path}: {str(ex)}", logging.ERROR)
 
-        # Collect files (single file or recursive folder walk)
+        # Collect files (single file or filtered recursive folder walk)
         if target_path.is_file():
             add_file_to_payload(target_path)
+        elif files is not None:
+            for file_path in files:
+                add_file_to_payload(Path(file_path))
         else:
-            for root, _, filenames in os.walk(target_path):
-                for filename in filenames:
-                    add_file_to_payload(Path(root) / filename)
+            skipped = payload['batch_metadata']['skipped']
+            skipped['rules'] = rules.source
+            for file_path in self._select_files(target_path, rules, skipped):
+                add_file_to_payload(file_path)
 
-        safe_print(f"Created batch payload with {payload['batch_metadata']['total_files']} files from {source_label}")
+        if own_validation:
+            validation.save()
+        skipped = payload['batch_metadata']['skipped']
+        skipped_count = sum(value for key, value in skipped.items() if key not in ('rules', 'invalid', 'bytes', 'too_old'))
+        notes = []
+        if skipped_count:
+            notes.append(f"{skipped_count} skipped by send rules")
+        if skipped['too_old']:
+            # Logged on its own: an age limit silently drops late-collected files
+            notes.append(f"{skipped['too_old']} older than max_age_days skipped")
+        rejected = payload['batch_metadata']['rejected']
+        if rejected:
+            flagged = sum(1 for entry in rejected if entry['sent'])
+            notes.append(f"{len(rejected) - flagged} invalid skipped" if not flagged else f"{flagged} invalid flagged")
+        if own_validation and (validation.checked or validation.hits):
+            notes.append(f"validated {validation.checked}, {validation.hits} cached")
+        note = f" ({', '.join(notes)})" if notes else ""
+        safe_print(f"Created batch payload with {payload['batch_metadata']['total_files']} files from {source_label}{note}")
         return payload
     
+    def _select_files(self, folder: Path, rules: SendRules, skipped: Dict[str, Any]) -> List[Path]:
+        """
+        Walk a folder and return the files the send rules allow, counting the rest in skipped.
+        Excluded folders are not descended into; per-extension quotas keep the newest files.
+        """
+        now = time.time()
+        candidates = []
+        for root, dirnames, filenames in os.walk(folder):
+            relative_root = os.path.relpath(root, folder).replace('\\', '/')
+            prefix = '' if relative_root == '.' else relative_root + '/'
+            kept_dirs = []
+            for dirname in dirnames:
+                if rules.prune_dir(prefix + dirname):
+                    # Count what the pruned folder holds without checking each file
+                    for sub_root, _, sub_files in os.walk(os.path.join(root, dirname)):
+                        for sub_file in sub_files:
+                            skipped['excluded'] += 1
+                            try:
+                                skipped['bytes'] += os.path.getsize(os.path.join(sub_root, sub_file))
+                            except OSError:
+                                pass
+                else:
+                    kept_dirs.append(dirname)
+            dirnames[:] = kept_dirs
+            
+            for filename in filenames:
+                file_path = Path(root) / filename
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                reason = rules.check(prefix + filename, stat.st_size, stat.st_mtime, now)
+                if reason:
+                    skipped[reason] += 1
+                    skipped['bytes'] += stat.st_size
+                else:
+                    candidates.append((file_path, stat))
+        
+        # Apply per-extension quotas, newest first
+        counts: Dict[str, int] = {}
+        selected = []
+        for file_path, stat in sorted(candidates, key=lambda item: -item[1].st_mtime):
+            extension = file_path.suffix.lower()
+            limit = rules.extension_quotas.get(extension)
+            if limit is not None and counts.get(extension, 0) >= limit:
+                skipped['over_quota'] += 1
+                skipped['bytes'] += stat.st_size
+                continue
+            counts[extension] = counts.get(extension, 0) + 1
+            selected.append(file_path)
+        return sorted(selected)
+    
     def _get_content_type(self, extension: str) -> str:
         """Get MIME content type for file extension - supports any extension"""
         # Common MIME types for better handling
@@ -480,25 +1313,50 @@ class HealthMetricSender:
         # Return known type or generic binary for any unknown extension
         return content_types.get(extension.lower(), 'application/octet-stream')
     
-    def send_batch_from_folder(self, folder_path: str, batch_name: Optional[str] = None) -> bool:
+    def send_batch_from_folder(self, folder_path: str, batch_name: Optional[str] = None,
+                               files: Optional[List[Path]] = None, user_name: Optional[str] = None) -> bool:
         """
         Send a batch payload built from a folder (recursively) or a single file
         
         Args:
             folder_path: Path to the folder containing files
             batch_name: Optional name for the batch
+            files: Optional explicit files inside the folder (see create_batch_payload)
+            user_name: User whose data is sent (default: the user running the sender)
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
             # Create batch payload
-            payload = self.create_batch_payload(folder_path)
+            payload = self.create_batch_payload(folder_path, files=files)
             
             if payload['batch_metadata']['total_files'] == 0:
-                safe_print("No files found to send")
+                rejected = len(payload['batch_metadata']['rejected'])
+                safe_print(f"No valid files to send ({rejected} failed validation)" if rejected else "No files found to send")
                 return False
             
+            return self.send_batch_payload(payload, folder_path, batch_name, user_name)
+            
+        except Exception as e:
+            safe_print(f"Error sending batch from folder: {str(e)}", logging.ERROR)
+            return False
+    
+    def send_batch_payload(self, payload: Dict[str, Any], folder_path: str, batch_name: Optional[str] = None,
+                           user_name: Optional[str] = None) -> bool:
+        """
+        Send a batch payload built by create_batch_payload
+        
+        Args:
+            payload: Batch payload
+            folder_path: Folder (or file) the payload was built from
+            batch_name: Optional name for the batch
+            user_name: User whose data is sent (default: the user running the sender)
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
             # Generate job and raw filename
             if not batch_name:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -513,7 +1371,8 @@ class HealthMetricSender:
                 data=payload,
                 filename=raw_filename,
                 job_name=job_name,
-                source_label=str(folder_path)
+                source_label=str(folder_path),
+                user_name=user_name
             )
 
             if success:
@@ -521,7 +1380,7 @@ class HealthMetricSender:
             return success
             
         except Exception as e:
-            safe_print(f"Error sending batch from folder: {str(e)}")
+            safe_print(f"Error sending batch: {str(e)}", logging.ERROR)
             return False
     
     def find_revit_slave_data_folder(self) -> Optional[str]:
@@ -537,42 +1396,424 @@ class HealthMetricSender:
         safe_print(f"Not found: {path}")
         return None
     
+    @staticmethod
+    def _has_sendable_file(folder_path: str, rules: SendRules) -> bool:
+        """
+        Return True as soon as the folder (recursively) contains one file the send rules allow.
+        Excluded folders are not descended into; nothing is read or validated.
+        """
+        now = time.time()
+        for root, dirnames, filenames in os.walk(folder_path):
+            relative_root = os.path.relpath(root, folder_path).replace('\\', '/')
+            prefix = '' if relative_root == '.' else relative_root + '/'
+            dirnames[:] = [name for name in dirnames if not rules.prune_dir(prefix + name)]
+            for filename in filenames:
+                try:
+                    stat = os.stat(os.path.join(root, filename))
+                except OSError:
+                    continue
+                if (rules.check(prefix + filename, stat.st_size, stat.st_mtime, now) is None
+                        and rules.extension_quotas.get(os.path.splitext(filename)[1].lower()) != 0):
+                    return True
+        return False
+    
+    def find_revit_slave_data_folders(self) -> List[Tuple[str, str]]:
+        """
+        Find every RevitSlaveData folder this run sends: the current user's folder plus the
+        canonical folder of every other user under USERS_ROOT that this account can read
+        (shared render/automation boxes). No other locations are searched.
+        
+        Returns:
+            [(user name, folder path)] for existing folders, current user first
+        """
+        candidates = [(self.user_name, self.default_source_folder)]
+        try:
+            user_dirs = sorted(entry.name for entry in os.scandir(USERS_ROOT) if entry.is_dir())
+        except OSError:
+            user_dirs = []
+        candidates += [(name, os.path.join(USERS_ROOT, name, SOURCE_FOLDER_SUFFIX)) for name in user_dirs]
+        
+        folders, seen = [], set()
+        for user, folder in candidates:
+            key = os.path.normcase(os.path.realpath(folder))
+            if key in seen:
+                continue
+            seen.add(key)
+            try:
+                if os.path.isdir(folder):
+                    folders.append((user, folder))
+            except OSError:
+                continue
+        safe_print(f"Found {len(folders)} RevitSlaveData folder(s): {', '.join(f'{u} ({f})' for u, f in folders) or 'none'}")
+        return folders
+    
     def send_revit_slave_data(self) -> bool:
         """
-        Send all files from the RevitSlaveData folder
+        Send all files from every RevitSlaveData folder found, one batch (job) per folder.
+        The jobs share one GitHub connection and API rate budget; payloads are built in a
+        small scan pool while earlier ones are being sent.
         
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if every folder with something to send was sent (folders with nothing
+                  to send count as done), False otherwise
         """
         try:
-            # Find the RevitSlaveData folder
-            folder_path = self.find_revit_slave_data_folder()
+            self.rate_budget.refill()
+            roots = self.find_revit_slave_data_folders()
             
-            if not folder_path:
+            if not roots:
                 safe_print("RevitSlaveData folder not found")
                 return False
             
-            # Generate batch name with timestamp and computer name (for uniqueness and traceability)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            # Sanitize computer name (remove special chars)
-            safe_computer = ''.join(c if c.isalnum() or c in '-_' else '_' for c in self.computer_name)
-            batch_name = f"revit_slave_{timestamp}_{safe_computer}"
+            # Decide before reading any file or connecting to GitHub: the send rules are
+            # applied first, so a folder holding only excluded or too-old files is idle
+            rules = SendRules.load()
+            roots = [(user, folder) for user, folder in roots if self._has_sendable_file(folder, rules)]
+            if not roots:
+                safe_print("Nothing to send")
+                return True
             
-            safe_print(f"Sending RevitSlaveData as batch: {batch_name}")
-            return self.send_batch_from_folder(folder_path, batch_name)
+            validation = ValidationCache()
+            workers = min(SCAN_WORKERS, len(roots))
+            queue = list(reversed(roots))
+            in_flight = []
+            sent = 0
+            idle = 0
+            # Several jobs: upload each payload as a blob as soon as it is built, one commit for all
+            single_commit = self.upload_mode != 'contents' and len(roots) > 1
+            staged = []
+            blob_pool = ThreadPoolExecutor(max_workers=BLOB_WORKERS) if single_commit else None
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                def submit_next() -> None:
+                    if queue:
+                        user, folder = queue.pop()
+                        in_flight.append((user, folder, pool.submit(self.create_batch_payload, folder, rules=rules,
+                                                                  validation=validation)))
+                
+                # At most workers + 1 payloads are held in memory at once
+                for _ in range(workers):
+                    submit_next()
+                while in_flight:
+                    user, folder, future = in_flight.pop(0)
+                    submit_next()
+                    try:
+                        payload = future.result()
+                    except Exception as e:
+                        safe_print(f"Error scanning {folder}: {str(e)}", logging.ERROR)
+                        continue
+                    
+                    if payload['batch_metadata']['total_files'] == 0:
+                        # Every candidate failed validation: nothing to send is not a failure
+                        safe_print(f"No valid files to send from {folder}")
+                        idle += 1
+                        continue
+                    batch_name = self._make_batch_name(user)
+                    content_sha = payload_content_sha(payload)
+                    existing = self._uploaded_payload_path(content_sha) if single_commit else None
+                    if existing:
+                        # Uploaded by an earlier run and not processed yet: trigger on it again
+                        safe_print(f"Skipped upload of {user}: identical payload already at {existing}")
+                        staged.append({
+                            'job_name': batch_name,
+                            'raw_filename': existing.rsplit('/', 1)[-1],
+                            'folder': folder,
+                            'user': user,
+                            'sizes': declared_sizes(payload),
+                            'blob': None
+                        })
+                    elif single_commit:
+                        if self.rate_budget.acquire(f"blob {batch_name}"):
+                            safe_print(f"Uploading RevitSlaveData of {user} as batch: {batch_name}")
+                            content = json_io.dumpb(payload)
+                            staged.append({
+                                'job_name': batch_name,
+                                'raw_filename': f"{batch_name}.json",
+                                'folder': folder,
+                                'user': user,
+                                'sizes': declared_sizes(payload),
+                                'content_sha': content_sha,
+                                'blob': blob_pool.submit(self.git_data.create_blob, content)
+                            })
+                            del content
+                    else:
+                        safe_print(f"Sending RevitSlaveData of {user} as batch: {batch_name}")
+                        if self.send_batch_payload(payload, folder, batch_name, user):
+                            sent += 1
+                    del payload
+            if single_commit:
+                sent = self._commit_staged_jobs(staged)
+                blob_pool.shutdown()
+            validation.save()
+            
+            idle_note = f"{idle} with nothing valid to send, " if idle else ""
+            safe_print(f"Sent {sent}/{len(roots) - idle} RevitSlaveData folder(s) "
+                       f"({idle_note}{self.rate_budget.calls} API write calls, "
+                       f"validated {validation.checked} file(s), {validation.hits} cached)")
+            return sent + idle == len(roots)
             
         except Exception as e:
-            safe_print(f"Error sending RevitSlaveData: {str(e)}")
+            safe_print(f"Error sending RevitSlaveData: {str(e)}", logging.ERROR)
             return False
     
+    def _commit_staged_jobs(self, staged: List[Dict[str, Any]]) -> int:
+        """
+        Commit the payload blobs of several jobs in one commit (Git Data API), then trigger
+        the workflow for each job. Jobs without a blob (payload already uploaded) are only triggered.
+        
+        Args:
+            staged: Jobs with job_name, raw_filename, folder, user, sizes, content_sha and a blob future
+            
+        Returns:
+            int: Number of jobs sent and triggered
+        """
+        entries = {}
+        for job in staged:
+            if job['blob'] is None:
+                continue
+            try:
+                entries[f"_temp_storage/{job['raw_filename']}"] = job['blob'].result()
+            except Exception as e:
+                safe_print(f"Error uploading batch {job['job_name']}: {str(e)}", logging.ERROR)
+        committed = {}
+        if entries and self.rate_budget.acquire(f"commit of {len(entries)} batches", 3):
+            try:
+                commit_sha = self.git_data.commit_blobs(
+                    entries, f"$$$ Add new data: {len(entries)} batches from {self.computer_name}", self.branch
+                )
+                safe_print(f"Committed {len(entries)} batches in one commit {commit_sha[:7]} on branch {self.branch}")
+                committed = entries
+            except Exception as e:
+                safe_print(f"Error committing {len(entries)} batches: {str(e)}", logging.ERROR)
+        for job in staged:
+            path = f"_temp_storage/{job['raw_filename']}"
+            if path in committed:
+                self._remember_remote_sha(path, committed[path], job['content_sha'])
+        
+        if committed:
+            # Small delay to ensure GitHub propagates the commit before workflows start
+            safe_print("Waiting for GitHub to propagate commit...")
+            time.sleep(3)
+        sent = 0
+        for job in staged:
+            if job['blob'] is not None and f"_temp_storage/{job['raw_filename']}" not in committed:
+                continue
+            if self.trigger_workflow_dispatch(job['job_name'], job['raw_filename'], str(job['folder']), job['user'],
+                                              job['sizes']):
+                safe_print(f"Successfully sent batch '{job['job_name']}' with {job['sizes']['total_files']} files")
+                sent += 1
+        return sent
+    
+    def _make_batch_name(self, user_name: Optional[str] = None) -> str:
+        """Batch name with timestamp and computer name (for uniqueness and traceability)"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        # Sanitize computer name (remove special chars)
+        safe_computer = ''.join(c if c.isalnum() or c in '-_' else '_' for c in self.computer_name)
+        batch_name = f"revit_slave_{timestamp}_{safe_computer}"
+        # Other users' folders on a shared box: add the user so jobs stay traceable
+        if user_name and user_name != self.user_name:
+            batch_name += '_' + ''.join(c if c.isalnum() or c in '-_' else '_' for c in user_name)
+        return batch_name
+    
+    # =========================================================================
+    # AGENT MODE
+    # =========================================================================
+    
+    @staticmethod
+    def _agent_state_path() -> str:
+        """Sent-file state next to the executable (HEALTHMETRIC_AGENT_STATE overrides)."""
+        return _sender_data_path(AGENT_STATE_FILENAME, 'HEALTHMETRIC_AGENT_STATE')
+    
+    def _load_agent_state(self) -> Dict[str, Dict[str, Tuple[int, int]]]:
+        """Signatures of files already sent, per watched folder ({} if none or unreadable)."""
+        try:
+            state = json_io.load(self._agent_state_path())
+        except (OSError, ValueError):
+            return {}
+        if 'folders' in state:
+            folders = state['folders']
+        elif state.get('folder'):
+            # State written before the agent watched several folders
+            folders = {state['folder']: state.get('sent', {})}
+        else:
+            return {}
+        return {folder: {path: tuple(signature) for path, signature in sent.items()}
+                for folder, sent in folders.items()}
+    
+    def _save_agent_state(self, sent_by_folder: Dict[str, Dict[str, Tuple[int, int]]]) -> None:
+        """Write the sent-file state atomically (a crash never leaves a half-written file)."""
+        state_path = self._agent_state_path()
+        temp_path = state_path + '.tmp'
+        try:
+            json_io.dump({'updated_at': datetime.now().isoformat(), 'folders': sent_by_folder}, temp_path)
+            os.replace(temp_path, state_path)
+        except OSError as e:
+            safe_print(f"Could not save agent state: {str(e)}", logging.ERROR)
+    
+    def run_agent(self, poll_seconds: float = AGENT_POLL_SECONDS,
+                  debounce_seconds: float = AGENT_DEBOUNCE_SECONDS,
+                  max_delay_seconds: float = AGENT_MAX_DELAY_SECONDS,
+                  full_rescan_seconds: float = AGENT_FULL_RESCAN_SECONDS,
+                  batch_files: int = AGENT_BATCH_FILES,
+                  max_polls: Optional[int] = None) -> int:
+        """
+        Stay resident and send new or modified files in small incremental batches.
+        
+        Every RevitSlaveData folder a send pass would use (find_revit_slave_data_folders) is
+        watched; the folder list is refreshed on each full rescan, so users who appear later
+        are picked up. Files are found by one FolderWatcher per folder (directory mtime
+        polling, send rules applied) and compared with the sent-file state, so restarts do
+        not resend anything. A changed file waits until it has been unchanged for
+        debounce_seconds and no other file in its folder changed for as long (a Revit job
+        still writing output), or until max_delay_seconds have passed. At most one batch of
+        batch_files files is sent per folder and poll; polls are jittered so many senders
+        spread their uploads instead of hitting the API together.
+        
+        Args:
+            poll_seconds: Time between polls
+            debounce_seconds: Quiet period before changed files are sent
+            max_delay_seconds: Longest a ready file waits for the folder to go quiet
+            full_rescan_seconds: Interval for re-listing every folder
+            batch_files: Max files per batch
+            max_polls: Stop after this many polls (None: run until interrupted)
+            
+        Returns:
+            int: Exit code (0 when stopped)
+        """
+        rules = SendRules.load()
+        sent_by_folder = self._load_agent_state()
+        roots: Dict[str, Dict[str, Any]] = {}  # folder -> watcher, user and per-folder send state
+        last_full = 0.0
+        polls = 0
+        
+        def watch(user: str, folder_path: str) -> None:
+            if folder_path in roots:
+                return
+            roots[folder_path] = {
+                'user': user,
+                'watcher': FolderWatcher(folder_path, rules),
+                'sent': sent_by_folder.setdefault(folder_path, {}),
+                'pending': {},        # path -> [signature, first seen, last change]
+                'last_activity': 0.0,
+                'retry_at': 0.0,
+                'backoff': poll_seconds,
+                'failed': None        # ((paths, signatures), batch name, payload) of the last failed send
+            }
+            safe_print(f"Agent mode: watching {folder_path} for {user} "
+                       f"({len(roots[folder_path]['sent'])} files already sent)")
+        
+        for user, folder_path in self.find_revit_slave_data_folders():
+            watch(user, folder_path)
+        if not roots:
+            # Nothing exists yet: keep watching the current user's folder until it appears
+            watch(self.user_name, self.default_source_folder)
+        safe_print(f"Agent mode: {len(roots)} folder(s) every ~{poll_seconds:g}s "
+                   f"(debounce {debounce_seconds:g}s, rules: {rules.source})")
+        
+        try:
+            # Random start offset: scheduled senders starting together drift apart
+            time.sleep(random.uniform(0, poll_seconds))
+            while max_polls is None or polls < max_polls:
+                polls += 1
+                now = time.time()
+                # The write cap is per poll: a resident agent must not run out of it for good
+                self.rate_budget.refill()
+                full = now - last_full >= full_rescan_seconds
+                if full:
+                    last_full = now
+                    if polls > 1:
+                        for user, folder_path in self.find_revit_slave_data_folders():
+                            watch(user, folder_path)
+                
+                for folder_path, root in roots.items():
+                    if os.path.isdir(folder_path):
+                        self._agent_poll_root(folder_path, root, rules, sent_by_folder, now, full,
+                                              poll_seconds, debounce_seconds, max_delay_seconds, batch_files)
+                
+                if max_polls is None or polls < max_polls:
+                    time.sleep(poll_seconds * random.uniform(0.8, 1.2))
+        except KeyboardInterrupt:
+            safe_print("Agent stopped")
+        return 0
+    
+    def _agent_poll_root(self, folder_path: str, root: Dict[str, Any], rules: SendRules,
+                         sent_by_folder: Dict[str, Dict[str, Tuple[int, int]]], now: float, full: bool,
+                         poll_seconds: float, debounce_seconds: float, max_delay_seconds: float,
+                         batch_files: int) -> None:
+        """One agent poll of one watched folder: detect changes, then send at most one batch (see run_agent)."""
+        sent, pending = root['sent'], root['pending']
+        for path, signature in root['watcher'].poll(full=full).items():
+            if sent.get(path) == signature:
+                continue
+            entry = pending.get(path)
+            if entry is None or entry[0] != signature:
+                pending[path] = [signature, entry[1] if entry else now, now]
+                root['last_activity'] = now
+        if full:
+            # Forget files that are gone (or now filtered out) so the state stays small
+            known = root['watcher'].files()
+            if any(path not in known for path in sent):
+                for path in [path for path in sent if path not in known]:
+                    del sent[path]
+                self._save_agent_state(sent_by_folder)
+        
+        # Re-stat pending files: in-place writes do not change the folder mtime
+        for path in list(pending):
+            try:
+                stat = os.stat(os.path.join(folder_path, path))
+            except OSError:
+                del pending[path]
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if signature != pending[path][0]:
+                pending[path][0] = signature
+                pending[path][2] = now
+                root['last_activity'] = now
+        
+        ready = sorted(path for path, (_, _, changed_at) in pending.items()
+                       if now - changed_at >= debounce_seconds)
+        quiet = now - root['last_activity'] >= debounce_seconds
+        overdue = any(now - pending[path][1] >= max_delay_seconds for path in ready)
+        if not (ready and (quiet or overdue) and now >= root['retry_at']):
+            return
+        
+        batch = ready[:batch_files]
+        safe_print(f"Agent: sending {len(batch)} changed file(s) of {root['user']} "
+                   f"({len(pending) - len(batch)} more pending)")
+        signatures = [pending[path][0] for path in batch]
+        failed = root['failed']
+        if failed is not None and failed[0] == (batch, signatures):
+            # Retry of a failed send: same name and payload, so an upload that
+            # did succeed is recognised by its blob SHA and not repeated
+            batch_name, payload = failed[1], failed[2]
+        else:
+            files = [Path(folder_path) / path for path in batch]
+            payload = self.create_batch_payload(folder_path, rules=rules, files=files)
+            batch_name = self._make_batch_name(root['user'])
+        # Nothing left after validation counts as done: rejected files are not retried until they change
+        if (payload['batch_metadata']['total_files'] == 0
+                or self.send_batch_payload(payload, folder_path, batch_name, root['user'])):
+            for path in batch:
+                sent[path] = pending.pop(path)[0]
+            self._save_agent_state(sent_by_folder)
+            root['backoff'] = poll_seconds
+            root['failed'] = None
+        else:
+            root['failed'] = ((batch, signatures), batch_name, payload)
+            root['retry_at'] = now + root['backoff']
+            safe_print(f"Agent: send failed for {root['user']}, retrying in {root['backoff']:g}s", logging.WARNING)
+            root['backoff'] = min(root['backoff'] * 2, AGENT_MAX_BACKOFF_SECONDS)
+    
 
 
 def main():
-    """Simple automated main function - no CLI arguments needed"""
+    """Simple automated main function - no CLI arguments needed (--agent stays resident, see run_agent)"""
     try:
         # Initialize sender with default settings
         sender = HealthMetricSender()
         
+        if '--agent' in sys.argv[1:]:
+            return sender.run_agent()
+        
         # Automatically send RevitSlaveData from default folder
         success = sender.send_revit_slave_data()
         
@@ -584,7 +1825,7 @@ def main():
             return 1
             
     except Exception as e:
-        safe_print(f"Error: {str(e)}")
+        safe_print(f"Error: {str(e)}", logging.ERROR)
         return 1
 
 